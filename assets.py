@@ -0,0 +1,446 @@
+"""
+Reader for the asset pack built by res/build_assets.py.
+
+All images live in one file, assets.pak, that starts with an index of every
+image's name, offset, size, width, height, format and CRC-32. AssetPack
+keeps that file open and seeks to an image to draw it, so screens do not
+open files or hardcode image sizes.
+
+Smaller variants of an image are scaled down offline with an
+area-averaging filter and stored as <name>_<size>. find() picks the variant
+for the size the screen needs, so drawing an icon small costs no pixel math
+and no extra reads.
+
+IconCache keeps recently drawn images in a preallocated pool in RAM in
+front of an AssetPack, so screens that redraw the same icons, such as
+mode_select, do not read them from flash again or allocate to draw them.
+"""
+
+import gc
+import ustruct as struct
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
+try:
+    from binascii import crc32
+except ImportError:
+    crc32 = None
+
+mem_free = getattr(gc, "mem_free", None)
+
+# Pack header and index entries, see res/build_assets.py
+_PACK_MAGIC = b"APK1"
+_PACK_VERSION = 1
+_PACK_HEADER = ">4sBH"
+_PACK_ENTRY = ">16sIIHHBI"
+
+
+class AssetPack:
+    """
+    Images of an asset pack, drawn with GC9A01.blit_rle.
+
+    Args:
+        path (str): name of the asset pack file
+        verify (bool): check the CRC-32 of every image when opening the
+            pack, optional, needs binascii.crc32
+    """
+
+    def __init__(self, path, verify=False):
+        self._file = open(path, "rb")
+        magic, version, count = struct.unpack(
+            _PACK_HEADER, self._file.read(struct.calcsize(_PACK_HEADER)))
+        if magic != _PACK_MAGIC or version != _PACK_VERSION:
+            self._file.close()
+            raise ValueError("Unsupported asset pack: " + path)
+
+        entry_size = struct.calcsize(_PACK_ENTRY)
+        index = self._file.read(entry_size * count)
+        end = self._file.seek(0, 2)
+        self._index = {}
+        for n in range(count):
+            name, offset, size, width, height, fmt, crc = struct.unpack_from(
+                _PACK_ENTRY, index, n * entry_size)
+            name = name.rstrip(b"\0").decode()
+            if offset + size > end:
+                self._file.close()
+                raise ValueError("Asset %s is truncated in %s" % (name, path))
+            self._index[name] = (offset, size, width, height, fmt, crc)
+
+        if verify:
+            for name in self._index:
+                if not self.verify(name):
+                    self._file.close()
+                    raise ValueError("Asset %s is corrupt in %s" % (name, path))
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def names(self):
+        """Return the names of the images in the pack."""
+        return list(self._index)
+
+    def find(self, name, size=None):
+        """
+        Return the name of the variant of image name scaled to fit in
+        size x size pixels, or name when there is no such variant.
+
+        Args:
+            name (str): image name, such as "low"
+            size (int): largest width and height wanted, optional
+        """
+        if size is not None:
+            variant = "%s_%d" % (name, size)
+            if variant in self._index:
+                return variant
+        return name
+
+    def size(self, name):
+        """Return (width, height) of an image."""
+        entry = self._entry(name)
+        return entry[2], entry[3]
+
+    def verify(self, name):
+        """
+        Return True when the CRC-32 of an image matches the index, or when
+        the port has no binascii.crc32.
+        """
+        if crc32 is None:
+            return True
+
+        offset, size, _, _, _, expected = self._entry(name)
+        self._file.seek(offset)
+        crc = 0
+        buffer = bytearray(512)
+        view = memoryview(buffer)
+        while size:
+            read = self._file.readinto(view[:min(size, len(buffer))])
+            if not read:
+                return False
+            crc = crc32(view[:read], crc)
+            size -= read
+        return crc & 0xffffffff == expected
+
+    def data_size(self, name):
+        """Return the number of bytes of the compressed data of an image."""
+        return self._entry(name)[1]
+
+    def read(self, name):
+        """
+        Return the compressed data of an image, as read by
+        GC9A01.blit_rle.
+
+        Raises:
+            ValueError: the image is truncated
+        """
+        offset, size, _, _, _, _ = self._entry(name)
+        self._file.seek(offset)
+        data = self._file.read(size)
+        if len(data) != size:
+            raise ValueError("Asset %s is truncated" % name)
+        return data
+
+    def read_into(self, name, buffer):
+        """
+        Read the compressed data of an image into the start of buffer
+        without allocating.
+
+        Args:
+            name (str): image name
+            buffer (memoryview): writable buffer of at least data_size(name)
+                bytes
+
+        Returns:
+            int: number of bytes read
+
+        Raises:
+            ValueError: the image is truncated or does not fit in buffer
+        """
+        offset, size, _, _, _, _ = self._entry(name)
+        if size > len(buffer):
+            raise ValueError("Asset %s does not fit in the buffer" % name)
+        self._file.seek(offset)
+        done = 0
+        while done < size:
+            read = self._file.readinto(buffer[done:size])
+            if not read:
+                raise ValueError("Asset %s is truncated" % name)
+            done += read
+        return size
+
+    def blit(self, display, name, x, y):
+        """
+        Draw an image with its top left corner at x, y.
+
+        Returns:
+            tuple: (width, height) of the image
+
+        Raises:
+            ValueError: the image does not match its index entry
+        """
+        offset, _, width, height, _, _ = self._entry(name)
+        self._file.seek(offset)
+        if display.blit_rle(self._file, x, y) != (width, height):
+            raise ValueError("Asset %s does not match the index" % name)
+        return width, height
+
+    def blit_centered(self, display, name, dy=0):
+        """
+        Draw an image centered on the display, moved down by dy rows.
+
+        Returns:
+            tuple: (x, y, width, height) of the drawn image
+        """
+        width, height = self.size(name)
+        x = (display.width - width) // 2
+        y = (display.height - height) // 2 + dy
+        self.blit(display, name, x, y)
+        return x, y, width, height
+
+    def close(self):
+        """Close the asset pack file."""
+        self._file.close()
+
+    def _entry(self, name):
+        try:
+            return self._index[name]
+        except KeyError:
+            raise ValueError("No asset named " + name) from None
+
+
+class IconCache:
+    """
+    Least recently used cache of the compressed images of an AssetPack,
+    keyed by image name. Drawing a cached image decodes it from RAM instead
+    of reading the pack.
+
+    Images are read into one pool of budget bytes allocated up front, and
+    drawn from it through a reader that hands out views of the pool, so a
+    miss or a hit allocates no image sized buffers. When an image does not
+    fit next to the others, the least recently used ones are evicted and
+    the rest are moved down to make room.
+
+    Every get() and blit() checks gc.mem_free() first. While it is below
+    min_free the whole pool is released, since dropping single images from
+    it frees no heap, and images are drawn straight from the pack until
+    there is room for the pool above min_free again.
+
+    Args:
+        pack (AssetPack): images to cache
+        budget (int): size in bytes of the pool of cached images
+        min_free (int): free heap in bytes below which the pool is
+            released, ignored on ports without gc.mem_free
+    """
+
+    def __init__(self, pack, budget=32 * 1024, min_free=16 * 1024):
+        self.pack = pack
+        self.budget = budget
+        self.min_free = min_free
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.drops = 0
+        self._images = OrderedDict()
+        self._top = 0
+        self._pool = None
+        self._reader = _ViewReader()
+        self._allocate()
+
+    def __contains__(self, name):
+        return name in self.pack
+
+    def find(self, name, size=None):
+        """Return the name of a variant of an image, see AssetPack.find."""
+        return self.pack.find(name, size)
+
+    def size(self, name):
+        """Return (width, height) of an image."""
+        return self.pack.size(name)
+
+    def get(self, name):
+        """
+        Return the compressed data of an image from the pool, reading it
+        from the pack into the pool on a miss, and mark it as the most
+        recently used.
+
+        Returns:
+            memoryview: the data, valid until the next get, or None when the
+            image is larger than the pool or the pool is released
+        """
+        self.trim()
+        entry = self._images.pop(name, None)
+        if entry is not None:
+            self._images[name] = entry
+            self.hits += 1
+            offset, size = entry
+            return self._pool[offset:offset + size]
+
+        self.misses += 1
+        if self._pool is None and not self._allocate():
+            return None
+        size = self.pack.data_size(name)
+        offset = self._reserve(size)
+        if offset is None:
+            return None
+
+        data = self._pool[offset:offset + size]
+        self.pack.read_into(name, data)
+        self._images[name] = (offset, size)
+        self.used += size
+        self._top = offset + size
+        return data
+
+    def trim(self):
+        """
+        Release the pool when gc.mem_free() is below min_free.
+
+        Returns:
+            int: number of images dropped
+        """
+        if self._pool is None or not self._low_memory():
+            return 0
+
+        dropped = len(self._images)
+        self.clear()
+        self._pool = None
+        self._reader.close()
+        gc.collect()
+        self.drops += dropped
+        return dropped
+
+    def blit(self, display, name, x, y):
+        """
+        Draw an image with its top left corner at x, y.
+
+        Returns:
+            tuple: (width, height) of the image
+
+        Raises:
+            ValueError: the image does not match its index entry
+        """
+        data = self.get(name)
+        if data is None:
+            return self.pack.blit(display, name, x, y)
+
+        width, height = self.pack.size(name)
+        if display.blit_rle(self._reader.open(data), x, y) != (width, height):
+            raise ValueError("Asset %s does not match the index" % name)
+        return width, height
+
+    def blit_centered(self, display, name, dy=0):
+        """
+        Draw an image centered on the display, moved down by dy rows.
+
+        Returns:
+            tuple: (x, y, width, height) of the drawn image
+        """
+        width, height = self.size(name)
+        x = (display.width - width) // 2
+        y = (display.height - height) // 2 + dy
+        self.blit(display, name, x, y)
+        return x, y, width, height
+
+    def clear(self):
+        """Drop all cached images, keeping the pool and the statistics."""
+        self._images = OrderedDict()
+        self.used = 0
+        self._top = 0
+
+    def stats(self):
+        """
+        Return a dict with the number of images, bytes used, budget, bytes
+        allocated for the pool, hits, misses, evictions and images dropped
+        for low memory.
+        """
+        return {
+            'images': len(self._images),
+            'used': self.used,
+            'budget': self.budget,
+            'pool': 0 if self._pool is None else len(self._pool),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'drops': self.drops}
+
+    def _low_memory(self):
+        return mem_free is not None and mem_free() < self.min_free
+
+    def _allocate(self):
+        """Allocate the pool when it leaves min_free bytes of heap free."""
+        if mem_free is not None:
+            gc.collect()
+            if mem_free() < self.min_free + self.budget:
+                return False
+        self._pool = memoryview(bytearray(self.budget))
+        return True
+
+    def _reserve(self, size):
+        """Return the offset of size free bytes of the pool, or None."""
+        if size > self.budget:
+            return None
+
+        while self.used + size > self.budget:
+            oldest = next(iter(self._images))
+            self.used -= self._images.pop(oldest)[1]
+            self.evictions += 1
+
+        if self._top + size > self.budget:
+            self._compact()
+        return self._top
+
+    def _compact(self):
+        """Move the cached images down to the start of the pool."""
+        pool = self._pool
+        top = 0
+        for name, (offset, size) in sorted(
+                self._images.items(), key=lambda item: item[1][0]):
+            if offset != top:
+                # Copy in steps no longer than the gap, so source and
+                # destination of each step never overlap
+                src, dst, left = offset, top, size
+                while left:
+                    step = min(left, src - dst)
+                    pool[dst:dst + step] = pool[src:src + step]
+                    src += step
+                    dst += step
+                    left -= step
+                self._images[name] = (top, size)
+            top += size
+        self._top = top
+
+
+class _ViewReader:
+    """
+    File-like reader over a memoryview for GC9A01.blit_rle, handing out
+    views instead of copies.
+    """
+
+    def __init__(self):
+        self._view = None
+        self._pos = 0
+
+    def open(self, view):
+        """Start reading view from its first byte and return self."""
+        self._view = view
+        self._pos = 0
+        return self
+
+    def close(self):
+        """Let go of the view."""
+        self._view = None
+
+    def read(self, size):
+        """Return a view of the next size bytes, fewer at the end."""
+        start = self._pos
+        self._pos = min(start + size, len(self._view))
+        return self._view[start:self._pos]
+
+    def readinto(self, buffer):
+        """Copy the next bytes into buffer and return how many."""
+        count = min(len(buffer), len(self._view) - self._pos)
+        buffer[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
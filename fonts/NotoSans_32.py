@@ -1,474 +1,177 @@
 # -*- coding: utf-8 -*-
 # Converted from NotoSans-Regular.ttf using:
-#     ./font2bitmap.py NotoSans-Regular.ttf 32 -c 0x20-0x7f
+#     font2bitmap.py NotoSans-Regular.ttf 32 -c 0x20-0x7f -o NotoSans_32.py -b NotoSans_32.fnt --scan ../main.py ../bootbu.py --freetype 2.13.2
 
-MAP = " !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~"
+MAP = " !%-.0123456789:AFHMORTUdeilorstu"
 BPP = 1
-HEIGHT = 34
-MAX_WIDTH = 30
+HEIGHT = 33
+MAX_WIDTH = 29
 _WIDTHS = \
-    b'\x08\x09\x0d\x15\x12\x1b\x17\x07\x0a\x0a\x12\x12\x09\x0a\x09\x0c'\
-    b'\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x09\x09\x12\x12\x12\x0e'\
-    b'\x1d\x14\x15\x14\x17\x12\x11\x17\x18\x0b\x0c\x14\x11\x1d\x18\x19'\
-    b'\x13\x19\x14\x12\x12\x17\x13\x1e\x13\x12\x12\x0b\x0c\x0b\x12\x0e'\
-    b'\x09\x12\x14\x0f\x14\x12\x0c\x14\x14\x08\x0a\x11\x08\x1e\x14\x13'\
-    b'\x14\x14\x0d\x0f\x0c\x14\x10\x19\x11\x10\x0f\x0c\x12\x0c\x12\x13'
+    b'\x08\x09\x1b\x0a\x09\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x09'\
+    b'\x14\x11\x18\x1d\x19\x14\x12\x17\x14\x12\x08\x08\x13\x0d\x0f\x0c'\
+    b'\x14'
 
 OFFSET_WIDTH = 2
 _OFFSETS = \
-    b'\x00\x00\x01\x10\x02\x42\x03\xfc\x06\xc6\x09\x2a\x0c\xc0\x0f\xce'\
-    b'\x10\xbc\x12\x10\x13\x64\x15\xc8\x18\x2c\x19\x5e\x1a\xb2\x1b\xe4'\
-    b'\x1d\x7c\x1f\xe0\x22\x44\x24\xa8\x27\x0c\x29\x70\x2b\xd4\x2e\x38'\
-    b'\x30\x9c\x33\x00\x35\x64\x36\x96\x37\xc8\x3a\x2c\x3c\x90\x3e\xf4'\
-    b'\x40\xd0\x44\xaa\x47\x52\x4a\x1c\x4c\xc4\x4f\xd2\x52\x36\x54\x78'\
-    b'\x57\x86\x5a\xb6\x5c\x2c\x5d\xc4\x60\x6c\x62\xae\x66\x88\x69\xb8'\
-    b'\x6d\x0a\x6f\x90\x72\xe2\x75\x8a\x77\xee\x7a\x52\x7d\x60\x7f\xe6'\
-    b'\x83\xe2\x86\x68\x88\xcc\x8b\x30\x8c\xa6\x8e\x3e\x8f\xb4\x92\x18'\
-    b'\x93\xf4\x95\x26\x97\x8a\x9a\x32\x9c\x30\x9e\xd8\xa1\x3c\xa2\xd4'\
-    b'\xa5\x7c\xa8\x24\xa9\x34\xaa\x88\xac\xca\xad\xda\xb1\xd6\xb4\x7e'\
-    b'\xb7\x04\xb9\xac\xbc\x54\xbe\x0e\xc0\x0c\xc1\xa4\xc4\x4c\xc6\x6c'\
-    b'\xc9\xbe\xcc\x00\xce\x20\xd0\x1e\xd1\xb6\xd4\x1a\xd5\xb2\xd8\x16'
+    b'\x00\x00\x01\x08\x02\x31\x05\xac\x06\xf6\x08\x1f\x0a\x71\x0c\xc3'\
+    b'\x0f\x15\x11\x67\x13\xb9\x16\x0b\x18\x5d\x1a\xaf\x1d\x01\x1f\x53'\
+    b'\x20\x7c\x23\x10\x25\x41\x28\x59\x2c\x16\x2f\x4f\x31\xe3\x34\x35'\
+    b'\x37\x2c\x39\xc0\x3c\x12\x3d\x1a\x3e\x22\x40\x95\x42\x42\x44\x31'\
+    b'\x45\xbd'
 
 _BITMAPS =\
     b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
     b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x07\x03\x81\xc0\xe0\x70\x38\x1c\x0e\x07\x03\x81'\
-    b'\xc0\xc0\x60\x30\x18\x0c\x06\x00\x00\x00\x00\x70\x78\x3c\x0e\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x8e\x1c\x70\xe3'\
-    b'\x87\x1c\x38\xe1\xc7\x06\x38\x31\x81\x84\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x03\x06\x00\x18\x30\x01\xc3\x80\x0e\x18\x00'\
-    b'\x60\xc0\x03\x06\x00\x18\x30\x00\xc1\x80\xff\xff\xc7\xff\xfe\x03'\
-    b'\x06\x00\x18\x30\x00\xc1\x80\x06\x1c\x00\x70\xc0\x3f\xff\xf1\xff'\
-    b'\xff\x80\xc1\x80\x06\x1c\x00\x70\xe0\x03\x86\x00\x18\x30\x00\xc1'\
-    b'\x80\x06\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\x30\x00'\
-    b'\x0c\x00\x1f\xf0\x0f\xff\x07\xff\x83\x8c\x20\xe3\x00\x38\xc0\x0e'\
-    b'\x30\x03\xcc\x00\x7f\x00\x0f\xe0\x00\xff\x00\x0f\xe0\x03\x3c\x00'\
-    b'\xc7\x00\x30\xe0\x0c\x30\x03\x1c\x30\xcf\x0f\xff\x83\xff\x80\x03'\
-    b'\x00\x00\xc0\x00\x30\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x38\x03'\
-    b'\xf8\x06\x00\xf7\x01\xc0\x1c\x70\x30\x03\x0e\x0c\x00\x60\xc3\x80'\
-    b'\x0c\x18\x60\x01\x83\x1c\x00\x30\x63\x00\x06\x0c\xe7\x80\xc3\x99'\
-    b'\xf8\x1c\x77\x7b\x83\xdc\xce\x30\x3f\xb9\x87\x03\xc6\x30\x60\x01'\
-    b'\xc6\x0c\x00\x30\xc1\x80\x0e\x18\x30\x01\x83\x06\x00\x70\x61\xc0'\
-    b'\x0c\x0e\x38\x03\x81\xee\x00\x60\x1f\xc0\x18\x01\xe0\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xc0'\
-    b'\x00\x3f\xe0\x00\xfb\xe0\x01\xc1\xc0\x03\x83\x80\x07\x07\x00\x0e'\
-    b'\x0e\x00\x1c\x1c\x00\x1c\xf0\x00\x1f\xc0\x00\x3f\x00\x00\xfc\x00'\
-    b'\x03\xfc\x07\x0f\x3c\x0e\x3c\x3c\x38\x70\x3c\x70\xe0\x3d\xc1\xc0'\
-    b'\x3f\x83\x80\x3e\x07\x00\x3c\x0f\x01\xfc\x0f\x9f\xbc\x0f\xfe\x3c'\
-    b'\x07\xf0\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x87\x0e\x1c\x38'\
-    b'\x70\x60\xc1\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x81\xc0\xe0\x38\x1c'\
-    b'\x07\x03\x80\xe0\x38\x0e\x03\x01\xc0\x70\x1c\x07\x01\xc0\x70\x1c'\
-    b'\x03\x00\xe0\x38\x0e\x01\xc0\x70\x1c\x03\x80\xe0\x1e\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x07\x00\xe0\x18\x07\x01\xc0\x38\x0e\x01\x80\x70'\
-    b'\x1c\x07\x01\xc0\x70\x1c\x07\x01\xc0\x70\x1c\x07\x01\xc0\x70\x38'\
-    b'\x0e\x03\x81\xc0\x70\x38\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x07'\
-    b'\x00\x01\xc0\x00\x70\x00\x0c\x00\x03\x00\x38\xc7\x1f\xff\xc7\xff'\
-    b'\xf0\x07\x80\x03\xe0\x01\xdc\x00\x73\x80\x38\xf0\x1e\x1c\x01\x04'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00'\
-    b'\x0c\x00\x03\x00\x00\xc0\x0f\xff\xe3\xff\xf8\x03\x00\x00\xc0\x00'\
-    b'\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x03'\
-    b'\x83\xc1\xc0\xe0\x60\x30\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'\
-    b'\xfe\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c'\
-    b'\x1e\x0f\x03\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x07\x00\xe0\x0e\x00\xc0\x1c\x01\xc0\x18\x03\x80\x38\x07\x00\x70'\
-    b'\x07\x00\xe0\x0e\x00\xc0\x1c\x01\xc0\x18\x03\x80\x38\x03\x00\x70'\
-    b'\x07\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x03\xf0\x01\xfe\x00\xf3\xc0\x70\x38\x1c\x07\x0e'\
-    b'\x01\xc3\x80\x70\xe0\x0c\x38\x03\x8c\x00\xe3\x00\x38\xc0\x0e\x30'\
-    b'\x03\x8c\x00\xe3\x00\x38\xe0\x0e\x38\x03\x0e\x01\xc3\x80\x70\x70'\
-    b'\x1c\x1c\x0e\x03\xcf\x80\x7f\xc0\x0f\xc0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x0e\x00\x07\x80\x03\xe0\x01\xd8\x00\xe6\x00\x71\x80\x08\x60'\
-    b'\x00\x18\x00\x06\x00\x01\x80\x00\x60\x00\x18\x00\x06\x00\x01\x80'\
-    b'\x00\x60\x00\x18\x00\x06\x00\x01\x80\x00\x60\x00\x18\x00\x06\x00'\
-    b'\x01\x80\x00\x60\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xf0\x03'\
-    b'\xff\x03\xf7\xe0\xe0\x38\x10\x0e\x00\x01\xc0\x00\x70\x00\x1c\x00'\
-    b'\x06\x00\x03\x80\x00\xe0\x00\x70\x00\x38\x00\x1e\x00\x0f\x00\x07'\
-    b'\x80\x01\xc0\x00\xe0\x00\x70\x00\x38\x00\x1c\x00\x0e\x00\x03\xff'\
-    b'\xf8\xff\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x7f\xf0\x3e\x7e'\
-    b'\x0e\x03\x80\x00\x70\x00\x1c\x00\x07\x00\x01\xc0\x00\xe0\x00\x78'\
-    b'\x00\xfc\x01\xf8\x00\x7f\xc0\x00\x78\x00\x07\x00\x01\xc0\x00\x70'\
-    b'\x00\x1c\x00\x07\x00\x01\xc4\x00\xf1\xf9\xf8\x7f\xfc\x07\xfc\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x0f\x00\x03\xc0\x01\xf0\x00'\
-    b'\xec\x00\x33\x00\x1c\xc0\x0e\x30\x03\x0c\x01\xc3\x00\xe0\xc0\x30'\
-    b'\x30\x1c\x0c\x0e\x03\x03\x00\xc1\xc0\x30\x7f\xff\xdf\xff\xf7\xff'\
-    b'\xfc\x00\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x01\xff\xe0\x7f\xf8\x1c\x00\x07\x00\x01\xc0\x00\x70\x00'\
-    b'\x1c\x00\x06\x00\x01\x80\x00\x7f\xc0\x1f\xfc\x07\x9f\x80\x00\xf0'\
-    b'\x00\x1c\x00\x07\x00\x00\xc0\x00\x30\x00\x1c\x00\x07\x00\x01\xc2'\
-    b'\x00\xe0\xf9\xf8\x3f\xf8\x03\xf8\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x7e\x00\xff\x80\x7e\x20\x3c\x00\x0e\x00\x07\x00\x01\xc0\x00\xe0'\
-    b'\x00\x38\x00\x0e\x7e\x03\xbf\xe0\xfe\xfc\x3c\x07\x0e\x01\xc3\x80'\
-    b'\x38\xe0\x0e\x38\x03\x8e\x00\xe3\x80\x38\x70\x1c\x1e\x07\x03\xef'\
-    b'\x80\x7f\xc0\x07\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xf9\xff\xfe'\
-    b'\x00\x03\x80\x01\xc0\x00\x70\x00\x38\x00\x0e\x00\x03\x00\x01\xc0'\
-    b'\x00\x70\x00\x38\x00\x0e\x00\x07\x00\x01\xc0\x00\xe0\x00\x38\x00'\
-    b'\x0e\x00\x07\x00\x01\xc0\x00\xe0\x00\x38\x00\x1e\x00\x07\x00\x03'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x03\xf0\x03\xff\x01\xf3\xe0\x70'\
-    b'\x3c\x38\x07\x0e\x01\xc3\x80\x70\x60\x1c\x1c\x0e\x03\xc7\x00\x7f'\
-    b'\x80\x0f\xc0\x07\xf8\x07\x8f\x81\xc0\xf0\xe0\x1c\x30\x03\x8c\x00'\
-    b'\xe3\x00\x38\xe0\x1c\x38\x07\x07\xcf\x80\xff\xc0\x0f\xe0\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x3f\x00\x3f\xe0\x1f\x3c\x07\x03\x83\x80\x70'\
-    b'\xe0\x1c\x30\x03\x0c\x00\xc3\x00\x38\xe0\x0e\x38\x07\x8f\x03\xe1'\
-    b'\xf3\xb8\x3f\xcc\x07\xe3\x00\x01\xc0\x00\x70\x00\x1c\x00\x0e\x00'\
-    b'\x03\x80\x03\xc0\x67\xe0\x1f\xf0\x07\xf0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x01\xc1\xe0\xf0\x38\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x07\x07\x83\xc0\xe0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x70\x78\x3c\x0e'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xc1\xe0\xe0\x70'\
-    b'\x38\x18\x1c\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x07\x80\x07\xc0'\
-    b'\x07\xc0\x07\x80\x07\x80\x07\x80\x03\x80\x00\xf0\x00\x0f\x80\x00'\
-    b'\xf8\x00\x0f\xc0\x00\xfc\x00\x07\x80\x00\x60\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\x0f\xff'\
-    b'\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xfc\x3f\xff'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\xc0\x00\x3c\x00\x07\xc0\x00\x7c\x00\x07\xc0\x00\x7c\x00'\
-    b'\x07\xc0\x00\x78\x00\x3e\x00\x7e\x00\x7c\x00\x7c\x00\xfc\x00\x3c'\
-    b'\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x1f\xc3\xff\x87\xdf\x10\x0e\x00\x38\x00\xe0\x03\x80\x0e'\
-    b'\x00\x78\x03\xc0\x1e\x00\xf0\x03\x80\x1c\x00\x60\x03\x80\x0e\x00'\
-    b'\x00\x00\x00\x00\x00\x0e\x00\x3c\x00\xf0\x03\x80\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x03\xf8\x00\x00\xff\xf0\x00\x1f\xcf\xe0\x01\xe0\x07\x80'\
-    b'\x1c\x00\x0e\x01\xc0\x00\x30\x0c\x00\x01\xc0\xe0\x7f\x86\x06\x0f'\
-    b'\xfc\x38\x30\xf0\xe1\xc3\x87\x07\x06\x18\x30\x38\x30\xc3\x81\xc1'\
-    b'\x86\x1c\x0e\x0c\x30\xe0\x70\xe1\x87\x03\x86\x0c\x18\x3c\x30\x60'\
-    b'\xe1\xe3\x83\x87\xfb\xf8\x0c\x1f\x8f\x80\x70\x00\x00\x03\x80\x00'\
-    b'\x00\x0e\x00\x00\x00\x3c\x00\x40\x00\xfc\x7e\x00\x03\xff\xf0\x00'\
-    b'\x03\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x00\x03\xc0\x00'\
-    b'\x3c\x00\x03\xe0\x00\x76\x00\x07\x70\x00\xe7\x00\x0e\x30\x00\xe3'\
-    b'\x80\x1c\x38\x01\xc1\x80\x1c\x1c\x03\x81\xc0\x38\x0e\x03\xff\xe0'\
-    b'\x7f\xfe\x07\xff\xf0\xe0\x07\x0e\x00\x70\xe0\x03\x9c\x00\x39\xc0'\
-    b'\x01\x98\x00\x1f\x80\x01\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'\
-    b'\xff\xc0\x0f\xff\x80\x70\x7e\x03\x80\x78\x1c\x01\xc0\xe0\x0e\x07'\
-    b'\x00\x70\x38\x03\x81\xc0\x1c\x0e\x01\xc0\x70\x7c\x03\xff\x80\x1f'\
-    b'\xff\x00\xe0\x1e\x07\x00\x70\x38\x01\xc1\xc0\x0e\x0e\x00\x70\x70'\
-    b'\x03\x83\x80\x3c\x1c\x01\xc0\xe0\x7e\x07\xff\xe0\x3f\xfc\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xf8\x01\xff\xe0\x3f\x3e'\
-    b'\x07\x80\x40\xf0\x00\x1e\x00\x01\xc0\x00\x1c\x00\x03\x80\x00\x38'\
-    b'\x00\x03\x80\x00\x38\x00\x03\x80\x00\x38\x00\x03\x80\x00\x38\x00'\
-    b'\x03\xc0\x00\x1c\x00\x01\xe0\x00\x0e\x00\x00\xf8\x00\x07\xf3\xc0'\
-    b'\x1f\xfc\x00\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff'\
-    b'\x00\x0f\xff\x80\x1c\x1f\xc0\x38\x03\xc0\x70\x03\xc0\xe0\x03\x81'\
-    b'\xc0\x07\x83\x80\x07\x07\x00\x0e\x0e\x00\x1c\x1c\x00\x38\x38\x00'\
-    b'\x70\x70\x00\xe0\xe0\x01\xc1\xc0\x03\x83\x80\x07\x07\x00\x0e\x0e'\
-    b'\x00\x38\x1c\x00\x70\x38\x01\xc0\x70\x0f\x80\xe0\xfe\x01\xff\xf0'\
-    b'\x03\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f'\
-    b'\xfc\x1f\xff\x07\x00\x01\xc0\x00\x70\x00\x1c\x00\x07\x00\x01\xc0'\
-    b'\x00\x70\x00\x1c\x00\x07\x00\x01\xff\xe0\x7f\xf8\x1c\x00\x07\x00'\
-    b'\x01\xc0\x00\x70\x00\x1c\x00\x07\x00\x01\xc0\x00\x70\x00\x1c\x00'\
-    b'\x07\xff\xc1\xff\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\x0f\xff\x87'\
-    b'\x00\x03\x80\x01\xc0\x00\xe0\x00\x70\x00\x38\x00\x1c\x00\x0e\x00'\
-    b'\x07\x00\x03\x80\x01\xff\xe0\xff\xf0\x70\x00\x38\x00\x1c\x00\x0e'\
-    b'\x00\x07\x00\x03\x80\x01\xc0\x00\xe0\x00\x70\x00\x38\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\xff\x00\x0f\xff\xc0\x3f\x3f\x00\xf0\x02'\
-    b'\x03\xc0\x00\x0f\x00\x00\x1c\x00\x00\x38\x00\x00\xe0\x00\x01\xc0'\
-    b'\x00\x03\x80\x00\x07\x00\x00\x0e\x01\xfe\x1c\x03\xfc\x38\x00\x38'\
-    b'\x70\x00\x70\x70\x00\xe0\xe0\x01\xc1\xe0\x03\x81\xe0\x07\x01\xe0'\
-    b'\x0e\x03\xfc\xfc\x01\xff\xf8\x00\xff\x80\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0'\
-    b'\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70'\
-    b'\x00\xe0\x70\x00\xe0\x70\x00\xe0\x7f\xff\xe0\x7f\xff\xe0\x70\x00'\
-    b'\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0'\
-    b'\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x70\x00\xe0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xfc\xff\x83\x80\x70\x0e'\
-    b'\x01\xc0\x38\x07\x00\xe0\x1c\x03\x80\x70\x0e\x01\xc0\x38\x07\x00'\
-    b'\xe0\x1c\x03\x80\x70\x0e\x01\xc1\xff\x3f\xe0\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x38\x03\x80\x38\x03\x80\x38'\
-    b'\x03\x80\x38\x03\x80\x38\x03\x80\x38\x03\x80\x38\x03\x80\x38\x03'\
-    b'\x80\x38\x03\x80\x38\x03\x80\x38\x03\x80\x38\x03\x80\x38\x07\x00'\
-    b'\x70\xfe\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xc0\x0e'\
-    b'\x1c\x01\xc1\xc0\x38\x1c\x07\x01\xc0\xf0\x1c\x1e\x01\xc1\xc0\x1c'\
-    b'\x38\x01\xc7\x00\x1c\xe0\x01\xdc\x00\x1f\xe0\x01\xff\x00\x1e\x70'\
-    b'\x01\xc3\x80\x1c\x3c\x01\xc1\xe0\x1c\x0e\x01\xc0\x70\x1c\x07\x81'\
-    b'\xc0\x38\x1c\x01\xc1\xc0\x1e\x1c\x00\xf0\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x70\x00\x38\x00\x1c\x00\x0e\x00\x07\x00\x03\x80\x01\xc0'\
-    b'\x00\xe0\x00\x70\x00\x38\x00\x1c\x00\x0e\x00\x07\x00\x03\x80\x01'\
-    b'\xc0\x00\xe0\x00\x70\x00\x38\x00\x1c\x00\x0e\x00\x07\x00\x03\xff'\
-    b'\xe1\xff\xf0\xff\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x07'\
-    b'\xc0\xf8\x00\x3e\x07\xc0\x01\xf0\x3f\x00\x1f\x81\xf8\x00\xfc\x0e'\
-    b'\xc0\x06\xe0\x77\x00\x77\x03\xb8\x03\xb8\x1c\xc0\x19\xc0\xe7\x01'\
-    b'\xce\x07\x38\x0c\x70\x38\xc0\xe3\x81\xc7\x07\x1c\x0e\x38\x30\xe0'\
-    b'\x70\xe3\x87\x03\x87\x1c\x38\x1c\x38\xc1\xc0\xe0\xee\x0e\x07\x07'\
-    b'\x70\x70\x38\x1b\x03\x81\xc0\xf8\x1c\x0e\x07\x80\xe0\x70\x1c\x07'\
-    b'\x03\x80\xe0\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x1e\x00\x18\x1e\x00\x18\x1f\x00\x18'\
-    b'\x1f\x80\x18\x1f\x80\x18\x1f\xc0\x18\x1d\xe0\x18\x1c\xe0\x18\x1c'\
-    b'\xf0\x18\x1c\x78\x18\x1c\x38\x18\x1c\x3c\x18\x1c\x1e\x18\x1c\x1e'\
-    b'\x18\x1c\x0f\x18\x1c\x07\x18\x1c\x07\x98\x1c\x03\xd8\x1c\x03\xd8'\
-    b'\x1c\x01\xf8\x1c\x00\xf8\x1c\x00\xf8\x1c\x00\x78\x1c\x00\x38\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xc0'\
-    b'\x00\x3f\xf8\x00\x7e\x3f\x00\x78\x03\xc0\x38\x00\xe0\x38\x00\x38'\
-    b'\x1c\x00\x1c\x1e\x00\x0e\x0e\x00\x03\x87\x00\x01\xc3\x80\x00\xe1'\
-    b'\xc0\x00\x70\xe0\x00\x38\x70\x00\x1c\x38\x00\x0e\x1c\x00\x07\x0f'\
-    b'\x00\x07\x03\x80\x03\x81\xc0\x01\xc0\x70\x01\xc0\x3c\x01\xe0\x0f'\
-    b'\xc7\xe0\x01\xff\xc0\x00\x3f\x80\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x1f\xf8\x03\xff\xc0\x70\xfc\x0e\x03\xc1'\
-    b'\xc0\x38\x38\x07\x87\x00\x70\xe0\x0e\x1c\x01\xc3\x80\x70\x70\x0e'\
-    b'\x0e\x03\xc1\xc7\xf0\x3f\xfc\x07\xfc\x00\xe0\x00\x1c\x00\x03\x80'\
-    b'\x00\x70\x00\x0e\x00\x01\xc0\x00\x38\x00\x07\x00\x00\xe0\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xc0\x00\x3f\xf8\x00\x7e'\
-    b'\x3f\x00\x78\x03\xc0\x38\x00\xe0\x38\x00\x38\x1c\x00\x1c\x1e\x00'\
-    b'\x0e\x0e\x00\x03\x87\x00\x01\xc3\x80\x00\xe1\xc0\x00\x70\xe0\x00'\
-    b'\x38\x70\x00\x1c\x38\x00\x0e\x1c\x00\x07\x0f\x00\x07\x03\x80\x03'\
-    b'\x81\xc0\x01\xc0\x70\x01\xc0\x3c\x01\xe0\x0f\xc7\xe0\x01\xff\xc0'\
-    b'\x00\x3f\x80\x00\x00\xe0\x00\x00\x38\x00\x00\x1e\x00\x00\x07\x80'\
-    b'\x00\x01\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x07\xfe\x00\x7f\xf8\x07\x0f\xc0\x70\x1e\x07\x00\xe0\x70\x07'\
-    b'\x07\x00\x70\x70\x07\x07\x00\x70\x70\x0e\x07\x00\xe0\x70\x3c\x07'\
-    b'\xff\x80\x7f\xe0\x07\x07\x00\x70\x70\x07\x03\x80\x70\x38\x07\x01'\
-    b'\xc0\x70\x1e\x07\x00\xe0\x70\x07\x07\x00\x78\x70\x03\x80\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x0f\xe0\x0f\xff\x07\xcf\x83\xc0\x20\xe0'\
-    b'\x00\x38\x00\x0e\x00\x03\x80\x00\xf0\x00\x1e\x00\x03\xf0\x00\x7f'\
-    b'\x00\x07\xf0\x00\x7e\x00\x07\x80\x00\xf0\x00\x1c\x00\x07\x00\x01'\
-    b'\xc0\x00\x70\x80\x38\x3e\x7e\x0f\xfe\x01\xfe\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x3f\xff\xef\xff\xf8\x07\x00\x01\xc0\x00\x70\x00\x1c\x00'\
-    b'\x07\x00\x01\xc0\x00\x70\x00\x1c\x00\x07\x00\x01\xc0\x00\x70\x00'\
-    b'\x1c\x00\x07\x00\x01\xc0\x00\x70\x00\x1c\x00\x07\x00\x01\xc0\x00'\
-    b'\x70\x00\x1c\x00\x07\x00\x01\xc0\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x1c\x00\x30\x38\x00\x60\x70\x00\xc0\xe0\x01\x81\xc0\x03\x03\x80'\
-    b'\x06\x07\x00\x0c\x0e\x00\x18\x1c\x00\x30\x38\x00\x60\x70\x00\xc0'\
-    b'\xe0\x01\x81\xc0\x03\x03\x80\x06\x07\x00\x0c\x0e\x00\x18\x1c\x00'\
-    b'\x30\x38\x00\xe0\x70\x01\xc0\x70\x07\x80\xf0\x0e\x00\xfd\xf8\x00'\
-    b'\xff\xe0\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x03\x80\x03\xb8\x00\x77\x00\x1c\xe0\x03\x8e\x00\x71\xc0\x1c\x38'\
-    b'\x03\x83\x80\x70\x70\x1c\x0e\x03\x80\xe0\x70\x1c\x1c\x03\x83\x80'\
-    b'\x38\x70\x07\x1c\x00\xe3\x80\x0e\x70\x01\xdc\x00\x3b\x80\x03\x70'\
-    b'\x00\x7c\x00\x0f\x80\x00\xf0\x00\x1c\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x3c\x01\xc0\x0e\x70\x07\x80\x39\xc0\x1e\x00\xe7'\
-    b'\x00\xf8\x07\x0c\x03\xf0\x1c\x38\x0d\xc0\x70\xe0\x77\x01\xc3\x81'\
-    b'\xcc\x06\x06\x07\x38\x38\x1c\x18\xe0\xe0\x70\xe1\x83\x81\xc3\x87'\
-    b'\x0c\x03\x0e\x1c\x70\x0e\x30\x71\xc0\x39\xc0\xc7\x00\xe7\x03\x98'\
-    b'\x01\x98\x0e\xe0\x07\xe0\x1b\x80\x1f\x80\x6e\x00\x7e\x01\xf0\x00'\
-    b'\xf0\x07\xc0\x03\xc0\x0f\x00\x0f\x00\x3c\x00\x38\x00\xe0\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x70\x01\xc7\x00\x70\xe0\x0e\x0e\x03\x81\xc0\xe0\x1c\x1c\x01'\
-    b'\xc7\x00\x38\xc0\x03\xb8\x00\x7e\x00\x07\xc0\x00\x70\x00\x1f\x00'\
-    b'\x03\xe0\x00\xee\x00\x39\xc0\x07\x1c\x01\xc1\xc0\x70\x38\x0e\x03'\
-    b'\x83\x80\x78\x70\x07\x1c\x00\xf7\x00\x0f\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x0e\x00\x1d\xc0\x0e\x70\x03\x8e\x01\xc3\xc0\x70\x70\x38\x1e'\
-    b'\x0e\x03\x87\x00\xf3\xc0\x1c\xe0\x07\xf8\x00\xfc\x00\x3f\x00\x07'\
-    b'\x80\x01\xe0\x00\x38\x00\x0e\x00\x03\x80\x00\xe0\x00\x38\x00\x0e'\
-    b'\x00\x03\x80\x00\xe0\x00\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff'\
-    b'\x8f\xff\xe0\x00\x70\x00\x1c\x00\x0e\x00\x07\x80\x01\xc0\x00\xe0'\
-    b'\x00\x78\x00\x1c\x00\x0f\x00\x03\x80\x01\xc0\x00\xf0\x00\x38\x00'\
-    b'\x1c\x00\x07\x00\x03\x80\x01\xe0\x00\x70\x00\x38\x00\x1e\x00\x07'\
-    b'\xff\xf9\xff\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x0f\xe1\x80\x30\x06\x00'\
-    b'\xc0\x18\x03\x00\x60\x0c\x01\x80\x30\x06\x00\xc0\x18\x03\x00\x60'\
-    b'\x0c\x01\x80\x30\x06\x00\xc0\x18\x03\x00\x60\x0c\x01\x80\x3f\x87'\
-    b'\xf0\x00\x00\x00\x00\x00\x00\x03\x80\x1c\x01\xc0\x0c\x00\xe0\x0e'\
-    b'\x00\x60\x07\x00\x70\x03\x00\x38\x03\x80\x1c\x01\xc0\x1c\x00\xe0'\
-    b'\x0e\x00\x60\x07\x00\x70\x03\x00\x38\x03\x80\x1c\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xf0\xfe\x01\xc0\x38'\
-    b'\x07\x00\xe0\x1c\x03\x80\x70\x0e\x01\xc0\x38\x07\x00\xe0\x1c\x03'\
-    b'\x80\x70\x0e\x01\xc0\x38\x07\x00\xe0\x1c\x03\x80\x70\x0e\x01\xc3'\
-    b'\xf8\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\x70\x00'\
-    b'\x1e\x00\x0f\x80\x03\x70\x01\xcc\x00\x63\x80\x18\x60\x0e\x1c\x03'\
-    b'\x03\x01\xc0\xe0\x60\x18\x38\x07\x0c\x00\xc7\x00\x38\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x0f\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x81'\
-    b'\xc0\xf0\x38\x0e\x03\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x0f\xc0\x1f\xfc\x03\xcf\x80\x80\xe0'\
-    b'\x00\x38\x00\x06\x00\x01\x80\x3f\xe0\x7f\xf8\x3f\x86\x0e\x01\x83'\
-    b'\x80\x61\xc0\x38\x30\x0e\x0e\x07\x83\xef\x60\x7f\x98\x0f\xc6\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x70\x00\x07\x00\x00\x70\x00\x07\x00\x00\x70\x00'\
-    b'\x07\x00\x00\x70\x00\x07\x3f\x00\x67\xf8\x06\xf7\xc0\x78\x1e\x07'\
-    b'\x00\xe0\x70\x07\x07\x00\x70\x70\x07\x07\x00\x70\x70\x07\x07\x00'\
-    b'\x70\x70\x07\x07\x00\x70\x70\x0e\x07\x81\xe0\x6f\x7c\x06\xff\x80'\
-    b'\x63\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x7e\x03\xfe\x0f\xbc\x38\x00\x70\x01\xc0'\
-    b'\x03\x80\x07\x00\x0e\x00\x1c\x00\x38\x00\x70\x00\xe0\x01\xe0\x01'\
-    b'\xc0\x01\xf7\x81\xff\x00\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x38\x00\x03\x80\x00\x38'\
-    b'\x00\x03\x80\x00\x38\x00\x03\x80\x00\x38\x03\xf3\x80\xff\xb8\x1f'\
-    b'\xbf\x81\xc0\x78\x3c\x07\x83\x80\x38\x38\x03\x83\x80\x38\x38\x03'\
-    b'\x83\x80\x38\x38\x03\x83\x80\x38\x38\x03\x83\xc0\x78\x1c\x07\x81'\
-    b'\xfb\xf8\x0f\xfb\x80\x3f\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xf0\x01'\
-    b'\xff\x00\xfb\xe0\x70\x38\x18\x07\x0e\x01\xc3\x80\x70\xff\xfc\x3f'\
-    b'\xff\x0e\x00\x03\x80\x00\xe0\x00\x38\x00\x07\x00\x01\xe0\x10\x3f'\
-    b'\x7c\x07\xff\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xf0\x7f\x0e\x10\xe0\x0c'\
-    b'\x01\xc0\x1c\x03\xfe\xff\xe1\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01'\
-    b'\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3e'\
-    b'\x18\x07\xfb\x80\xfb\xf8\x1c\x07\x83\xc0\x78\x38\x03\x83\x80\x38'\
-    b'\x38\x03\x83\x80\x38\x38\x03\x83\x80\x38\x38\x03\x83\x80\x38\x3c'\
-    b'\x07\x81\xc0\x78\x0f\xbf\x80\xff\xb8\x03\xf3\x80\x00\x38\x00\x03'\
-    b'\x80\x00\x38\x00\x07\x81\x00\x70\x1f\x3f\x01\xff\xe0\x07\xf8\x00'\
-    b'\x00\x00\x1c\x00\x01\xc0\x00\x1c\x00\x01\xc0\x00\x1c\x00\x01\xc0'\
-    b'\x00\x1c\x00\x01\xcf\xc0\x1d\xff\x01\xbd\xf0\x1e\x07\x81\xc0\x38'\
-    b'\x1c\x03\x81\xc0\x38\x1c\x03\x81\xc0\x38\x1c\x03\x81\xc0\x38\x1c'\
-    b'\x03\x81\xc0\x38\x1c\x03\x81\xc0\x38\x1c\x03\x81\xc0\x38\x1c\x03'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x01\x81\xc3\xc1\x80\x00\x00\x01\xc1\xc1\xc1'\
-    b'\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc0\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x18\x07\x03\xc0\x60\x00\x00\x00'\
-    b'\x00\x70\x1c\x07\x01\xc0\x70\x1c\x07\x01\xc0\x70\x1c\x07\x01\xc0'\
-    b'\x70\x1c\x07\x01\xc0\x70\x1c\x07\x01\xc0\x70\x18\x0e\x27\x8f\xc3'\
-    b'\xe0\x00\x00\x0e\x00\x07\x00\x03\x80\x01\xc0\x00\xe0\x00\x70\x00'\
-    b'\x38\x00\x1c\x07\x0e\x07\x07\x07\x03\x87\x01\xc7\x00\xe7\x00\x67'\
-    b'\x00\x37\x80\x1b\xc0\x0f\xf0\x07\xb8\x03\x8e\x01\xc7\x80\xe1\xe0'\
-    b'\x70\x70\x38\x1c\x1c\x0f\x0e\x03\xc0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x07\x07\x07\x07\x07'\
-    b'\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07'\
-    b'\x07\x07\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x3e\x07\xc0\x19\xfe\x7f'\
-    b'\xc0\x6f\x7f\xcf\x81\xe0\x7c\x0e\x07\x01\xe0\x38\x1c\x03\x80\xe0'\
-    b'\x70\x0e\x01\x81\xc0\x30\x06\x07\x00\xc0\x18\x1c\x03\x00\x60\x70'\
-    b'\x0c\x01\x81\xc0\x30\x06\x07\x00\xc0\x18\x1c\x03\x00\x60\x70\x0c'\
-    b'\x01\x81\xc0\x30\x06\x07\x00\xc0\x18\x1c\x03\x00\x60\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x63'\
-    b'\xf0\x06\x7f\xc0\x6f\x7c\x07\x81\xe0\x70\x0e\x07\x00\xe0\x70\x0e'\
-    b'\x07\x00\xe0\x70\x0e\x07\x00\xe0\x70\x0e\x07\x00\xe0\x70\x0e\x07'\
-    b'\x00\xe0\x70\x0e\x07\x00\xe0\x70\x0e\x07\x00\xe0\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x07\xe0\x03\xfe\x00\xfb\xf0\x38\x0e\x07\x00\xe1\xc0'\
-    b'\x1c\x38\x03\x87\x00\x38\xe0\x07\x1c\x00\xe3\x80\x1c\x70\x07\x0e'\
-    b'\x00\xe0\xe0\x1c\x1c\x07\x01\xf7\xe0\x1f\xf0\x00\xfc\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x01\x8f\xc0\x19\xfe\x01\xbd\xf0\x1e\x07\x81\xc0'\
-    b'\x38\x1c\x03\xc1\xc0\x1c\x1c\x01\xc1\xc0\x1c\x1c\x01\xc1\xc0\x1c'\
-    b'\x1c\x01\xc1\xc0\x3c\x1c\x03\x81\xe0\x78\x1b\xdf\x01\x9f\xe0\x18'\
-    b'\xf8\x01\xc0\x00\x1c\x00\x01\xc0\x00\x1c\x00\x01\xc0\x00\x1c\x00'\
-    b'\x01\xc0\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\x18\x07\xfb\x80\xfb'\
-    b'\xf8\x1c\x07\x83\xc0\x78\x38\x03\x83\x80\x38\x38\x03\x83\x80\x38'\
-    b'\x38\x03\x83\x80\x38\x38\x03\x83\x80\x38\x3c\x07\x81\xc0\x78\x1f'\
-    b'\xbf\x80\xff\xb8\x03\xe3\x80\x00\x38\x00\x03\x80\x00\x38\x00\x03'\
-    b'\x80\x00\x38\x00\x03\x80\x00\x38\x00\x03\x80\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x01\x8f\x8c\xfc\x6f\x23\xe0\x1e\x00'\
-    b'\xe0\x07\x00\x38\x01\xc0\x0e\x00\x70\x03\x80\x1c\x00\xe0\x07\x00'\
-    b'\x38\x01\xc0\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x1f\xc0\xff\xe3\xe7\x87\x01\x0c\x00\x1c\x00\x3c\x00\x3e\x00'\
-    b'\x3f\x00\x1f\x80\x07\x80\x07\x80\x07\x00\x0e\x20\x1c\x79\xf0\xff'\
-    b'\xc0\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x0c\x01\xc0\x1c\x07\xfe\x7f'\
-    b'\xe1\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01'\
-    b'\xc0\x1c\x01\xc0\x1f\x20\xfe\x07\xe0\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x38\x18\x03\x81\x80\x38'\
-    b'\x18\x03\x81\x80\x38\x18\x03\x81\x80\x38\x18\x03\x81\x80\x38\x18'\
-    b'\x03\x81\x80\x38\x18\x03\x81\x80\x38\x1c\x07\x81\xc0\x78\x1f\x3f'\
-    b'\x80\xff\x98\x03\xe1\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x77\x00\x77\x00\xe7'\
-    b'\x00\xe3\x80\xe3\x81\xc3\x81\xc1\xc1\xc1\xc3\x81\xc3\x80\xe3\x00'\
-    b'\xe7\x00\x67\x00\x76\x00\x7e\x00\x3e\x00\x3c\x00\x3c\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x0e\x01\xc0\x3b\x80\xf0\x19\xc0\xf8\x1c'\
-    b'\xe0\x6c\x0e\x30\x36\x07\x1c\x3b\x83\x0e\x1d\xc3\x87\x0c\x61\xc1'\
-    b'\x86\x38\xe0\xe7\x1c\x60\x73\x86\x70\x39\x83\x38\x0d\xc1\xdc\x06'\
-    b'\xe0\xec\x03\xe0\x3e\x01\xf0\x1f\x00\x78\x0f\x00\x38\x03\x80\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x01\xc0\x1c\x70\x1c\x1c\x1c\x0e'\
-    b'\x0e\x03\x8e\x00\xee\x00\x77\x00\x1f\x00\x07\x00\x07\xc0\x03\xe0'\
-    b'\x03\xb8\x03\x8e\x01\xc7\x01\xc1\xc1\xc0\x70\xe0\x38\xe0\x0e\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\xe0\x07\x70\x07\x70\x0e\x70\x0e\x38\x0e\x38\x1c\x18\x1c\x1c\x1c'\
-    b'\x1c\x38\x0c\x38\x0e\x38\x0e\x70\x06\x70\x07\x60\x03\xe0\x03\xe0'\
-    b'\x03\xc0\x01\xc0\x01\xc0\x03\x80\x03\x80\x03\x80\x07\x00\x9e\x00'\
-    b'\xfe\x00\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x3f\xfc\x7f\xf8\x00\xe0\x01\xc0\x07\x00\x1c\x00\x38'\
-    b'\x00\xe0\x03\x80\x07\x00\x1c\x00\x70\x00\xe0\x03\x80\x0e\x00\x1c'\
-    b'\x00\x7f\xfc\xff\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x03\x80\xf8\x1f\x01\xc0\x1c\x01\xc0'\
-    b'\x1c\x01\xc0\x1c\x01\xc0\x1c\x03\x80\x78\x1f\x01\xe0\x0f\x80\x38'\
-    b'\x01\x80\x1c\x01\xc0\x1c\x01\xc0\x1c\x01\xc0\x1c\x01\xc0\x1f\x00'\
-    b'\xf8\x03\x80\x00\x00\x00\x00\x00\x00\x00\xc0\x00\x30\x00\x0c\x00'\
-    b'\x03\x00\x00\xc0\x00\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00'\
-    b'\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x0c\x00\x03\x00\x00\xc0\x00'\
-    b'\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x0c\x00\x03\x00\x00'\
-    b'\xc0\x00\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x0c\x00\x03'\
-    b'\x00\x00\xc0\x00\x00\x00\x1c\x01\xf0\x0f\x80\x38\x03\x80\x18\x01'\
-    b'\x80\x18\x01\x80\x18\x01\x80\x1c\x01\xe0\x0f\x80\x78\x0f\x01\xc0'\
-    b'\x18\x01\x80\x18\x01\x80\x18\x01\x80\x18\x03\x80\x38\x0f\x81\xf0'\
-    b'\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x01\xf8\x08\xff\xce\x30\xff\x08\x0f\x80\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfe\x07\xff\xc0\xc0'\
-    b'\x08\x18\x01\x03\x00\x20\x60\x04\x0c\x00\x81\x80\x10\x30\x02\x06'\
-    b'\x00\x40\xc0\x08\x18\x01\x03\x00\x20\x60\x04\x0c\x00\x81\x80\x10'\
-    b'\x30\x02\x06\x00\x40\xc0\x08\x18\x01\x03\x00\x20\x7f\xfc\x0f\xff'\
-    b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-    b'\x00\x00\x00\x00'
+    b'\x00\x00\x00\x07\x03\x81\xc0\xe0\x70\x38\x1c\x0e\x07\x03\x81\xc0'\
+    b'\xc0\x60\x30\x18\x0c\x06\x00\x00\x00\xc0\xf0\x78\x1c\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x70'\
+    b'\x07\xf0\x0c\x01\xc6\x03\x80\x30\xe0\x60\x06\x1c\x18\x00\xc1\x87'\
+    b'\x00\x18\x30\xc0\x03\x06\x38\x00\x60\xc6\x00\x0c\x39\xcf\x01\x87'\
+    b'\x33\xf8\x38\xce\xe7\x03\xf9\x98\x70\x3e\x63\x0e\x00\x1c\x60\xc0'\
+    b'\x03\x0c\x18\x00\xe1\x83\x00\x18\x30\x60\x07\x06\x0c\x00\xc0\xc3'\
+    b'\x80\x38\x1c\x60\x06\x01\xfc\x01\x80\x1f\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe7\xf9\xfe\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x03\x03\xc1\xe0\x70\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7e\x00\x7f\xe0\x1c\x3c\x0e'\
+    b'\x07\x03\x00\xe1\xc0\x38\x70\x0e\x1c\x01\x87\x00\x71\x80\x1c\x60'\
+    b'\x07\x18\x01\xc6\x00\x71\x80\x1c\x70\x07\x1c\x01\x87\x00\xe1\xc0'\
+    b'\x38\x30\x0e\x0e\x07\x01\xc3\xc0\x7f\xe0\x07\xf0\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x03\x00\x03\xc0\x01\xf0\x00\xec\x00\xf3\x00\x38\xc0'\
+    b'\x04\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x0c\x00\x03\x00'\
+    b'\x00\xc0\x00\x30\x00\x0c\x00\x03\x00\x00\xc0\x00\x30\x00\x0c\x00'\
+    b'\x03\x00\x00\xc0\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xe0\x0f'\
+    b'\xfe\x07\xc7\xc0\xc0\x70\x00\x0e\x00\x03\x80\x00\xe0\x00\x38\x00'\
+    b'\x1c\x00\x07\x00\x03\x80\x01\xe0\x00\x70\x00\x38\x00\x1c\x00\x0e'\
+    b'\x00\x07\x00\x03\x80\x01\xc0\x00\xe0\x00\x7f\xff\x1f\xff\xc7\xff'\
+    b'\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x03\xfc\x03\xff\x81\xe0\xf0\x20\x1c'\
+    b'\x00\x03\x80\x00\xe0\x00\x38\x00\x1c\x00\x07\x00\x07\x80\x3f\xc0'\
+    b'\x0f\xf0\x00\x7f\x00\x01\xe0\x00\x38\x00\x0e\x00\x01\x80\x00\xe0'\
+    b'\x00\x38\x80\x1e\x38\x0f\x0f\xff\x81\xff\xc0\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x03\x80\x01\xe0\x00\x78\x00\x36\x00\x1d\x80\x06\x60\x03'\
+    b'\x98\x01\xc6\x00\xe1\x80\x30\x60\x1c\x18\x0e\x06\x03\x01\x81\xc0'\
+    b'\x60\xe0\x18\x3f\xff\xef\xff\xfb\xff\xfe\x00\x18\x00\x06\x00\x01'\
+    b'\x80\x00\x60\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf0\x3f\xfc'\
+    b'\x0f\xff\x03\x80\x00\xe0\x00\x38\x00\x0e\x00\x03\x00\x00\xc0\x00'\
+    b'\x3f\xe0\x0f\xfe\x03\x8f\xc0\x00\x78\x00\x0e\x00\x03\x80\x00\x60'\
+    b'\x00\x18\x00\x0e\x00\x03\x84\x01\xe1\xc0\xf0\x7f\xf8\x0f\xf8\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x01\xfc\x01\xff\x00\xf8\x20\x78\x00\x1c'\
+    b'\x00\x0e\x00\x03\x00\x01\xc0\x00\x70\x00\x1c\xfe\x07\xff\xc1\xf0'\
+    b'\x78\x78\x0e\x1c\x01\xc7\x00\x71\xc0\x1c\x70\x07\x1c\x01\xc3\x00'\
+    b'\xe0\xe0\x38\x1e\x1c\x03\xff\x00\x7f\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x3f\xff\xcf\xff\xf3\xff\xfc\x00\x0e\x00\x03\x80\x01\xc0\x00\x70'\
+    b'\x00\x18\x00\x0e\x00\x03\x80\x01\xc0\x00\x70\x00\x38\x00\x0e\x00'\
+    b'\x07\x00\x01\xc0\x00\xe0\x00\x38\x00\x1c\x00\x07\x00\x01\xc0\x00'\
+    b'\xe0\x00\x78\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x7f\xe0\x3c'\
+    b'\x3c\x0e\x03\x87\x00\xe1\xc0\x38\x70\x0e\x0e\x03\x03\xc1\xc0\x7d'\
+    b'\xe0\x0f\xe0\x03\xfc\x01\xef\x80\xe0\xf0\x70\x0e\x1c\x01\x86\x00'\
+    b'\x71\x80\x1c\x70\x07\x1c\x03\x87\x81\xe0\xff\xf0\x0f\xf0\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x1f\x80\x1f\xf8\x0f\x1f\x07\x81\xc1\xc0\x38'\
+    b'\x70\x0e\x18\x01\x86\x00\x61\x80\x1c\x70\x0f\x1c\x03\xc3\x81\xf0'\
+    b'\xff\xdc\x1f\xe6\x00\x03\x80\x00\xe0\x00\x38\x00\x0c\x00\x07\x00'\
+    b'\x03\x80\x03\xe0\x3f\xe0\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x02\x07\x83\xc1\xe0\x60\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x18\x1e\x0f\x03\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x07\x00\x00\xf0\x00\x0f\x00\x00\xf8\x00\x1d'\
+    b'\x80\x01\xdc\x00\x39\xc0\x03\x8c\x00\x30\xe0\x07\x0e\x00\x70\x70'\
+    b'\x0e\x07\x00\xe0\x70\x0f\xff\x81\xff\xf8\x1f\xff\xc1\x80\x1c\x38'\
+    b'\x01\xc3\x80\x0e\x70\x00\xe7\x00\x0e\x70\x00\x7e\x00\x07\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x07\xff\xc3\xff\xe1\xff\xf0\xe0\x00\x70'\
+    b'\x00\x38\x00\x1c\x00\x0e\x00\x07\x00\x03\x80\x01\xc0\x00\xff\xf0'\
+    b'\x7f\xf8\x38\x00\x1c\x00\x0e\x00\x07\x00\x03\x80\x01\xc0\x00\xe0'\
+    b'\x00\x70\x00\x38\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00'\
+    b'\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c'\
+    b'\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0f\xff\xfc\x0f'\
+    b'\xff\xfc\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00'\
+    b'\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c\x0e\x00\x1c'\
+    b'\x0e\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x03\xc0\x00\x78\x1f\x00\x07\xc0\xf8\x00\x3e\x07\xe0\x03'\
+    b'\xf0\x3f\x00\x1f\x81\xd8\x00\xdc\x0e\xe0\x0e\xe0\x77\x00\x67\x03'\
+    b'\x9c\x07\x38\x1c\xe0\x39\xc0\xe7\x01\x8e\x07\x1c\x1c\x70\x38\xe0'\
+    b'\xe3\x81\xc3\x06\x1c\x0e\x1c\x70\xe0\x70\xe3\x07\x03\x83\xb8\x38'\
+    b'\x1c\x1d\xc1\xc0\xe0\xec\x0e\x07\x03\xe0\x70\x38\x1f\x03\x81\xc0'\
+    b'\x70\x1c\x0e\x03\x80\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80\x01\xff\xf0\x01'\
+    b'\xf8\xfc\x01\xe0\x0f\x00\xe0\x03\x80\xe0\x00\xe0\x70\x00\x70\x70'\
+    b'\x00\x3c\x38\x00\x0e\x1c\x00\x07\x0e\x00\x03\x87\x00\x01\xc3\x80'\
+    b'\x00\xe1\xc0\x00\x70\xe0\x00\x38\x70\x00\x1c\x1c\x00\x1c\x0e\x00'\
+    b'\x0e\x07\x80\x0e\x01\xe0\x0f\x00\x7c\x1f\x00\x1f\xff\x00\x03\xfe'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f'\
+    b'\xf0\x03\xff\xc0\x3f\xfe\x03\x80\xf0\x38\x07\x03\x80\x38\x38\x03'\
+    b'\x83\x80\x38\x38\x07\x83\x80\x70\x38\x0f\x03\xff\xe0\x3f\xf8\x03'\
+    b'\xff\x80\x38\x38\x03\x81\xc0\x38\x1c\x03\x80\xe0\x38\x0f\x03\x80'\
+    b'\x70\x38\x03\x83\x80\x3c\x38\x01\xc0\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x01\xff\xff\x7f\xff\xdf\xff\xf0\x0e\x00\x03\x80\x00\xe0\x00\x38'\
+    b'\x00\x0e\x00\x03\x80\x00\xe0\x00\x38\x00\x0e\x00\x03\x80\x00\xe0'\
+    b'\x00\x38\x00\x0e\x00\x03\x80\x00\xe0\x00\x38\x00\x0e\x00\x03\x80'\
+    b'\x00\xe0\x00\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x06\x07'\
+    b'\x00\x0c\x0e\x00\x18\x1c\x00\x30\x38\x00\x60\x70\x00\xc0\xe0\x01'\
+    b'\x81\xc0\x03\x03\x80\x06\x07\x00\x0c\x0e\x00\x18\x1c\x00\x30\x38'\
+    b'\x00\x60\x70\x00\xc0\xe0\x01\x81\xc0\x03\x03\x80\x0e\x07\x00\x1c'\
+    b'\x0f\x00\x38\x0e\x00\xe0\x0f\x87\xc0\x0f\xff\x00\x0f\xf8\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x38\x00\x03\x80'\
+    b'\x00\x38\x00\x03\x80\x00\x38\x00\x03\x80\x7f\xb8\x0f\xff\x81\xe0'\
+    b'\xf8\x1c\x07\x83\x80\x38\x38\x03\x83\x80\x38\x38\x03\x83\x80\x38'\
+    b'\x38\x03\x83\x80\x38\x38\x03\x83\x80\x38\x1c\x07\x81\xe0\xf8\x0f'\
+    b'\xfb\x80\x7f\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xf8\x03\xff\x01\xe0'\
+    b'\xe0\x70\x1c\x38\x07\x0e\x01\xc3\x80\x70\xff\xfc\x3f\xff\x0e\x00'\
+    b'\x03\x80\x00\xe0\x00\x38\x00\x07\x00\x00\xf0\x70\x3f\xfc\x03\xfe'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x02\x07\x0f\x06\x00\x00\x00\x07\x07\x07\x07\x07\x07'\
+    b'\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07'\
+    b'\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x7f\xf0\x1e\x0f\x03\x80'\
+    b'\xf0\xe0\x0e\x1c\x01\xc3\x80\x18\x70\x03\x8e\x00\x71\xc0\x0e\x38'\
+    b'\x01\x87\x00\x70\xe0\x0e\x0e\x03\xc0\xe0\xf0\x0f\xfc\x00\xfe\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\xc7\xc6\x7e\x37\x01\xe0\x0e\x00\x70\x03\x80\x1c\x00\xe0\x07\x00'\
+    b'\x38\x01\xc0\x0e\x00\x70\x03\x80\x1c\x00\xe0\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x03\xff\x0f\xfc\x38\x18\x60\x00\xc0'\
+    b'\x01\xc0\x03\xe0\x03\xf8\x01\xfc\x00\x7c\x00\x3c\x00\x38\x00\x70'\
+    b'\x00\xe3\x03\x87\xff\x0f\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x60\x0e'\
+    b'\x00\xe0\x3f\xf3\xff\x0e\x00\xe0\x0e\x00\xe0\x0e\x00\xe0\x0e\x00'\
+    b'\xe0\x0e\x00\xe0\x0e\x00\xe0\x0f\x00\x7f\x03\xf0\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x1c\x0c\x01'\
+    b'\xc0\xc0\x1c\x0c\x01\xc0\xc0\x1c\x0c\x01\xc0\xc0\x1c\x0c\x01\xc0'\
+    b'\xc0\x1c\x0c\x01\xc0\xc0\x1c\x0c\x01\xc0\xe0\x1c\x0e\x03\xc0\xf0'\
+    b'\x7c\x07\xff\xc0\x3f\x8c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+
+INDEX_FIRST = 48
+_INDEX = \
+    b'\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f'
+INDEX_SPARSE = {32: 0, 33: 1, 37: 2, 45: 3, 46: 4, 65: 16, 70: 17, 72: 18, 77: 19, 79: 20, 82: 21, 84: 22, 85: 23, 100: 24, 101: 25, 105: 26, 108: 27, 111: 28, 114: 29, 115: 30, 116: 31, 117: 32}
 
 WIDTHS = memoryview(_WIDTHS)
 OFFSETS = memoryview(_OFFSETS)
 BITMAPS = memoryview(_BITMAPS)
+INDEX = memoryview(_INDEX)
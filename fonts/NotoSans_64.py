@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 # Converted from NotoSans-Regular.ttf using:
-#     font2bitmap.py -width 64 -s 0123456789 NotoSans-Regular.ttf 64
+#     font2bitmap.py NotoSans-Regular.ttf 64 -width 64 -s 0123456789 -o NotoSans_64.py -b NotoSans_64.fnt --scan ../main.py --sprites NotoSans_64.spr --sprite-colors 0x0532,0xfcc0,0xf800 --freetype 2.13.2
 
 MAP = "0123456789"
 BPP = 1
@@ -152,6 +152,12 @@ _BITMAPS =\
     b'\xfe\x00\x01\x00\x7f\xe0\x00\x0f\xff\xfe\x00\x00\x7f\xff\xc0\x00'\
     b'\x03\xff\xf8\x00\x00\x1f\xff\x00\x00\x00\x1e\x00\x00\x00'
 
+INDEX_FIRST = 48
+_INDEX = \
+    b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09'
+INDEX_SPARSE = {}
+
 WIDTHS = memoryview(_WIDTHS)
 OFFSETS = memoryview(_OFFSETS)
-BITMAPS = memoryview(_BITMAPS)
\ No newline at end of file
+BITMAPS = memoryview(_BITMAPS)
+INDEX = memoryview(_INDEX)
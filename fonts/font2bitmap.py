@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-# Needs freetype-py>=1.0
+# Needs freetype-py>=1.0 and numpy
 
 # Font handling classes are from Dan Bader blog post on using freetype
 # http://dbader.org/blog/monochrome-font-rendering-with-freetype-and-python
@@ -39,11 +39,33 @@
 # THE SOFTWARE.
 
 
+import os
+import re
 import sys
+import ast
+import string
 import shlex
 import argparse
 import bisect
+import struct
+import contextlib
+import multiprocessing
 import freetype
+import numpy as np
+
+# Header of binary font files, see Font.write_binary
+BINARY_MAGIC = b'FNT1'
+BINARY_HEADER = '>4sBBBBHHI'
+
+# Header and formats of sprite sheet files, see sprite_sheet
+SPRITE_MAGIC = b'SPR1'
+SPRITE_HEADER = '>4sBBBBHHH'
+SPRITE_RAW = 0
+SPRITE_RLE = 1
+SPRITE_MAX_RUN = 128
+
+# Characters rendered per process pool task
+GLYPHS_PER_TASK = 16
 
 
 def to_int(str):
@@ -85,51 +107,392 @@ def wrap_longs(lst, items_per_line=16):
     return "    b'" + "'\\\n    b'".join(lines) + "'"
 
 
+def build_index(text):
+    """
+    Return (first, table, sparse) for looking characters of `text` up
+    without scanning it: table[ord(char) - first] is the index of the
+    characters in the longest run of consecutive code points, sparse maps
+    the code points of the other characters to their index. Table entries
+    are single bytes, so characters past index 254 always go to sparse.
+    """
+    indexes = {}
+    for index, char in enumerate(text):
+        indexes.setdefault(ord(char), index)
+
+    codes = sorted(code for code, index in indexes.items() if index < 255)
+    best_start, best_length, start = 0, 0, 0
+    for n in range(1, len(codes) + 1):
+        if n == len(codes) or codes[n] != codes[n - 1] + 1:
+            if n - start > best_length:
+                best_start, best_length = start, n - start
+            start = n
+
+    dense = codes[best_start:best_start + best_length]
+    first = dense[0] if dense else 0
+    table = [indexes[code] for code in dense]
+    sparse = {
+        code: index for code, index in indexes.items()
+        if not first <= code < first + len(table)}
+
+    return first, table, sparse
+
+
+# Characters each format spec presentation type can produce
+SPEC_CHARACTERS = {
+    'd': '-0123456789',
+    'n': '-0123456789',
+    'b': '-01',
+    'o': '-01234567',
+    'x': '-0123456789abcdef',
+    'X': '-0123456789ABCDEF',
+    'e': '-+.0123456789e',
+    'E': '-+.0123456789E',
+    'f': '-.0123456789',
+    'F': '-.0123456789',
+    'g': '-+.0123456789e',
+    'G': '-+.0123456789E',
+    '%': '-.0123456789%'}
+
+FORMAT_SPEC = re.compile(
+    r'(?:(.)?([<>=^]))?([-+ ])?z?#?(0)?(\d*)([,_])?(?:\.\d+)?(.)?$', re.S)
+
+# Calls whose result is a whole number
+INTEGER_CALLS = ('int', 'len', 'round')
+
+
+def spec_characters(spec, default=None):
+    """
+    Return the characters a value formatted with the format `spec` can
+    contain, or None when they cannot be known. `default` is used when the
+    spec has no presentation type.
+    """
+    match = FORMAT_SPEC.match(spec)
+    if match is None:
+        return None
+
+    fill, align, sign, zero, width, grouping, kind = match.groups()
+    chars = default if kind is None else SPEC_CHARACTERS.get(kind)
+    if chars is None:
+        return None
+
+    if width:
+        chars += fill or ('0' if zero else ' ')
+    return chars + (sign or '').strip('-') + (grouping or '')
+
+
+def pattern_characters(pattern):
+    """
+    Return (characters, unresolved) for a str.format pattern such as
+    "Filter: {:d}%", unresolved lists the fields of unknown content.
+    """
+    chars = ''
+    unresolved = []
+    for literal, field, spec, conversion in string.Formatter().parse(pattern):
+        chars += literal
+        if field is None:
+            continue
+
+        field_chars = None if conversion else spec_characters(spec or '')
+        if field_chars is None:
+            unresolved.append(f'{pattern!r} field {{{field}:{spec}}}')
+        else:
+            chars += field_chars
+
+    return chars, unresolved
+
+
+def font_aliases(tree, font_name):
+    """
+    Return the names a module binds to the font `font_name`, either by
+    importing it (from fonts import NotoSans_32 as font) or by loading a
+    file named after it (font = BinaryFont("fonts/NotoSans_32.fnt")).
+    """
+    aliases = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name.split('.')[-1] == font_name:
+                    aliases.add(alias.asname or alias.name)
+
+        elif isinstance(node, ast.Assign):
+            for const in ast.walk(node.value):
+                if (isinstance(const, ast.Constant)
+                        and isinstance(const.value, str)
+                        and os.path.splitext(os.path.basename(
+                            const.value))[0] == font_name):
+                    aliases.update(
+                        target.id for target in node.targets
+                        if isinstance(target, ast.Name))
+
+    return aliases
+
+
+def call_name(call):
+    """Return the name of a called function or method."""
+    func = call.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return func.id if isinstance(func, ast.Name) else None
+
+
+class SourceScanner(object):
+    """
+    Finds the characters a module draws with a font by following the
+    string arguments of calls that take the font, such as
+    write(font, "ATOMU", ...) or write_width(font, text), through
+    variables, f-strings and the parameters of helper functions.
+    """
+    def __init__(self, tree, aliases):
+        self.aliases = aliases
+        self.chars = set()
+        self.unresolved = []
+        self.calls = []
+        self.assigned = {}
+        self.sinks = set()
+        self._collect(tree, None)
+
+    def _collect(self, node, function):
+        """Record every call with its enclosing function, and assignments."""
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._collect(child, child)
+                continue
+
+            if isinstance(child, ast.Call):
+                self.calls.append((child, function))
+            elif isinstance(child, ast.Assign):
+                for target in child.targets:
+                    if isinstance(target, ast.Name):
+                        self.assigned.setdefault(
+                            target.id, []).append((child.value, function))
+            self._collect(child, function)
+
+    def scan(self):
+        """Return (characters, unresolved) for the module."""
+        for call, function in self.calls:
+            args = call.args
+            positions = [
+                n for n, arg in enumerate(args)
+                if isinstance(arg, ast.Name) and arg.id in self.aliases]
+            if not positions:
+                continue
+
+            if call_name(call) == 'DigitDisplay':
+                chars = [kw.value for kw in call.keywords if kw.arg == 'chars']
+                if chars:
+                    self.resolve(chars[0], function)
+                else:
+                    self.chars.update('0123456789')
+            elif positions[0] + 1 < len(args):
+                self.resolve(args[positions[0] + 1], function)
+
+        return self.chars, self.unresolved
+
+    def resolve(self, node, function, seen=()):
+        """Add the characters the string expression `node` can hold."""
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            self.chars.update(node.value)
+
+        elif isinstance(node, ast.JoinedStr):
+            for value in node.values:
+                if isinstance(value, ast.Constant):
+                    self.chars.update(value.value)
+                else:
+                    self.resolve_field(value, function)
+
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            self.resolve(node.left, function, seen)
+            self.resolve(node.right, function, seen)
+
+        elif isinstance(node, ast.IfExp):
+            self.resolve(node.body, function, seen)
+            self.resolve(node.orelse, function, seen)
+
+        elif isinstance(node, ast.Name) and node.id not in seen:
+            params = [] if function is None else [
+                arg.arg for arg in function.args.args]
+            if node.id in params:
+                self.add_sink(function.name, params.index(node.id))
+            elif node.id in self.assigned:
+                for value, scope in self.assigned[node.id]:
+                    self.resolve(value, scope, seen + (node.id,))
+            else:
+                self.unresolved.append(f'line {node.lineno}: {node.id}')
+
+        else:
+            self.unresolved.append(
+                f'line {node.lineno}: {ast.unparse(node)}')
+
+    def resolve_field(self, value, function):
+        """Add the characters of an f-string replacement field."""
+        spec = ''
+        if value.format_spec is not None:
+            spec = ''.join(
+                part.value for part in value.format_spec.values
+                if isinstance(part, ast.Constant))
+
+        whole = (
+            isinstance(value.value, ast.Call)
+            and call_name(value.value) in INTEGER_CALLS)
+        chars = None
+        if value.conversion == -1:
+            chars = spec_characters(spec, '-0123456789' if whole else None)
+
+        if chars is None:
+            self.unresolved.append(
+                f'line {value.lineno}: {{{ast.unparse(value.value)}}}')
+        else:
+            self.chars.update(chars)
+
+    def add_sink(self, name, index):
+        """Follow the string passed as argument `index` of function `name`."""
+        if (name, index) in self.sinks:
+            return
+
+        self.sinks.add((name, index))
+        for call, function in self.calls:
+            if call_name(call) == name and index < len(call.args):
+                self.resolve(call.args[index], function)
+
+
+def scan_sources(paths, font_name, patterns=()):
+    """
+    Return (characters, unresolved) drawn with the font `font_name` by the
+    python sources in `paths`, plus the characters of the str.format
+    `patterns`. unresolved describes text whose content could not be
+    determined, which needs a pattern or -s to be covered.
+    """
+    chars = set()
+    unresolved = []
+    for path in paths:
+        with open(path, encoding='utf-8') as source:
+            tree = ast.parse(source.read(), path)
+
+        aliases = font_aliases(tree, font_name)
+        if aliases:
+            found, missing = SourceScanner(tree, aliases).scan()
+            chars.update(found)
+            unresolved.extend(f'{path} {item}' for item in missing)
+
+    for pattern in patterns:
+        found, missing = pattern_characters(pattern)
+        chars.update(found)
+        unresolved.extend(missing)
+
+    return chars, unresolved
+
+
+def encode_sprite_runs(values):
+    """
+    Encode RGB565 values into the packets of res/conevert.py: a control
+    byte with bit 7 set repeats the following color (control & 0x7f) + 1
+    times, otherwise control + 1 literal colors follow.
+    """
+    out = bytearray()
+    literal = []
+
+    def flush_literal():
+        while literal:
+            chunk = literal[:SPRITE_MAX_RUN]
+            del literal[:SPRITE_MAX_RUN]
+            out.append(len(chunk) - 1)
+            for value in chunk:
+                out.extend(value.to_bytes(2, 'big'))
+
+    i = 0
+    while i < len(values):
+        run = 1
+        while (i + run < len(values) and run < SPRITE_MAX_RUN
+               and values[i + run] == values[i]):
+            run += 1
+        if run >= 2:
+            flush_literal()
+            out.append(0x80 | (run - 1))
+            out.extend(values[i].to_bytes(2, 'big'))
+        else:
+            literal.append(values[i])
+        i += run
+
+    flush_literal()
+    return out
+
+
+def sprite_sheet(text, font, colors, bg=0, rle=False):
+    """
+    Return a sprite sheet file for gc9a01py.SpriteFont holding every
+    character of a rendered `font` (see Font.render) pre-expanded to
+    big-endian RGB565 in each of the `colors` on `bg`.
+
+    The file holds a header packed as SPRITE_HEADER (magic, format, HEIGHT,
+    MAX_WIDTH, color count, character count, MAP size in bytes and bg)
+    followed by the colors, the UTF-8 MAP, the WIDTHS, the offsets of the
+    sprites in color-major order plus the end of the last one, and the
+    sprites, either raw or run-length encoded with encode_sprite_runs.
+    """
+    height = font['HEIGHT']
+    bits = np.unpackbits(np.array(font['BITMAPS'], dtype=np.uint8))
+    sprites = []
+    for color in colors:
+        for width, offset in zip(font['WIDTHS'], font['OFFSETS']):
+            pixels = np.where(
+                bits[offset:offset + width * height], color, bg).astype('>u2')
+            sprites.append(
+                encode_sprite_runs(pixels.tolist()) if rle
+                else pixels.tobytes())
+
+    char_map = text.encode('utf-8')
+    data = bytearray(struct.pack(
+        SPRITE_HEADER, SPRITE_MAGIC, SPRITE_RLE if rle else SPRITE_RAW,
+        height, font['MAX_WIDTH'], len(colors), len(text), len(char_map),
+        bg))
+    for color in colors:
+        data.extend(struct.pack('>H', color))
+    data.extend(char_map)
+    data.extend(bytes(font['WIDTHS']))
+
+    offset = 0
+    for sprite in sprites + [b'']:
+        data.extend(struct.pack('>I', offset))
+        offset += len(sprite)
+    for sprite in sprites:
+        data.extend(sprite)
+
+    return data
+
+
 class Bitmap(object):
     """
-    A 2D bitmap image represented as a list of byte values. Each byte indicates
-    the state of a single pixel in the bitmap. A value of 0 indicates that the
-    pixel is `off` and any other value indicates that it is `on`.
+    A 2D bitmap image represented as a height x width numpy array of uint8.
+    A value of 0 indicates that the pixel is `off` and 1 that it is `on`.
     """
     def __init__(self, width, height, pixels=None):
         self.width = int(width)
         self.height = int(height)
-        self.pixels = pixels or bytearray(width * height)
+        self.pixels = (
+            np.zeros((self.height, self.width), dtype=np.uint8)
+            if pixels is None else pixels)
 
     def __repr__(self):
         """Return a string representation of the bitmap's pixels."""
-        rows = ''
-        for y in range(self.height):
-            for x in range(self.width):
-                rows += '#' if self.pixels[y * self.width + x] else '.'
-            rows += '\n'
-        return rows
+        return ''.join(
+            ''.join('#' if pixel else '.' for pixel in row) + '\n'
+            for row in self.pixels)
+
+    def bits(self):
+        """Return the pixels as a flat array of 0/1 values, row by row."""
+        return self.pixels.reshape(-1)
 
     def bit_string(self):
         """Return a binary string representation of the bitmap's pixels."""
-        bits = ''
-        for y in range(self.height):
-            for x in range(self.width):
-                bits += '1' if self.pixels[y * self.width + x] else '0'
-        return bits
+        return ''.join('1' if pixel else '0' for pixel in self.bits())
 
     def bitblt(self, src, x, y):
         """Copy all pixels from `src` into this bitmap"""
-        srcpixel = 0
-        dstpixel = y * self.width + x
-        row_offset = self.width - src.width
-
-        for _ in range(src.height):
-            for _ in range(src.width):
-                # Perform an OR operation on the destination pixel and the
-                # source pixel because glyph bitmaps may overlap if character
-                # kerning is applied, e.g. in the string "AVA", the "A" and "V"
-                # glyphs must be rendered with overlapping bounding boxes.
-                self.pixels[dstpixel] = (
-                    self.pixels[dstpixel] or src.pixels[srcpixel])
-                srcpixel += 1
-                dstpixel += 1
-            dstpixel += row_offset
+        # Perform an OR operation on the destination pixel and the source
+        # pixel because glyph bitmaps may overlap if character kerning is
+        # applied, e.g. in the string "AVA", the "A" and "V" glyphs must be
+        # rendered with overlapping bounding boxes.
+        self.pixels[y:y + src.height, x:x + src.width] |= src.pixels
 
 
 class Glyph(object):
@@ -175,59 +538,86 @@ class Glyph(object):
     @staticmethod
     def unpack_mono_bitmap(bitmap):
         """
-        Unpack a freetype FT_LOAD_TARGET_MONO glyph bitmap into a bytearray
-        where each pixel is represented by a single byte.
+        Unpack a freetype FT_LOAD_TARGET_MONO glyph bitmap into a rows x
+        width numpy array where each pixel is represented by a single byte.
         """
-        # Allocate a bytearray of sufficient size to hold the glyph bitmap.
-        data = bytearray(bitmap.rows * bitmap.width)
-
-        # Iterate over every byte in the glyph bitmap. Note that we're not
-        # iterating over every pixel in the resulting unpacked bitmap --
-        # we're iterating over the packed bytes in the input bitmap.
-        for y in range(bitmap.rows):
-            for byte_index in range(bitmap.pitch):
-
-                # Read the byte that contains the packed pixel data.
-                byte_value = bitmap.buffer[y * bitmap.pitch + byte_index]
+        if not bitmap.rows or not bitmap.width:
+            return np.zeros((bitmap.rows, bitmap.width), dtype=np.uint8)
 
-                # We've processed this many bits (=pixels) so far. This
-                # determines where we'll read the next batch of pixels from.
-                num_bits_done = byte_index * 8
+        # Each row is pitch bytes, most significant bit first, padded past
+        # the glyph width.
+        packed = np.frombuffer(
+            bytes(bitmap.buffer), dtype=np.uint8,
+            count=bitmap.rows * bitmap.pitch).reshape(bitmap.rows, bitmap.pitch)
+        return np.ascontiguousarray(
+            np.unpackbits(packed, axis=1)[:, :bitmap.width])
 
-                # Pre-compute where to write the pixels that we're going
-                # to unpack from the current byte in the glyph bitmap.
-                rowstart = y * bitmap.width + byte_index * 8
 
-                # Iterate over every bit (=pixel) that's still a part of the
-                # output bitmap. Sometimes we're only unpacking a fraction of a
-                # byte because glyphs may not always fit on a byte boundary. So
-                # we make sure to stop if we unpack past the current row of
-                # pixels.
-                for bit_index in range(min(8, bitmap.width - num_bits_done)):
+# FreeType faces opened by load_glyphs, one per font file and size
+_faces = {}
 
-                    # Unpack the next pixel from the current glyph byte.
-                    bit = byte_value & (1 << (7 - bit_index))
 
-                    # Write the pixel to the output bytearray. We ensure that
-                    # `off` pixels have a value of 0 and `on` pixels have a
-                    # value of 1.
-                    data[rowstart + bit_index] = 1 if bit else 0
+def load_glyphs(filename, width, height, chars):
+    """
+    Render `chars` of the font file at the given pixel size and return a
+    list of Glyphs. Runs in the process pool workers, which each keep their
+    own FreeType faces since faces cannot be shared between processes.
+    """
+    face = _faces.get((filename, width, height))
+    if face is None:
+        face = freetype.Face(filename)
+        face.set_pixel_sizes(width, height)
+        _faces[(filename, width, height)] = face
+
+    glyphs = []
+    for char in chars:
+        # Let FreeType load the glyph for the given character and tell it to
+        # render a monochromatic bitmap representation.
+        face.load_char(
+            char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_MONO)
+        glyphs.append(Glyph.from_glyphslot(face.glyph))
 
-        return data
+    return glyphs
 
 
 class Font(object):
-    def __init__(self, filename, width, height):
-        self.face = freetype.Face(filename)
-        self.face.set_pixel_sizes(width, height)
+    def __init__(self, filename, width, height, pool=None):
+        self.filename = filename
+        self.width = width
+        self.height = height
+        self.pool = pool
+        # characters that set HEIGHT and the baseline, so a subset keeps the
+        # metrics of the full character selection
+        self.metrics = None
+        self._glyphs = {}
+        self._pending = []
+        self._rendered = None
+
+    def load(self, text):
+        """
+        Start rendering the glyphs of `text` that are not loaded yet. With a
+        process pool the glyphs are rendered in the background in tasks of
+        GLYPHS_PER_TASK characters, so several fonts can be loaded at once.
+        """
+        chars = [char for char in dict.fromkeys(text) if char not in self._glyphs]
+        for i in range(0, len(chars), GLYPHS_PER_TASK):
+            task = (self.filename, self.width, self.height,
+                    chars[i:i + GLYPHS_PER_TASK])
+            if self.pool is None:
+                self._glyphs.update(zip(task[3], load_glyphs(*task)))
+            else:
+                self._pending.append(
+                    (task[3], self.pool.apply_async(load_glyphs, task)))
 
     def glyph_for_character(self, char):
-        # Let FreeType load the glyph for the given character and tell it to
-        # render a monochromatic bitmap representation.
-        self.face.load_char(
-            char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_TARGET_MONO)
+        if char not in self._glyphs:
+            if not self._pending:
+                self.load(char)
+            for chars, result in self._pending:
+                self._glyphs.update(zip(chars, result.get()))
+            self._pending = []
 
-        return Glyph.from_glyphslot(self.face.glyph)
+        return self._glyphs[char]
 
     def render_character(self, char):
         glyph = self.glyph_for_character(char)
@@ -261,11 +651,18 @@ class Font(object):
         height = max_ascent + max_descent
         return (width, height, max_descent)
 
-    def write_python(self, text, font_file):
+    def render(self, text):
         """
-        Render the given `text` into a python bitmap module.
+        Render the given `text` and return a dict with the font HEIGHT,
+        MAX_WIDTH, per character WIDTHS and bit OFFSETS, OFFSET_WIDTH and the
+        packed BITMAPS bytes. The last result is reused when the same text
+        is rendered again.
         """
-        _, height, baseline = self.text_dimensions(text)
+        if self._rendered is not None and self._rendered[0] == text:
+            return self._rendered[1]
+
+        self.load(text)
+        _, height, baseline = self.text_dimensions(self.metrics or text)
 
         bits = []
         widths = []
@@ -301,19 +698,38 @@ class Font(object):
             y = height - glyph.ascent - baseline
             outbuffer.bitblt(glyph.bitmap, left, y)
 
-            # convert bitmap to ascii bitmap string
-            bit_string = outbuffer.bit_string()
-            bits.append(bit_string)
-            offset += len(bit_string)
+            glyph_bits = outbuffer.bits()
+            bits.append(glyph_bits)
+            offset += glyph_bits.size
+
+        bytes_table = [0xff, 0xffff, 0xffffff, 0xffffffff]
+        bytes_required = bisect.bisect_left(bytes_table, offset, 0, 3) + 1
 
-        # join all the bitmap strings together
-        bit_string = ''.join(bits)
+        # pack all the glyphs together, zero padding the last byte
+        byte_values = (
+            np.packbits(np.concatenate(bits)).tolist() if bits else [])
+
+        font = {
+            'HEIGHT': height,
+            'MAX_WIDTH': max(widths),
+            'WIDTHS': widths,
+            'OFFSETS': offsets,
+            'OFFSET_WIDTH': bytes_required,
+            'BITMAPS': byte_values}
+        self._rendered = (text, font)
+        return font
+
+    def write_python(self, text, font_file, cmd_line=None):
+        """
+        Render the given `text` into a python bitmap module.
+        """
+        font = self.render(text)
 
         # escape '\' and '"' characters for char_map
         char_map = text.replace('\\', '\\\\').replace('"', '\\"')
 
-        cmd_line = " ".join(map(shlex.quote, sys.argv))
-        max_width = max(widths)
+        if cmd_line is None:
+            cmd_line = " ".join(map(shlex.quote, sys.argv))
 
         # write python module source
         print('# -*- coding: utf-8 -*-')
@@ -322,16 +738,15 @@ class Font(object):
         print()
         print(f'MAP = "{char_map}"')
         print('BPP = 1')
-        print(f'HEIGHT = {height}')
-        print(f'MAX_WIDTH = {max_width}')
+        print(f'HEIGHT = {font["HEIGHT"]}')
+        print(f'MAX_WIDTH = {font["MAX_WIDTH"]}')
         print('_WIDTHS = \\')
-        print(wrap_bytes(widths))
+        print(wrap_bytes(font["WIDTHS"]))
         print()
 
+        bytes_required = font["OFFSET_WIDTH"]
         byte_offsets = bytearray()
-        bytes_table = [0xff, 0xffff, 0xffffff, 0xffffffff]
-        bytes_required = bisect.bisect_left(bytes_table, offset, 0, 3) + 1
-        for offset in offsets:
+        for offset in font["OFFSETS"]:
             byte_offsets.extend(offset.to_bytes(bytes_required, 'big'))
 
         print(f'OFFSET_WIDTH = {bytes_required}')
@@ -340,17 +755,55 @@ class Font(object):
         print()
 
         print('_BITMAPS =\\')
-        byte_values = []
-        for i in range(0, len(bit_string), 8):
-            byte_values.append(int(bit_string[i:i+8], 2))
+        print(wrap_bytes(font["BITMAPS"]))
+        print()
+
+        first, table, sparse = build_index(text)
+        print(f'INDEX_FIRST = {first}')
+        print('_INDEX = \\')
+        print(wrap_bytes(table))
+        print(f'INDEX_SPARSE = {sparse!r}')
 
-        print(wrap_bytes(byte_values))
         print("\nWIDTHS = memoryview(_WIDTHS)")
         print("OFFSETS = memoryview(_OFFSETS)")
         print("BITMAPS = memoryview(_BITMAPS)")
+        print("INDEX = memoryview(_INDEX)")
 
+    def write_sprites(self, text, sprite_file, colors, bg=0, rle=False):
+        """
+        Render the given `text` into a sprite sheet file of RGB565 glyphs in
+        each of the `colors`, see sprite_sheet.
+        """
+        with open(sprite_file, 'wb') as f:
+            f.write(sprite_sheet(text, self.render(text), colors, bg, rle))
 
-def main():
+    def write_binary(self, text, binary_file):
+        """
+        Render the given `text` into a binary font file for
+        gc9a01py.BinaryFont, which loads glyphs from flash on demand.
+
+        The file holds a header packed as BINARY_HEADER (magic, BPP, HEIGHT,
+        MAX_WIDTH, OFFSET_WIDTH, character count, MAP size in bytes and
+        BITMAPS size in bytes) followed by the UTF-8 MAP, the WIDTHS, the
+        big-endian OFFSETS and the BITMAPS.
+        """
+        font = self.render(text)
+        char_map = text.encode('utf-8')
+        bytes_required = font["OFFSET_WIDTH"]
+
+        with open(binary_file, 'wb') as f:
+            f.write(struct.pack(
+                BINARY_HEADER, BINARY_MAGIC, 1, font["HEIGHT"],
+                font["MAX_WIDTH"], bytes_required, len(text), len(char_map),
+                len(font["BITMAPS"])))
+            f.write(char_map)
+            f.write(bytes(font["WIDTHS"]))
+            for offset in font["OFFSETS"]:
+                f.write(offset.to_bytes(bytes_required, 'big'))
+            f.write(bytes(font["BITMAPS"]))
+
+
+def build_parser():
     parser = argparse.ArgumentParser(
         prog='font2bitmap',
         description=('''
@@ -359,11 +812,13 @@ def main():
 
     parser.add_argument(
         'font_file',
+        nargs='?',
         help='name of font file to convert.')
 
     parser.add_argument(
         'font_height',
         type=int,
+        nargs='?',
         default=8,
         help='size of font to create bitmaps from.')
 
@@ -377,7 +832,7 @@ def main():
         'character selection',
         'characters from the font to include in the bitmap.')
 
-    excl = group.add_mutually_exclusive_group(required=True)
+    excl = group.add_mutually_exclusive_group()
     excl.add_argument(
         '-c', '--characters',
         help='''integer or hex character values and/or ranges to include.
@@ -388,15 +843,217 @@ def main():
         help='''string of characters to include
         For example: "1234567890-."''')
 
-    args = parser.parse_args()
-    font_file = args.font_file
-    height = args.font_height
+    parser.add_argument(
+        '-b', '--binary',
+        help='''also write a binary font file that gc9a01py.BinaryFont
+        loads glyphs from on demand''')
+
+    parser.add_argument(
+        '-o', '--output',
+        help='write the python module to this file instead of stdout')
+
+    sprites = parser.add_argument_group(
+        'sprites',
+        '''also write the characters pre-rendered in a few fixed colors
+        for gc9a01py.SpriteFont, which copies them to the display without
+        expanding bits.''')
+
+    sprites.add_argument(
+        '--sprites',
+        metavar='SPRITE_FILE',
+        help='name of the sprite sheet file to write')
+
+    sprites.add_argument(
+        '--sprite-colors',
+        default='0xffff',
+        help='comma separated RGB565 sprite colors, for example 0x0532,0xf800')
+
+    sprites.add_argument(
+        '--sprite-bg',
+        default='0x0000',
+        help='RGB565 background color of the sprites')
+
+    sprites.add_argument(
+        '--sprite-rle',
+        action='store_true',
+        help='run-length encode the sprites')
+
+    subset = parser.add_argument_group(
+        'subsetting',
+        '''keep only the characters the firmware draws with the font,
+        limited to the -c or -s characters when given, and report the bytes
+        saved.''')
+
+    subset.add_argument(
+        '--scan',
+        nargs='+',
+        metavar='SOURCE',
+        help='python sources to scan for text drawn with the font')
+
+    subset.add_argument(
+        '--pattern',
+        action='append',
+        help='''str.format pattern of text drawn with the font, for example
+        "Filter: {:d}%%", may be repeated''')
+
+    subset.add_argument(
+        '--font-name',
+        help='''module name the sources use for the font, defaults to the
+        name of the -o or -b file''')
+
+    parser.add_argument(
+        '--freetype',
+        metavar='VERSION',
+        help='''stop unless the installed FreeType library is this version,
+        for example 2.13.2. Other versions can rasterize the same font a row
+        higher or lower, so pin it where the output is committed.''')
+
+    parser.add_argument(
+        '--batch',
+        help='''convert every font listed in this file, one conversion per
+        line using the arguments above. Paths are relative to the file.''')
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='number of glyph rendering processes, defaults to the CPU count')
+
+    return parser
+
+
+def font_bytes(font, text):
+    """Return the size of the MAP, WIDTHS, OFFSETS and BITMAPS of a font."""
+    return (len(text.encode('utf-8')) + len(font['WIDTHS'])
+            + len(font['OFFSETS']) * font['OFFSET_WIDTH']
+            + len(font['BITMAPS']))
+
+
+def subset_characters(parser, args, characters, base=''):
+    """
+    Return the characters of `characters`, or all when it is None, that
+    the --scan sources and --pattern patterns draw with the font.
+    """
+    name = args.font_name or os.path.splitext(
+        os.path.basename(args.output or args.binary or ''))[0]
+    if not name:
+        parser.error('--font-name, -o or -b is needed for subsetting')
+
+    used, unresolved = scan_sources(
+        [os.path.join(base, path) for path in args.scan or ()], name,
+        args.pattern or ())
+    for item in unresolved:
+        print(f'{name}: unknown text at {item}, add a --pattern for it',
+              file=sys.stderr)
+
+    if characters is None:
+        return ''.join(sorted(used))
+
+    missing = ''.join(sorted(used.difference(characters)))
+    if missing:
+        print(f'{name}: {missing!r} is used but not selected',
+              file=sys.stderr)
+    return ''.join(char for char in characters if char in used)
+
+
+def start_conversion(parser, args, pool, base=''):
+    """
+    Check the arguments of one conversion and start loading its glyphs.
+    Returns (Font, characters, selected, args) for finish_conversion,
+    selected holds the -c or -s characters when the font is a subset.
+    """
+    selected = None
+    if args.characters is not None or args.string is not None:
+        selected = (
+            get_chars(args.characters) if args.string is None
+            else args.string)
+
+    if args.font_file is None or (
+            selected is None and not (args.scan or args.pattern)):
+        parser.error('a font file and -c, -s, --scan or --pattern are required')
+
+    installed = '.'.join(map(str, freetype.version()))
+    if args.freetype is not None and args.freetype != installed:
+        parser.error(
+            f'{args.font_file} is pinned to FreeType {args.freetype}, '
+            f'{installed} is installed')
+
+    characters = selected
+    if args.scan or args.pattern:
+        characters = subset_characters(parser, args, selected, base)
+    else:
+        selected = None
+
     width = args.font_height if args.font_width is None else args.font_width
-    characters = (
-        get_chars(args.characters) if args.string is None else args.string)
+    fnt = Font(
+        os.path.join(base, args.font_file), width, args.font_height, pool)
+    fnt.metrics = selected
+    fnt.load(selected or characters)
+    return fnt, characters, selected, args
 
-    fnt = Font(font_file, width, height)
-    fnt.write_python(characters, font_file)
 
+def finish_conversion(
+        fnt, characters, selected, args, base='', cmd_line=None):
+    """
+    Write the python module and binary font of a started conversion, and
+    report the bytes a subset saves.
+    """
+    if args.output:
+        with open(os.path.join(base, args.output), 'w') as module, \
+                contextlib.redirect_stdout(module):
+            fnt.write_python(characters, args.font_file, cmd_line)
+    else:
+        fnt.write_python(characters, args.font_file, cmd_line)
+
+    if args.binary:
+        fnt.write_binary(characters, os.path.join(base, args.binary))
+
+    if args.sprites:
+        fnt.write_sprites(
+            characters, os.path.join(base, args.sprites),
+            [to_int(color.strip()) for color in args.sprite_colors.split(',')],
+            to_int(args.sprite_bg), args.sprite_rle)
+
+    name = args.output or args.binary
+    if selected is not None:
+        subset = font_bytes(fnt.render(characters), characters)
+        full = font_bytes(fnt.render(selected), selected)
+        print(f'{name}: {len(characters)} of {len(selected)} characters, '
+              f'{subset} of {full} bytes, {full - subset} bytes saved',
+              file=sys.stderr)
+    elif args.scan or args.pattern:
+        subset = font_bytes(fnt.render(characters), characters)
+        print(f'{name}: {len(characters)} characters, {subset} bytes, '
+              f'metrics from these characters only, give -c or -s to keep '
+              f'the metrics of a full selection', file=sys.stderr)
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
 
-main()
+    with multiprocessing.Pool(args.jobs) as pool:
+        if args.batch is None:
+            finish_conversion(*start_conversion(parser, args, pool))
+            return
+
+        # queue the glyphs of every font before writing any of them, so all
+        # sizes and character ranges render in parallel
+        base = os.path.dirname(args.batch)
+        conversions = []
+        with open(args.batch) as batch:
+            for line in batch:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    conversions.append((line, start_conversion(
+                        parser, parser.parse_args(shlex.split(line)), pool,
+                        base)))
+
+        for line, conversion in conversions:
+            finish_conversion(
+                *conversion, base=base, cmd_line=f'font2bitmap.py {line}')
+            print(f'{line}: done', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,56 +1,69 @@
 from machine import I2C, Pin
+import struct
 import time
 
 class MB85RC04PNF:
     """
     Driver for MB85RC04PNF FRAM chip
     4Kbit (512 bytes) non-volatile memory
-    I2C address: 0x50 (with A0-A2 pins grounded)
+    I2C address: 0x50 (with A1-A2 pins grounded)
+
+    The chip takes an 8-bit memory address. The ninth address bit selects
+    the upper 256 byte page and is sent as bit 0 of the device address, so
+    the chip answers on both 0x50 and 0x51. Transfers that cross the page
+    boundary are split into one burst per page.
     """
-    
+
+    PAGE_SIZE = 256
+
     def __init__(self, i2c, address=0x50):
         self.i2c = i2c
-        self.address = address
+        self.address = address & ~1  # Bit 0 is the page bit
         self.size = 512  # 4Kbit = 512 bytes
-        
+
+    def _check(self, address, length):
+        if address < 0 or length < 0 or address + length > self.size:
+            raise ValueError(f"Range {address}-{address+length-1} out of range (0-{self.size-1})")
+
+    def _bursts(self, address, length):
+        """Yield (device address, memory address, offset, length) per page"""
+        offset = 0
+        while offset < length:
+            page, mem_addr = divmod(address + offset, self.PAGE_SIZE)
+            count = min(length - offset, self.PAGE_SIZE - mem_addr)
+            yield self.address | page, mem_addr, offset, count
+            offset += count
+
     def read_byte(self, address):
         """Read a single byte from FRAM"""
-        if address >= self.size:
-            raise ValueError(f"Address {address} out of range (0-{self.size-1})")
-        
-        # Send 2-byte address (big-endian)
-        addr_bytes = address.to_bytes(2, 'big')
-        data = self.i2c.readfrom_mem(self.address, addr_bytes[0] << 8 | addr_bytes[1], 1)
+        self._check(address, 1)
+        data = self.i2c.readfrom_mem(self.address | address >> 8, address & 0xFF, 1)
         return data[0] if data else 0
-    
+
     def write_byte(self, address, value):
         """Write a single byte to FRAM"""
-        if address >= self.size:
-            raise ValueError(f"Address {address} out of range (0-{self.size-1})")
-        
-        # Send 2-byte address (big-endian) followed by data
-        addr_bytes = address.to_bytes(2, 'big')
-        self.i2c.writeto_mem(self.address, addr_bytes[0] << 8 | addr_bytes[1], bytes([value]))
-    
+        self._check(address, 1)
+        self.i2c.writeto_mem(self.address | address >> 8, address & 0xFF, bytes([value]))
+
+    def read_into(self, address, buffer):
+        """Read len(buffer) bytes from FRAM into buffer, one burst per page"""
+        self._check(address, len(buffer))
+        view = memoryview(buffer)
+        for device, mem_addr, offset, count in self._bursts(address, len(buffer)):
+            self.i2c.readfrom_mem_into(device, mem_addr, view[offset:offset + count])
+        return buffer
+
     def read_bytes(self, address, length):
         """Read multiple bytes from FRAM"""
-        if address + length > self.size:
-            raise ValueError(f"Read range {address}-{address+length-1} out of range (0-{self.size-1})")
-        
-        # Send 2-byte address (big-endian)
-        addr_bytes = address.to_bytes(2, 'big')
-        data = self.i2c.readfrom_mem(self.address, addr_bytes[0] << 8 | addr_bytes[1], length)
-        return data
-    
+        return self.read_into(address, bytearray(length))
+
     def write_bytes(self, address, data):
-        """Write multiple bytes to FRAM"""
-        if address + len(data) > self.size:
-            raise ValueError(f"Write range {address}-{address+len(data)-1} out of range (0-{self.size-1})")
-        
-        # Send 2-byte address (big-endian) followed by data
-        addr_bytes = address.to_bytes(2, 'big')
-        self.i2c.writeto_mem(self.address, addr_bytes[0] << 8 | addr_bytes[1], data)
-    
+        """Write multiple bytes to FRAM, one burst per page"""
+        self._check(address, len(data))
+        view = memoryview(data)
+        for device, mem_addr, offset, count in self._bursts(address, len(data)):
+            self.i2c.writeto_mem(device, mem_addr, view[offset:offset + count])
+
     def read_int(self, address):
         """Read a 32-bit integer from FRAM"""
         data = self.read_bytes(address, 4)
@@ -64,12 +77,10 @@ class MB85RC04PNF:
     def read_float(self, address):
         """Read a 32-bit float from FRAM"""
         data = self.read_bytes(address, 4)
-        import struct
         return struct.unpack('f', data)[0]
     
     def write_float(self, address, value):
         """Write a 32-bit float to FRAM"""
-        import struct
         data = struct.pack('f', value)
         self.write_bytes(address, data)
     
@@ -116,53 +127,532 @@ def init_fram():
         print(f"Failed to initialize FRAM: {e}")
         return False
 
-def read_filter_percent_fram():
-    """Read filter percentage from FRAM (with decimal precision)"""
-    global fram
+# Persistent state record, stored twice so a write cut short by a power
+# loss leaves the other slot intact. Fields: magic, version, last mode,
+# sequence, filter life percent, run seconds, settings, then a CRC-16 of
+# those bytes. A new field goes at the end with a new RECORD_VERSION.
+RECORD_MAGIC = b"AR"
+RECORD_VERSION = 1
+RECORD_FORMAT = "<2sBBHfIH"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT) + 2
+RECORD_SLOT_SIZE = 32
+RECORD_SLOTS = (0, RECORD_SLOT_SIZE)  # Addresses, 0-63 in one burst
+MODES = ("low", "med", "high", "auto")
+
+
+def crc16(data, crc=0xFFFF):
+    """CRC-16/CCITT-FALSE of data"""
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+    return crc
+
+
+class StateRecord:
+    """
+    Persistent state in FRAM: filter life, last mode, run time and
+    settings, loaded in one I2C burst and saved in one.
+
+    Saves alternate between the two slots with an increasing sequence
+    number. load() takes the newest slot with a valid magic, version and
+    CRC, so a torn write falls back to the previous save.
+    """
+
+    def __init__(self):
+        self.filter_life = 0.0  # Percent of filter life used
+        self.mode = "low"  # Last mode picked in mode_select
+        self.run_seconds = 0  # Fan run time
+        self.settings = 0  # Bit flags for user settings
+        self.sequence = 0
+        self.slot = None  # Index of the slot last loaded or saved
+        self.loads = 0
+        self.saves = 0
+        self.bad_slots = 0  # Slots rejected by load()
+        self._buffer = bytearray(RECORD_SLOT_SIZE * len(RECORD_SLOTS))
+        self._saved = None
+
+    def pack(self, sequence=None):
+        """Return the record bytes with their CRC"""
+        mode = MODES.index(self.mode) if self.mode in MODES else 0
+        data = struct.pack(
+            RECORD_FORMAT, RECORD_MAGIC, RECORD_VERSION, mode,
+            self.sequence if sequence is None else sequence,
+            self.filter_life, self.run_seconds, self.settings)
+        return data + crc16(data).to_bytes(2, 'little')
+
+    def _unpack(self, data):
+        """Return the fields of a slot, or None if it is not valid"""
+        body = data[:RECORD_SIZE - 2]
+        if int.from_bytes(data[RECORD_SIZE - 2:RECORD_SIZE], 'little') != crc16(body):
+            return None
+        fields = struct.unpack(RECORD_FORMAT, body)
+        if fields[0] != RECORD_MAGIC or fields[1] != RECORD_VERSION:
+            return None
+        return fields
+
+    def load(self):
+        """
+        Read both slots in one burst and take the newest valid one. Returns
+        False and keeps the current fields when neither slot is valid.
+        """
+        if fram is None:
+            return False
+        fram.read_into(RECORD_SLOTS[0], self._buffer)
+        self.loads += 1
+        newest = None
+        for slot in range(len(RECORD_SLOTS)):
+            start = slot * RECORD_SLOT_SIZE
+            fields = self._unpack(self._buffer[start:start + RECORD_SLOT_SIZE])
+            if fields is None:
+                self.bad_slots += 1
+            elif newest is None or (fields[3] - newest[1][3]) & 0xFFFF < 0x8000:
+                newest = (slot, fields)
+        if newest is None:
+            return False
+
+        self.slot, (_, _, mode, self.sequence, self.filter_life,
+                    self.run_seconds, self.settings) = newest
+        self.mode = MODES[mode] if mode < len(MODES) else "low"
+        self._saved = self.pack()
+        return True
+
+    def changed(self):
+        """Return True if a field differs from the last load or save"""
+        return self.pack() != self._saved
+
+    def save(self):
+        """Write the record to the older slot in one burst"""
+        if fram is None:
+            raise OSError("FRAM not initialized")
+        slot = 0 if self.slot is None else (self.slot + 1) % len(RECORD_SLOTS)
+        sequence = (self.sequence + 1) & 0xFFFF
+        data = self.pack(sequence)
+        fram.write_bytes(RECORD_SLOTS[slot], data)
+        self.sequence = sequence
+        self.slot = slot
+        self.saves += 1
+        self._saved = self.pack()
+
+    def stats(self):
+        """Return a dict with the record fields and counters"""
+        return {
+            'filter_life': self.filter_life,
+            'mode': self.mode,
+            'run_hours': self.run_seconds / 3600,
+            'sequence': self.sequence,
+            'loads': self.loads,
+            'saves': self.saves,
+            'bad_slots': self.bad_slots}
+
+# State shared by the states of main.py
+state = StateRecord()
+
+def load_state():
+    """
+    Load the state record. Without a valid record, the filter percent is
+    taken from the float that earlier firmware kept at address 0.
+
+    Returns True when FRAM was read, whether it held a record, a legacy
+    value or nothing, and False when it could not be read. The record then
+    keeps its defaults, which must not be saved over the real one.
+    """
     if fram is None:
-        print("FRAM not initialized, returning 0")
-        return 0.0
-    
+        print("FRAM not initialized, cannot load state")
+        return False
     try:
-        # Read from address 0 as float
+        if state.load():
+            print(f"State loaded from slot {state.slot}: {state.stats()}")
+            return True
         value = fram.read_float(0)
-        # Validate the value is reasonable (0-100)
         if 0.0 <= value <= 100.0:
-            return value
+            print(f"No state record in FRAM, filter percent {value:.2f}% from address 0")
+            state.filter_life = value
         else:
-            print(f"Invalid filter percent in FRAM: {value}, resetting to 0")
-            write_filter_percent_fram(0.0)
-            return 0.0
+            print("No state record in FRAM, starting from defaults")
+        return True
     except Exception as e:
-        print(f"Error reading from FRAM: {e}, returning 0")
+        print(f"Error loading state from FRAM: {e}")
+        return False
+
+def read_filter_percent_fram():
+    """
+    Return the filter percentage of the state record, read from FRAM the
+    first time and from RAM afterwards, so changes not yet flushed are kept
+    """
+    global fram
+    if fram is None:
+        print("FRAM not initialized, returning 0")
         return 0.0
 
+    value = filter_life.read()
+    # Validate the value is reasonable (0-100)
+    if 0.0 <= value <= 100.0:
+        return value
+    print(f"Invalid filter percent in FRAM: {value}, resetting to 0")
+    write_filter_percent_fram(0.0)
+    return 0.0
+
 def write_filter_percent_fram(value):
-    """Write filter percentage to FRAM (with decimal precision)"""
+    """
+    Write filter percentage to the state record in FRAM and verify it. The
+    record is loaded first, so the save goes to the older slot with the
+    next sequence number and keeps the other fields.
+    """
     global fram
     if fram is None:
         print("FRAM not initialized, cannot write")
         return False
-    
+
     try:
-        # Ensure value is in valid range
-        value = max(0.0, min(100.0, float(value)))
-        print(f"[DEBUG] Writing {value:.2f}% to FRAM...")
-        
-        # Write to address 0 as float
-        fram.write_float(0, value)
-        
-        # Verify the write by reading back immediately
-        time.sleep(0.01)  # Small delay to ensure write completes
-        verify_value = fram.read_float(0)
-        print(f"[DEBUG] Write verification: wrote {value:.2f}%, read back {verify_value:.2f}%")
-        
-        if abs(verify_value - value) < 0.01:
-            print(f"✓ Filter percent {value:.2f}% written to FRAM and verified")
-            return True
-        else:
-            print(f"✗ Write verification failed: wrote {value:.2f}%, read back {verify_value:.2f}%")
+        filter_life.set(value)
+        if not filter_life.loaded:
+            print("✗ State could not be loaded from FRAM, filter percent not written")
+            return False
+        if state.changed() and not filter_life.flush():
             return False
+        expected = state.pack()
+        check = StateRecord()
+        if check.load() and check.pack() == expected:
+            print(f"✓ Filter percent {state.filter_life:.2f}% written to FRAM and verified")
+            return True
+        print(f"✗ Write verification failed for filter percent {state.filter_life:.2f}%")
+        return False
     except Exception as e:
         print(f"Error writing to FRAM: {e}")
-        return False 
\ No newline at end of file
+        return False
+
+
+class FilterLife:
+    """
+    Filter life percentage kept in RAM and written back to FRAM as part of
+    the state record.
+
+    add() only updates the value in RAM. poll() saves the record once
+    interval_ms has passed since the last save, and flush() saves it right
+    away, so the control loop does one I2C write per interval instead of a
+    read, a write and a verification every second. Nothing is written when
+    no field of the record changed, and changes to the other fields, such
+    as the mode, are saved by the same flushes.
+
+    A power loss loses at most interval_ms worth of filter use.
+    """
+
+    def __init__(self, record, interval_ms=30000):
+        self.record = record
+        self.interval_ms = interval_ms
+        self.loaded = False  # FRAM read successfully, so flushes may save
+        self.flushes = 0  # Records written to FRAM
+        self.skipped = 0  # Flushes with nothing new to write
+        self.updates = 0  # Changes kept in RAM
+        self._last_flush = time.ticks_ms()
+
+    def read(self):
+        """
+        Return the filter percentage, loading the record the first time.
+        A failed load is retried on the next call.
+        """
+        if not self.loaded:
+            self.loaded = load_state()
+        return self.record.filter_life
+
+    def set(self, value):
+        """Set the filter percentage in RAM, clamped to 0-100"""
+        self.read()
+        return self._store(value)
+
+    def add(self, amount):
+        """Add filter use in percent in RAM, return the new percentage"""
+        return self._store(self.read() + amount)
+
+    def _store(self, value):
+        # Loads only through read(), so a load cannot land between reading
+        # the old value and storing the new one
+        self.record.filter_life = max(0.0, min(100.0, float(value)))
+        self.updates += 1
+        return self.record.filter_life
+
+    def poll(self, now=None):
+        """Flush when interval_ms has passed since the last flush"""
+        if now is None:
+            now = time.ticks_ms()
+        if time.ticks_diff(now, self._last_flush) < self.interval_ms:
+            return False
+        return self.flush(now)
+
+    def flush(self, now=None):
+        """
+        Save the state record to FRAM if it changed. Nothing is saved until
+        the record has been loaded, so defaults never overwrite it.
+        """
+        self._last_flush = time.ticks_ms() if now is None else now
+        if not self.loaded or not self.record.changed():
+            self.skipped += 1
+            return False
+
+        try:
+            self.record.save()
+        except Exception as e:
+            print(f"Error writing to FRAM: {e}")
+            return False
+        self.flushes += 1
+        return True
+
+    def stats(self):
+        """Return a dict with the write-back counters"""
+        return {
+            'value': self.record.filter_life,
+            'flushes': self.flushes,
+            'skipped': self.skipped,
+            'updates': self.updates}
+
+# Filter percentage shared by the states of main.py
+filter_life = FilterLife(state)
+
+
+# PM log in the FRAM after the state record: a header with the position of
+# each ring and the open hour and day, then one ring of entries per level.
+# An entry holds PM1 average, PM2.5 minimum, average and maximum, and PM10
+# average in ug/m3 x 10. An open hour or day is kept as its number of
+# entries so far and their entry.
+LOG_MAGIC = b"PL"
+LOG_VERSION = 2
+LOG_START = RECORD_SLOT_SIZE * len(RECORD_SLOTS)
+LOG_ENTRY_FORMAT = "<5H"
+LOG_ENTRY_SIZE = struct.calcsize(LOG_ENTRY_FORMAT)
+LOG_OPEN_FORMAT = "B5H"  # Entries so far and their entry
+# Magic, version, (head, count) per level, open hour and day
+LOG_HEADER_FORMAT = "<2sB6B" + LOG_OPEN_FORMAT * 2
+LOG_HEADER_SIZE = 34  # Header and CRC-16, rounded up
+LOG_LEVELS = (("minute", 10), ("hour", 24), ("day", 7))  # (name, entries)
+LOG_SPANS = (60, 24)  # Entries of a level per entry of the next
+LOG_MINUTE_MS = 60000
+
+
+class PMLog:
+    """
+    PM1/PM2.5/PM10 history in the FRAM after the state record.
+
+    Samples are averaged over each minute in RAM. Every minute becomes a
+    minute entry with the PM2.5 minimum, average and maximum, every 60
+    minute entries an hour entry and every 24 hour entries a day entry,
+    each level kept in its own ring so old minutes are overwritten long
+    before old days. Only minutes with samples are logged, the device has
+    no clock to tell how long it was off.
+
+    The hour and day still open are saved in the header with every flush
+    and restored by load(), so a reboot loses at most the open minute and
+    the entries not flushed yet. Their sums are restored from the averages,
+    rounded to 0.1 ug/m3.
+
+    Entries are written in batches of `batch` minutes, one burst per ring
+    run and one for the header, and flush() writes what is pending, such
+    as when a state exits. history() streams a level newest first, reading
+    a few entries per burst into a fixed buffer.
+    """
+
+    def __init__(self, batch=5):
+        self.batch = batch
+        self.heads = [0] * len(LOG_LEVELS)  # Next entry written per level
+        self.counts = [0] * len(LOG_LEVELS)
+        self.flushes = 0
+        self.bursts = 0  # I2C writes of entries and headers
+        self.entries = 0  # Entries written to FRAM
+        self.samples = 0
+        self._pending = [[] for _ in LOG_LEVELS]
+        self._open = [self._empty() for _ in LOG_LEVELS]
+        self._minute_start = None
+        self._buffer = bytearray(max(n for _, n in LOG_LEVELS) * LOG_ENTRY_SIZE)
+        self._header = bytearray(LOG_HEADER_SIZE)
+        addresses = []
+        address = LOG_START + LOG_HEADER_SIZE
+        for _, entries in LOG_LEVELS:
+            addresses.append(address)
+            address += entries * LOG_ENTRY_SIZE
+        if address > 512:
+            raise ValueError("PM log does not fit in FRAM")
+        self._addresses = addresses
+
+    @staticmethod
+    def _empty():
+        # count, PM1 sum, PM2.5 minimum, PM2.5 sum, PM2.5 maximum, PM10 sum
+        return [0, 0, 0xFFFF, 0, 0, 0]
+
+    @staticmethod
+    def _average(agg):
+        """Return the entry of an aggregate with at least one sample"""
+        count = agg[0]
+        half = count // 2
+        return ((agg[1] + half) // count, agg[2], (agg[3] + half) // count,
+                agg[4], (agg[5] + half) // count)
+
+    def load(self):
+        """
+        Read the ring positions and the open hour and day in one burst,
+        start empty if invalid
+        """
+        if fram is None:
+            return False
+        fram.read_into(LOG_START, self._header)
+        size = struct.calcsize(LOG_HEADER_FORMAT)
+        body = self._header[:size]
+        fields = struct.unpack(LOG_HEADER_FORMAT, body)
+        valid = (fields[0] == LOG_MAGIC and fields[1] == LOG_VERSION
+                 and int.from_bytes(self._header[size:size + 2], 'little') == crc16(body))
+        for level, (_, entries) in enumerate(LOG_LEVELS):
+            head, count = fields[2 + level * 2], fields[3 + level * 2]
+            if head >= entries or count > entries:
+                valid = False
+            self.heads[level], self.counts[level] = head, count
+
+        opened = [self._empty()]
+        start = 2 + 2 * len(LOG_LEVELS)
+        for level in range(1, len(LOG_LEVELS)):
+            count, pm1, low, pm25, high, pm10 = fields[start:start + 6]
+            start += 6
+            if count >= LOG_SPANS[level - 1]:
+                valid = False
+            opened.append(
+                [count, pm1 * count, low, pm25 * count, high, pm10 * count]
+                if count else self._empty())
+
+        if not valid:
+            self.heads = [0] * len(LOG_LEVELS)
+            self.counts = [0] * len(LOG_LEVELS)
+            return False
+        # The open minute is kept, it was not saved
+        self._open[1:] = opened[1:]
+        return True
+
+    def add(self, pm1, pm25, pm10, now=None):
+        """Add a sample in ug/m3, closing the minute when it is over"""
+        if now is None:
+            now = time.ticks_ms()
+        if self._minute_start is None:
+            self._minute_start = now
+        elif time.ticks_diff(now, self._minute_start) >= LOG_MINUTE_MS:
+            self._close(0)
+            self._minute_start = now
+            if len(self._pending[0]) >= self.batch:
+                self.flush()
+
+        pm25 = min(int(pm25 * 10), 0xFFFF)
+        minute = self._open[0]
+        minute[0] += 1
+        minute[1] += min(int(pm1 * 10), 0xFFFF)
+        minute[2] = min(minute[2], pm25)
+        minute[3] += pm25
+        minute[4] = max(minute[4], pm25)
+        minute[5] += min(int(pm10 * 10), 0xFFFF)
+        self.samples += 1
+
+    def _close(self, level):
+        """Turn the open aggregate of a level into an entry"""
+        agg = self._open[level]
+        self._open[level] = self._empty()
+        if not agg[0]:
+            return
+        entry = self._average(agg)
+        self._pending[level].append(entry)
+        if level + 1 == len(LOG_LEVELS):
+            return
+
+        upper = self._open[level + 1]
+        upper[0] += 1
+        upper[1] += entry[0]
+        upper[2] = min(upper[2], entry[1])
+        upper[3] += entry[2]
+        upper[4] = max(upper[4], entry[3])
+        upper[5] += entry[4]
+        if upper[0] == LOG_SPANS[level]:
+            self._close(level + 1)
+
+    def flush(self):
+        """
+        Write the pending entries, then the header with the open hour and
+        day, to FRAM
+        """
+        if fram is None or not any(self._pending):
+            return False
+        for level, (_, entries) in enumerate(LOG_LEVELS):
+            pending = self._pending[level]
+            while pending:
+                # One burst up to the end of the ring
+                head = self.heads[level]
+                run = min(len(pending), entries - head)
+                for n in range(run):
+                    struct.pack_into(
+                        LOG_ENTRY_FORMAT, self._buffer, n * LOG_ENTRY_SIZE, *pending[n])
+                fram.write_bytes(
+                    self._addresses[level] + head * LOG_ENTRY_SIZE,
+                    memoryview(self._buffer)[:run * LOG_ENTRY_SIZE])
+                del pending[:run]
+                self.heads[level] = (head + run) % entries
+                self.counts[level] = min(self.counts[level] + run, entries)
+                self.entries += run
+                self.bursts += 1
+
+        fields = []
+        for level in range(len(LOG_LEVELS)):
+            fields.extend((self.heads[level], self.counts[level]))
+        for agg in self._open[1:]:
+            fields.append(agg[0])
+            fields.extend(self._average(agg) if agg[0] else (0,) * 5)
+        body = struct.pack(LOG_HEADER_FORMAT, LOG_MAGIC, LOG_VERSION, *fields)
+        fram.write_bytes(LOG_START, body + crc16(body).to_bytes(2, 'little'))
+        self.bursts += 1
+        self.flushes += 1
+        return True
+
+    def history(self, level="minute", chunk=6):
+        """
+        Yield the entries of a level newest first as (pm1, pm25_min,
+        pm25_avg, pm25_max, pm10) in ug/m3, unwritten entries included.
+        Reads chunk entries per burst, entries written while iterating may
+        be skipped or repeated.
+        """
+        if isinstance(level, str):
+            level = [name for name, _ in LOG_LEVELS].index(level)
+        entries = LOG_LEVELS[level][1]
+        for entry in reversed(self._pending[level]):
+            yield tuple(value / 10 for value in entry)
+        if fram is None:
+            return
+
+        buffer = bytearray(chunk * LOG_ENTRY_SIZE)
+        position = self.heads[level]
+        remaining = self.counts[level]
+        while remaining:
+            # Read the entries before position, back to the ring start
+            run = min(remaining, chunk, position or entries)
+            position = (position or entries) - run
+            fram.read_into(
+                self._addresses[level] + position * LOG_ENTRY_SIZE,
+                memoryview(buffer)[:run * LOG_ENTRY_SIZE])
+            for n in range(run - 1, -1, -1):
+                yield tuple(value / 10 for value in struct.unpack_from(
+                    LOG_ENTRY_FORMAT, buffer, n * LOG_ENTRY_SIZE))
+            remaining -= run
+
+    def stats(self):
+        """Return a dict with the entries per level and write counters"""
+        stats = {}
+        for level, (name, _) in enumerate(LOG_LEVELS):
+            stats[name] = self.counts[level] + len(self._pending[level])
+        stats['samples'] = self.samples
+        stats['flushes'] = self.flushes
+        stats['bursts'] = self.bursts
+        stats['entries'] = self.entries
+        return stats
+
+# PM history shared by the states of main.py
+pm_log = PMLog()
+
+def print_pm_history(level="hour"):
+    """Print a level of the PM log as CSV on the serial console, newest first"""
+    print(f"{level}s_ago,pm1,pm25_min,pm25_avg,pm25_max,pm10")
+    for age, entry in enumerate(pm_log.history(level)):
+        print(f"{age}," + ",".join(f"{value:.1f}" for value in entry))
@@ -0,0 +1,59 @@
+"""
+Viper pixel expansion kernels for gc9a01py.
+
+gc9a01py imports this module when it is available and falls back to its
+pure Python kernels when the port has no native code emitter, so the
+functions here must behave exactly like _py_expand_bits and
+_py_expand_indexed in gc9a01py.py.
+"""
+
+# pylint: disable=invalid-name,import-error,undefined-variable
+
+import micropython
+
+
+@micropython.viper
+def expand_bits(
+        src: ptr8, bit: int, count: int, dst: ptr8, index: int,
+        fg: int, bg: int):
+    """
+    Expand count bits of a 1 bit per pixel bitmap starting at bit into
+    big-endian RGB565 fg and bg pixels in dst starting at byte index.
+    """
+    fg_hi = (fg >> 8) & 0xff
+    fg_lo = fg & 0xff
+    bg_hi = (bg >> 8) & 0xff
+    bg_lo = bg & 0xff
+    end = bit + count
+    while bit < end:
+        if src[bit >> 3] & (0x80 >> (bit & 7)):
+            dst[index] = fg_hi
+            dst[index + 1] = fg_lo
+        else:
+            dst[index] = bg_hi
+            dst[index + 1] = bg_lo
+        index += 2
+        bit += 1
+
+
+@micropython.viper
+def expand_indexed(
+        src: ptr8, bit: int, count: int, bpp: int, palette: ptr8,
+        dst: ptr8, index: int):
+    """
+    Expand count pixels of a bpp bits per pixel bitmap starting at bit into
+    dst starting at byte index, looking the colors up in palette, a buffer
+    of big-endian RGB565 colors.
+    """
+    end = index + count * 2
+    while index < end:
+        color = 0
+        n = 0
+        while n < bpp:
+            color = (color << 1) | ((src[bit >> 3] >> (7 - (bit & 7))) & 1)
+            bit += 1
+            n += 1
+        color <<= 1
+        dst[index] = palette[color]
+        dst[index + 1] = palette[color + 1]
+        index += 2
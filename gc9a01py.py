@@ -50,6 +50,11 @@ import time
 from micropython import const
 import ustruct as struct
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ucollections import OrderedDict
+
 # commands
 GC9A01_SWRESET = const(0x01)
 GC9A01_SLPIN = const(0x10)
@@ -82,6 +87,26 @@ _DECODE_PIXEL = ">BBB"
 
 _BUFFER_SIZE = const(256)
 
+# Compressed image files, see res/conevert.py for the layout
+RLE_RGB565 = const(1)
+RLE_PALETTE = const(2)
+
+_RLE_HEADER = ">2sBBHH"
+_RLE_VERSION = const(1)
+_RLE_CHUNK = const(512)
+_RLE_MAX_PACKET = const(257)
+_RLE_DIRECT_RUN = const(16)
+
+# Binary font files, see fonts/font2bitmap.py
+_FONT_HEADER = ">4sBBBBHHI"
+_FONT_MAGIC = b"FNT1"
+
+# Sprite sheet files, see fonts/font2bitmap.py
+SPRITE_RAW = const(0)
+SPRITE_RLE = const(1)
+_SPRITE_HEADER = ">4sBBBBHHH"
+_SPRITE_MAGIC = b"SPR1"
+
 _BIT7 = const(0x80)
 _BIT6 = const(0x40)
 _BIT5 = const(0x20)
@@ -123,6 +148,619 @@ def _encode_pixel(color):
     return struct.pack(_ENCODE_PIXEL, color)
 
 
+def _py_expand_bits(src, bit, count, dst, index, fg, bg):
+    """
+    Expand count bits of a 1 bit per pixel bitmap starting at bit into
+    big-endian RGB565 fg and bg pixels in dst starting at byte index.
+    """
+    fg_hi = (fg & 0xff00) >> 8
+    fg_lo = fg & 0xff
+
+    bg_hi = (bg & 0xff00) >> 8
+    bg_lo = bg & 0xff
+
+    for _ in range(count):
+        if src[bit // 8] & 1 << (7 - (bit % 8)) > 0:
+            dst[index] = fg_hi
+            dst[index + 1] = fg_lo
+        else:
+            dst[index] = bg_hi
+            dst[index + 1] = bg_lo
+
+        index += 2
+        bit += 1
+
+
+def _py_expand_indexed(src, bit, count, bpp, palette, dst, index):
+    """
+    Expand count pixels of a bpp bits per pixel bitmap starting at bit into
+    dst starting at byte index, looking the colors up in palette, a buffer
+    of big-endian RGB565 colors.
+    """
+    for _ in range(count):
+        color = 0
+        for _ in range(bpp):
+            color <<= 1
+            color |= (src[bit // 8] & 1 << (7 - (bit % 8))) > 0
+            bit += 1
+
+        color <<= 1
+        dst[index] = palette[color]
+        dst[index + 1] = palette[color + 1]
+        index += 2
+
+
+def _build_index(char_map):
+    """
+    Build the character index of a font from its MAP, see
+    build_index in fonts/font2bitmap.py.
+
+    Returns:
+        tuple: (INDEX_FIRST, INDEX, INDEX_SPARSE)
+    """
+    indexes = {}
+    for index, char in enumerate(char_map):
+        if ord(char) not in indexes:
+            indexes[ord(char)] = index
+
+    codes = sorted(code for code in indexes if indexes[code] < 255)
+    best_start = best_length = start = 0
+    for n in range(1, len(codes) + 1):
+        if n == len(codes) or codes[n] != codes[n - 1] + 1:
+            if n - start > best_length:
+                best_start, best_length = start, n - start
+            start = n
+
+    first = codes[best_start] if best_length else 0
+    table = bytes(
+        indexes[code] for code in codes[best_start:best_start + best_length])
+    sparse = {}
+    for code in indexes:
+        if not first <= code < first + len(table):
+            sparse[code] = indexes[code]
+
+    return first, memoryview(table), sparse
+
+
+def _char_index(font, character):
+    """
+    Return the index of character in font.MAP. Fonts with an INDEX are
+    looked up directly, older fonts fall back to scanning MAP.
+
+    Raises:
+        ValueError: the font has no glyph for character
+    """
+    table = getattr(font, "INDEX", None)
+    if table is None:
+        return font.MAP.index(character)
+
+    code = ord(character)
+    if 0 <= code - font.INDEX_FIRST < len(table):
+        return table[code - font.INDEX_FIRST]
+
+    index = font.INDEX_SPARSE.get(code)
+    if index is None:
+        raise ValueError(character)
+    return index
+
+
+# Use the viper kernels when the port has a native code emitter
+try:
+    from gc9a01kernels import expand_bits as _expand_bits
+    from gc9a01kernels import expand_indexed as _expand_indexed
+    KERNELS = "viper"
+except (ImportError, SyntaxError, NameError):
+    _expand_bits = _py_expand_bits
+    _expand_indexed = _py_expand_indexed
+    KERNELS = "python"
+
+
+class GlyphCache():
+    """
+    Least recently used cache of rendered RGB565 glyph buffers for
+    GC9A01.write, keyed by (font, character, fg, bg).
+
+    Args:
+        budget (int): maximum number of bytes of glyph buffers to keep
+    """
+
+    def __init__(self, budget=8192):
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._glyphs = OrderedDict()
+
+    def get(self, key):
+        """
+        Return the cached glyph buffer for key or None, marking it as the
+        most recently used.
+
+        Args:
+            key (tuple): (font, character, fg, bg)
+        """
+        glyph = self._glyphs.pop(key, None)
+        if glyph is None:
+            self.misses += 1
+            return None
+
+        self._glyphs[key] = glyph
+        self.hits += 1
+        return glyph
+
+    def put(self, key, glyph):
+        """
+        Add a glyph buffer to the cache, evicting the least recently used
+        glyphs until it fits in the budget. Glyphs larger than the whole
+        budget are not cached.
+
+        Args:
+            key (tuple): (font, character, fg, bg)
+            glyph (bytearray): rendered RGB565 glyph
+        """
+        size = len(glyph)
+        if size > self.budget:
+            return
+
+        while self.used + size > self.budget:
+            oldest = next(iter(self._glyphs))
+            self.used -= len(self._glyphs.pop(oldest))
+            self.evictions += 1
+
+        self._glyphs[key] = glyph
+        self.used += size
+
+    def clear(self):
+        """Drop all cached glyphs, keeping the statistics."""
+        self._glyphs = OrderedDict()
+        self.used = 0
+
+    def stats(self):
+        """
+        Return a dict with the number of glyphs, bytes used, budget, hits,
+        misses and evictions.
+        """
+        return {
+            'glyphs': len(self._glyphs),
+            'used': self.used,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions}
+
+
+class BufferArena():
+    """
+    One buffer reserved at boot that the display driver takes its working
+    buffers from, so drawing does not allocate and free large bytearrays
+    on a fragmenting heap.
+
+    alloc() reserves a slice for the life of the arena, such as the fill
+    buffer. scratch() lends the unreserved space for one operation at a
+    time, such as the band blit_rle expands pixels into, and is reused by
+    the next scratch() call.
+
+    Args:
+        size (int): number of bytes to reserve
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.used = 0
+        self.peak = 0
+        self.overflows = 0
+        self._view = memoryview(bytearray(size))
+
+    def alloc(self, size):
+        """
+        Reserve size bytes, rounded up to a multiple of 4, for the life of
+        the arena.
+
+        Returns:
+            memoryview: the reserved bytes
+
+        Raises:
+            MemoryError: the arena has less than size bytes left
+        """
+        start = self.used
+        end = start + ((size + 3) & ~3)
+        if end > self.size:
+            raise MemoryError(
+                "Arena has %d of %d bytes left" % (self.size - start, size))
+
+        self.used = end
+        self.peak = max(self.peak, end)
+        return self._view[start:start + size]
+
+    def scratch(self, size):
+        """
+        Return size bytes of the unreserved space, valid until the next
+        call to scratch or alloc, or None when they do not fit.
+
+        Args:
+            size (int): number of bytes needed
+        """
+        end = self.used + size
+        if end > self.size:
+            self.overflows += 1
+            return None
+
+        self.peak = max(self.peak, end)
+        return self._view[self.used:end]
+
+    def stats(self):
+        """
+        Return a dict with the arena size, bytes reserved, the most bytes
+        in use at once and the number of scratch requests that did not fit.
+        """
+        return {
+            'size': self.size,
+            'used': self.used,
+            'peak': self.peak,
+            'overflows': self.overflows}
+
+
+class _LazyBitmaps():
+    """
+    Read only BITMAPS of a BinaryFont, read from the font file a page at a
+    time when indexed.
+    """
+
+    def __init__(self, file, start, size, page_size):
+        self._file = file
+        self._start = start
+        self._size = size
+        self._page = bytearray(page_size)
+        self._page_start = 0
+        self._page_len = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if not 0 <= index - self._page_start < self._page_len:
+            self._file.seek(self._start + index)
+            self._page_start = index
+            self._page_len = self._file.readinto(self._page) or 0
+
+        return self._page[index - self._page_start]
+
+
+class BinaryFont():
+    """
+    Converted true-type font read from a binary file written by
+    fonts/font2bitmap.py --binary. MAP, WIDTHS and OFFSETS are loaded into
+    RAM while the glyph bitmaps stay in flash and are read when drawn.
+
+    Has the MAP, BPP, HEIGHT, MAX_WIDTH, OFFSET_WIDTH, WIDTHS, OFFSETS,
+    BITMAPS and INDEX attributes of a font module, so it can be used
+    anywhere a font module can. The character index is built from MAP
+    when the font is opened.
+
+    Args:
+        path (str): name of the binary font file
+        page_size (int): number of bytes BITMAPS reads from the file at a
+            time
+    """
+
+    def __init__(self, path, page_size=64):
+        self._file = open(path, "rb")
+        (magic, self.BPP, self.HEIGHT, self.MAX_WIDTH, self.OFFSET_WIDTH,
+         count, map_size, bitmap_size) = struct.unpack(
+             _FONT_HEADER, self._file.read(struct.calcsize(_FONT_HEADER)))
+
+        if magic != _FONT_MAGIC:
+            self._file.close()
+            raise ValueError("Unsupported font file: " + path)
+
+        self.MAP = self._file.read(map_size).decode("utf-8")
+        self.WIDTHS = memoryview(self._file.read(count))
+        self.OFFSETS = memoryview(self._file.read(count * self.OFFSET_WIDTH))
+        self.INDEX_FIRST, self.INDEX, self.INDEX_SPARSE = _build_index(
+            self.MAP)
+        self._bitmap_start = self._file.tell()
+        self.BITMAPS = _LazyBitmaps(
+            self._file, self._bitmap_start, bitmap_size, page_size)
+        self._glyph = bytearray(
+            (self.MAX_WIDTH * self.HEIGHT * self.BPP + 7) // 8 + 1)
+
+    def load_bits(self, bit, count):
+        """
+        Read the bytes holding count bits of the bitmap starting at bit.
+        The returned buffer is reused by the next call.
+
+        Args:
+            bit (int): offset of the first bit in BITMAPS
+            count (int): number of bits, at most MAX_WIDTH * HEIGHT * BPP
+
+        Returns:
+            tuple: (buffer, offset of the first bit in buffer)
+        """
+        first = bit // 8
+        view = memoryview(self._glyph)[:(bit + count + 7) // 8 - first]
+        self._file.seek(self._bitmap_start + first)
+        self._file.readinto(view)
+        return view, bit - first * 8
+
+    def close(self):
+        """Close the font file."""
+        self._file.close()
+
+
+class SpriteFont():
+    """
+    Characters of a font pre-rendered as RGB565 sprites in a few fixed
+    colors by fonts/font2bitmap.py --sprites. Sprites are read from flash
+    straight into a display buffer, so drawing them needs no bit expansion.
+
+    Has the MAP, HEIGHT, MAX_WIDTH, WIDTHS and INDEX attributes of a font,
+    the sprite colors in COLORS and their background color in BG.
+
+    Args:
+        path (str): name of the sprite sheet file
+        font (font): font the sprites were rendered from, optional, to
+            check that the sheet matches it
+
+    Raises:
+        ValueError: the file is not a sprite sheet, or its HEIGHT differs
+            from the font
+    """
+
+    def __init__(self, path, font=None):
+        self._file = open(path, "rb")
+        (magic, self.FORMAT, self.HEIGHT, self.MAX_WIDTH, colors, count,
+         map_size, self.BG) = struct.unpack(
+             _SPRITE_HEADER, self._file.read(struct.calcsize(_SPRITE_HEADER)))
+
+        if magic != _SPRITE_MAGIC or self.FORMAT not in (SPRITE_RAW, SPRITE_RLE):
+            self._file.close()
+            raise ValueError("Unsupported sprite file: " + path)
+
+        if font is not None and font.HEIGHT != self.HEIGHT:
+            self._file.close()
+            raise ValueError("Sprite file %s is %d rows high, its font %d" % (
+                path, self.HEIGHT, font.HEIGHT))
+
+        self.COLORS = struct.unpack(">%dH" % colors, self._file.read(colors * 2))
+        self.MAP = self._file.read(map_size).decode("utf-8")
+        self.WIDTHS = memoryview(self._file.read(count))
+        self.INDEX_FIRST, self.INDEX, self.INDEX_SPARSE = _build_index(
+            self.MAP)
+        self._offsets = memoryview(self._file.read((colors * count + 1) * 4))
+        self._data_start = self._file.tell()
+        self._patterns = {}
+
+        self._packets = None
+        if self.FORMAT == SPRITE_RLE:
+            largest = 0
+            for sprite in range(colors * count):
+                start, end = struct.unpack_from(">II", self._offsets, sprite * 4)
+                largest = max(largest, end - start)
+            self._packets = bytearray(largest)
+
+    def has(self, fg, bg):
+        """Return True when the sheet has sprites for fg on bg."""
+        return bg == self.BG and fg in self.COLORS
+
+    def draw(self, char_index, fg, buffer, index=0, stride=0):
+        """
+        Copy the sprite of a character in color fg into buffer.
+
+        Args:
+            char_index (int): index of the character in MAP
+            fg (int): one of COLORS
+            buffer (bytearray): destination buffer
+            index (int): byte offset of the sprite in buffer
+            stride (int): bytes from one buffer row to the next, defaults to
+                the sprite width
+        """
+        width = self.WIDTHS[char_index] * 2
+        stride = stride or width
+        sprite = self.COLORS.index(fg) * len(self.WIDTHS) + char_index
+        start, end = struct.unpack_from(">II", self._offsets, sprite * 4)
+        self._file.seek(self._data_start + start)
+        view = memoryview(buffer)
+
+        if self.FORMAT == SPRITE_RAW:
+            if stride == width:
+                self._file.readinto(view[index:index + width * self.HEIGHT])
+                return
+            for _ in range(self.HEIGHT):
+                self._file.readinto(view[index:index + width])
+                index += stride
+            return
+
+        packets = memoryview(self._packets)[:end - start]
+        self._file.readinto(packets)
+        idx = column = 0
+        while idx < len(packets):
+            control = packets[idx]
+            count = ((control & 0x7f) + 1) * 2
+            if control & 0x80:
+                src = self._pattern(packets[idx + 1], packets[idx + 2])
+                idx += 3
+            else:
+                src = packets[idx + 1:idx + 1 + count]
+                idx += count + 1
+
+            pos = 0
+            while pos < count:
+                step = min(count - pos, width - column)
+                view[index + column:index + column + step] = src[pos:pos + step]
+                pos += step
+                column += step
+                if column == width:
+                    column = 0
+                    index += stride
+
+    def _pattern(self, hi, lo):
+        """Return a row of the RGB565 color hi, lo for run packets."""
+        color = hi << 8 | lo
+        pattern = self._patterns.get(color)
+        if pattern is None:
+            pattern = bytes((hi, lo)) * max(self.MAX_WIDTH, 128)
+            self._patterns[color] = pattern
+        return pattern
+
+    def close(self):
+        """Close the sprite sheet file."""
+        self._file.close()
+
+
+class DigitDisplay():
+    """
+    Fixed layout text field, such as a numeric readout, that only redraws
+    the characters that changed since the last update.
+
+    Every character is drawn centered in a cell as wide as the widest of
+    `chars` in the font, composited with the background in a single window
+    transfer, so there is no need to clear the field first.
+
+    Args:
+        display (GC9A01): display to draw on
+        font (font): The module containing the converted true-type font
+        x (int): column of the left edge of the field
+        y (int): row of the top edge of the field
+        length (int): number of character cells
+        chars (str): characters the field may show, used to size the cells
+        bg (int): background color, optional, defaults to BLACK
+        sprites (SpriteFont): sprites of the font, optional. Characters
+            are copied from them when they have the color, instead of being
+            rendered from the font.
+
+    Raises:
+        ValueError: the sprites are not as high as the font
+    """
+
+    def __init__(
+            self, display, font, x, y, length, chars="0123456789", bg=BLACK,
+            sprites=None):
+        if sprites is not None and sprites.HEIGHT != font.HEIGHT:
+            raise ValueError("Sprites are %d rows high, the font %d" % (
+                sprites.HEIGHT, font.HEIGHT))
+
+        self.display = display
+        self.font = font
+        self.sprites = sprites
+        self.x = x
+        self.y = y
+        self.length = length
+        self.bg = bg
+        self.cell_width = max(
+            font.WIDTHS[_char_index(font, char)]
+            for char in chars if char in font.MAP)
+        self.width = self.cell_width * length
+        self.height = font.HEIGHT
+        self._text = None
+        self._fg = None
+
+    def update(self, text, fg=WHITE):
+        """
+        Show text in the field, redrawing only the cells whose character
+        changed. All cells are redrawn when the color changes. Text shorter
+        than the field is right aligned.
+
+        Args:
+            text (str): text to show, at most length characters
+            fg (int): foreground color, optional, defaults to WHITE
+
+        Returns:
+            int: number of cells redrawn
+
+        Raises:
+            ValueError: text is longer than the field
+        """
+        if len(text) > self.length:
+            raise ValueError("%r does not fit in %d cells" % (text, self.length))
+        text = " " * (self.length - len(text)) + text
+        old = self._text if fg == self._fg else None
+        drawn = 0
+        with self.display.batch():
+            for cell, char in enumerate(text):
+                if old is None or old[cell] != char:
+                    self._draw_cell(cell, char, fg)
+                    drawn += 1
+
+        self._text = text
+        self._fg = fg
+        return drawn
+
+    def invalidate(self):
+        """Force the next update to redraw every cell."""
+        self._text = None
+
+    def _draw_cell(self, cell, char, fg):
+        """Compose a cell with its background and send it in one window."""
+        display = self.display
+        font = self.font
+        stride = self.cell_width * 2
+        size = stride * font.HEIGHT
+        buffer = display._band(size)
+
+        try:
+            char_index = _char_index(font, char)
+            char_width = font.WIDTHS[char_index]
+        except ValueError:
+            char_index = None
+            char_width = 0
+
+        # glyphs as wide as the cell cover the whole background
+        if char_width < self.cell_width:
+            pattern = display._fill_pattern(self.bg)
+            filled = 0
+            while filled < size:
+                step = min(len(pattern), size - filled)
+                buffer[filled:filled + step] = pattern[:step]
+                filled += step
+
+        sprites = self.sprites
+        sprite_index = None
+        if sprites is not None and sprites.has(fg, self.bg):
+            try:
+                sprite_index = _char_index(sprites, char)
+            except ValueError:
+                pass
+            if (sprite_index is not None
+                    and sprites.WIDTHS[sprite_index] != char_width):
+                sprite_index = None
+
+        if char_index is not None:
+            index = (self.cell_width - char_width) // 2 * 2
+            if sprite_index is not None:
+                sprites.draw(sprite_index, fg, buffer, index, stride)
+            elif display.glyph_cache is None:
+                display._render_glyph(
+                    font, char_index, fg, self.bg, buffer, index, stride)
+            else:
+                glyph = memoryview(display._cached_glyph(
+                    font, char, char_index, fg, self.bg))
+                row_bytes = char_width * 2
+                for src in range(0, row_bytes * font.HEIGHT, row_bytes):
+                    buffer[index:index + row_bytes] = glyph[src:src + row_bytes]
+                    index += stride
+
+        display.blit_buffer(
+            buffer, self.x + cell * self.cell_width, self.y,
+            self.cell_width, font.HEIGHT)
+
+
+class _Batch():
+    """Context manager returned by GC9A01.batch."""
+
+    def __init__(self, display):
+        self._display = display
+
+    def __enter__(self):
+        self._display._begin()
+        self._display._batch += 1
+        return self._display
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._display._batch -= 1
+        self._display._end()
+
+
 class GC9A01():
     """
     GC9A01 driver class
@@ -134,6 +772,11 @@ class GC9A01():
         reset (pin): reset pin
         backlight(pin): backlight pin
         rotation (int): display rotation
+        glyph_cache (GlyphCache): optional cache of glyphs rendered by write
+        arena (BufferArena): optional buffer that the fill buffer and the
+            band buffer are taken from instead of the heap
+        fill_buffer_size (int): bytes in the buffer used for solid fills
+        circular (bool): clip fills and blit_buffer to the round panel
     """
 
     def __init__(
@@ -143,7 +786,11 @@ class GC9A01():
             cs=None,
             reset=None,
             backlight=None,
-            rotation=0):
+            rotation=0,
+            glyph_cache=None,
+            arena=None,
+            fill_buffer_size=4096,
+            circular=False):
         """
         Initialize display.
         """
@@ -161,6 +808,21 @@ class GC9A01():
         self.cs = cs
         self.backlight = backlight
         self._rotation = rotation % 8
+        self._band_buffer = None
+        self.arena = arena
+        self.glyph_cache = glyph_cache
+        self.commands = 0
+        self.transactions = 0
+        self._batch = 0
+        self._batcher = _Batch(self)
+        self._command = bytearray(1)
+        self._position = bytearray(4)
+        self._columns = None
+        self._rows = None
+        self.set_fill_buffer(fill_buffer_size)
+        self._row_spans = None
+        self._span_bands = None
+        self.set_circular(circular)
 
         self.hard_reset()
         time.sleep_ms(100)
@@ -236,20 +898,46 @@ class GC9A01():
         if backlight is not None:
             backlight.value(1)
 
+    def _begin(self):
+        """Select the display unless a batch already holds it selected."""
+        if not self._batch:
+            self.transactions += 1
+            if self.cs:
+                self.cs.off()
+
+    def _end(self):
+        """Deselect the display unless a batch holds it selected."""
+        if not self._batch and self.cs:
+            self.cs.on()
+
     def _write(self, command=None, data=None):
         """SPI write to the device: commands and data."""
-        if self.cs:
-            self.cs.off()
+        self._begin()
 
         if command is not None:
+            self.commands += 1
             self.dc.off()
-            self.spi.write(bytes([command]))
+            self._command[0] = command
+            self.spi.write(self._command)
         if data is not None:
             self.dc.on()
             self.spi.write(data)
 
-        if self.cs:
-            self.cs.on()
+        self._end()
+
+    def batch(self):
+        """
+        Return a context manager that keeps the display selected across all
+        the writes made inside it, so they go out as one SPI transaction.
+        Batches may be nested.
+
+        Example:
+
+            with tft.batch():
+                tft.rect(10, 10, 100, 50, gc9a01.RED)
+                tft.write(font, "Hello", 20, 20)
+        """
+        return self._batcher
 
     def hard_reset(self):
         """Hard reset display."""
@@ -267,9 +955,14 @@ class GC9A01():
             if self.cs:
                 self.cs.on()
 
+            self._columns = None
+            self._rows = None
+
     def soft_reset(self):
         """Soft reset display."""
         self._write(GC9A01_SWRESET)
+        self._columns = None
+        self._rows = None
         time.sleep_ms(150)
 
     def sleep_mode(self, value):
@@ -318,30 +1011,36 @@ class GC9A01():
 
         self._rotation = rotation % 8
         self._write(GC9A01_MADCTL, bytes([ROTATIONS[self._rotation]]))
+        self._columns = None
+        self._rows = None
 
     def _set_columns(self, start, end):
         """
-        Send CASET (column address set) command to display.
+        Send CASET (column address set) command to display unless the
+        columns are already set.
 
         Args:
             start (int): column start address
             end (int): column end address
         """
-        if start <= end <= self.width:
-            self._write(GC9A01_CASET, _encode_pos(
-                start, end))
+        if start <= end <= self.width and self._columns != (start, end):
+            self._columns = (start, end)
+            struct.pack_into(_ENCODE_POS, self._position, 0, start, end)
+            self._write(GC9A01_CASET, self._position)
 
     def _set_rows(self, start, end):
         """
-        Send RASET (row address set) command to display.
+        Send RASET (row address set) command to display unless the rows are
+        already set.
 
         Args:
             start (int): row start address
             end (int): row end address
        """
-        if start <= end <= self.height:
-            self._write(GC9A01_RASET, _encode_pos(
-                start, end))
+        if start <= end <= self.height and self._rows != (start, end):
+            self._rows = (start, end)
+            struct.pack_into(_ENCODE_POS, self._position, 0, start, end)
+            self._write(GC9A01_RASET, self._position)
 
     def _set_window(self, x0, y0, x1, y1):
         """
@@ -404,9 +1103,188 @@ class GC9A01():
             width (int): Width
             height (int): Height
         """
+        if self.circular and not self._visible(x, y, width, height):
+            self._blit_spans(buffer, x, y, width, height)
+            return
+
         self._set_window(x, y, x + width - 1, y + height - 1)
         self._write(None, buffer)
 
+    def _band(self, size):
+        """
+        Return a memoryview of at least `size` bytes from the reusable band
+        buffer, growing the buffer if it is too small. With an arena the
+        band is its scratch space, and the heap is only used when that is
+        too small.
+
+        Args:
+            size (int): number of bytes needed
+        """
+        if self.arena is not None:
+            band = self.arena.scratch(size)
+            if band is not None:
+                return band
+
+        if self._band_buffer is None or len(self._band_buffer) < size:
+            self._band_buffer = None
+            self._band_buffer = bytearray(size)
+        return memoryview(self._band_buffer)[:size]
+
+    def blit_file(self, path, x, y, width, height, band_rows=8):
+        """
+        Stream a raw RGB565 file to the display at the given location.
+
+        The window is set once and the file is read in bands of `band_rows`
+        rows into a single reusable buffer, so memory use stays at
+        width * band_rows * 2 bytes regardless of the image size.
+
+        Args:
+            path (str): name of the file containing big-endian RGB565 pixels
+            x (int): Top left corner x coordinate
+            y (int): Top left corner y coordinate
+            width (int): Width
+            height (int): Height
+            band_rows (int): number of rows read and sent per SPI write
+        """
+        band = self._band(width * 2 * min(band_rows, height))
+        remaining = width * height * 2
+        with open(path, "rb") as f:
+            with self.batch():
+                self._set_window(x, y, x + width - 1, y + height - 1)
+                self.dc.on()
+                while remaining:
+                    chunk = band if remaining >= len(band) else band[:remaining]
+                    read = f.readinto(chunk)
+                    if not read:
+                        break
+                    self.spi.write(chunk[:read])
+                    remaining -= read
+
+    def blit_rle(self, path, x, y, band_rows=8):
+        """
+        Decode a run-length compressed image file straight to the display at
+        the given location. The image size is read from the file header.
+
+        Pixels are expanded into a band of `band_rows` rows that is sent when
+        full. Runs of at least _RLE_DIRECT_RUN pixels are written from a
+        repeated color pattern (see _fill_pattern) instead of being
+        expanded.
+
+        Args:
+            path (str or file): name of the file written by res/conevert.py,
+                or an open file positioned at the start of an image, such as
+                an assets.AssetPack
+            x (int): Top left corner x coordinate
+            y (int): Top left corner y coordinate
+            band_rows (int): number of rows expanded per SPI write
+
+        Returns:
+            tuple: (width, height) of the image
+        """
+        if not isinstance(path, str):
+            return self._blit_rle(path, x, y, band_rows, "open file")
+
+        with open(path, "rb") as f:
+            return self._blit_rle(f, x, y, band_rows, path)
+
+    def _blit_rle(self, f, x, y, band_rows, name):
+        """Decode the image at the position of file f, see blit_rle."""
+        magic, version, fmt, width, height = struct.unpack(
+            _RLE_HEADER, f.read(struct.calcsize(_RLE_HEADER)))
+
+        if (magic != b"RL" or version != _RLE_VERSION
+                or fmt not in (RLE_RGB565, RLE_PALETTE)):
+            raise ValueError("Unsupported image file: " + name)
+
+        palette = None
+        if fmt == RLE_PALETTE:
+            palette = f.read((f.read(1)[0] or 256) * 2)
+
+        out_size = width * 2 * min(band_rows, height)
+        band = self._band(out_size + _RLE_CHUNK)
+        out = band[:out_size]
+        src = band[out_size:]
+
+        with self.batch():
+            self._set_window(x, y, x + width - 1, y + height - 1)
+            self.dc.on()
+            pixels = width * height
+            pos = idx = avail = 0
+            eof = False
+            while pixels > 0:
+                if avail - idx < _RLE_MAX_PACKET and not eof:
+                    # Move the unread bytes to the front in place, copying
+                    # forward so the overlap is safe without a temporary
+                    remain = avail - idx
+                    for i in range(remain):
+                        src[i] = src[idx + i]
+                    read = f.readinto(src[remain:])
+                    eof = not read
+                    idx = 0
+                    avail = remain + (read or 0)
+                if idx >= avail:
+                    break
+
+                control = src[idx]
+                idx += 1
+                count = (control & 0x7f) + 1
+                pixels -= count
+
+                if control & 0x80:
+                    if palette is None:
+                        hi = src[idx]
+                        lo = src[idx + 1]
+                        idx += 2
+                    else:
+                        value = src[idx] * 2
+                        hi = palette[value]
+                        lo = palette[value + 1]
+                        idx += 1
+
+                    if count >= _RLE_DIRECT_RUN:
+                        if pos:
+                            self.spi.write(out[:pos])
+                            pos = 0
+                        self.spi.write(
+                            self._fill_pattern(hi << 8 | lo)[:count * 2])
+                        continue
+
+                    for _ in range(count):
+                        out[pos] = hi
+                        out[pos + 1] = lo
+                        pos += 2
+                        if pos == out_size:
+                            self.spi.write(out)
+                            pos = 0
+
+                elif palette is None:
+                    count *= 2
+                    while count:
+                        step = min(count, out_size - pos)
+                        out[pos:pos + step] = src[idx:idx + step]
+                        idx += step
+                        pos += step
+                        count -= step
+                        if pos == out_size:
+                            self.spi.write(out)
+                            pos = 0
+
+                else:
+                    for _ in range(count):
+                        value = src[idx] * 2
+                        idx += 1
+                        out[pos] = palette[value]
+                        out[pos + 1] = palette[value + 1]
+                        pos += 2
+                        if pos == out_size:
+                            self.spi.write(out)
+                            pos = 0
+
+            if pos:
+                self.spi.write(out[:pos])
+
+        return width, height
+
     def rect(self, x, y, w, h, color):
         """
         Draw a rectangle at the given location, size and color.
@@ -418,10 +1296,53 @@ class GC9A01():
             height (int): Height in pixels
             color (int): 565 encoded color
         """
-        self.hline(x, y, w, color)
-        self.vline(x, y, h, color)
-        self.vline(x + w - 1, y, h, color)
-        self.hline(x, y + h - 1, w, color)
+        with self.batch():
+            self.hline(x, y, w, color)
+            self.vline(x, y, h, color)
+            self.vline(x + w - 1, y, h, color)
+            self.hline(x, y + h - 1, w, color)
+
+    def set_fill_buffer(self, size):
+        """
+        Set the size of the buffer used by fill_rect and fill. Larger
+        buffers need fewer SPI writes per fill, smaller ones leave more free
+        RAM.
+
+        With an arena the buffer is reserved from it, and the arena space
+        of a previous fill buffer is not given back.
+
+        Args:
+            size (int): buffer size in bytes, rounded down to whole pixels
+                with a minimum of _BUFFER_SIZE pixels
+        """
+        size = max(size & ~1, _BUFFER_SIZE * 2)
+        self._fill_view = None
+        if self.arena is not None:
+            self._fill_view = self.arena.alloc(size)
+        else:
+            self._fill_view = memoryview(bytearray(size))
+        self._fill_color = None
+
+    def _fill_pattern(self, color):
+        """
+        Return a memoryview of the fill buffer filled with color. The buffer
+        is only refilled when the color differs from the previous call.
+
+        Args:
+            color (int): 565 encoded color
+        """
+        if self._fill_color != color:
+            pattern = self._fill_view
+            pattern[0] = color >> 8
+            pattern[1] = color & 0xff
+            filled = 2
+            while filled < len(pattern):
+                step = min(filled, len(pattern) - filled)
+                pattern[filled:filled + step] = pattern[:step]
+                filled += step
+            self._fill_color = color
+
+        return self._fill_view
 
     def fill_rect(self, x, y, width, height, color):
         """
@@ -434,16 +1355,148 @@ class GC9A01():
             height (int): Height in pixels
             color (int): 565 encoded color
         """
-        self._set_window(x, y, x + width - 1, y + height - 1)
-        chunks, rest = divmod(width * height, _BUFFER_SIZE)
-        pixel = _encode_pixel(color)
+        if self.circular and not self._visible(x, y, width, height):
+            self._fill_spans(x, y, width, height, color)
+            return
+
+        with self.batch():
+            self._set_window(x, y, x + width - 1, y + height - 1)
+            self._stream_fill(color, width * height * 2)
+
+    def _stream_fill(self, color, remaining):
+        """
+        Send remaining bytes of color to the current window from the fill
+        buffer.
+
+        Args:
+            color (int): 565 encoded color
+            remaining (int): number of bytes to send
+        """
+        pattern = self._fill_pattern(color)
+        chunk = len(pattern)
         self.dc.on()
-        if chunks:
-            data = pixel * _BUFFER_SIZE
-            for _ in range(chunks):
-                self._write(None, data)
-        if rest:
-            self._write(None, pixel * rest)
+        while remaining >= chunk:
+            self.spi.write(pattern)
+            remaining -= chunk
+        if remaining > 0:
+            self.spi.write(pattern[:remaining])
+
+    def set_circular(self, enabled):
+        """
+        Enable or disable clipping of fills and blit_buffer to the round
+        visible area of the panel. When enabled only the pixels inside the
+        circle inscribed in the display are sent.
+
+        Args:
+            enabled (bool): if True clip to the visible circle
+        """
+        self.circular = enabled
+        if enabled and self._row_spans is None:
+            self._build_spans()
+
+    def _build_spans(self):
+        """
+        Build the per-row table of visible [x_start, x_end] columns and the
+        list of (y_start, y_end, x_start, x_end) bands of consecutive rows
+        with the same span.
+        """
+        diameter = min(self.width, self.height)
+        limit = diameter * diameter
+        spans = bytearray(self.height * 2)
+        bands = []
+        for row in range(self.height):
+            # work in half pixels so the circle is centered between pixels
+            dy = 2 * row + 1 - diameter
+            left = right = 0
+            if dy * dy <= limit:
+                dx = int((limit - dy * dy) ** 0.5)
+                while (dx + 1) * (dx + 1) + dy * dy <= limit:
+                    dx += 1
+                while dx * dx + dy * dy > limit:
+                    dx -= 1
+                left = (diameter - dx) // 2
+                right = (diameter - 1 + dx) // 2
+
+            spans[row * 2] = left
+            spans[row * 2 + 1] = right
+            if bands and bands[-1][2] == left and bands[-1][3] == right:
+                bands[-1][1] = row
+            else:
+                bands.append([row, row, left, right])
+
+        self._row_spans = spans
+        self._span_bands = [tuple(band) for band in bands]
+
+    def _visible(self, x, y, width, height):
+        """
+        Return True if the rectangle lies completely inside the visible
+        circle.
+        """
+        spans = self._row_spans
+        for row in (y, y + height - 1):
+            if (row < 0 or row >= self.height
+                    or x < spans[row * 2]
+                    or x + width - 1 > spans[row * 2 + 1]):
+                return False
+
+        return True
+
+    def _fill_spans(self, x, y, width, height, color):
+        """
+        Fill the part of a rectangle that is inside the visible circle, one
+        window per run of consecutive rows with the same clipped span.
+        """
+        right_edge = x + width - 1
+        bottom_edge = y + height - 1
+        window = None
+        with self.batch():
+            for top, bottom, left, right in self._span_bands:
+                if top > bottom_edge:
+                    break
+
+                top = max(top, y)
+                bottom = min(bottom, bottom_edge)
+                left = max(left, x)
+                right = min(right, right_edge)
+                if top > bottom or left > right:
+                    continue
+
+                # bands clipped to the same columns share one window
+                if (window is not None and window[1] == top - 1
+                        and window[2] == left and window[3] == right):
+                    window[1] = bottom
+                    continue
+
+                if window is not None:
+                    self._fill_window(window, color)
+                window = [top, bottom, left, right]
+
+            if window is not None:
+                self._fill_window(window, color)
+
+    def _fill_window(self, window, color):
+        """Fill a [top, bottom, left, right] window with color."""
+        top, bottom, left, right = window
+        self._set_window(left, top, right, bottom)
+        self._stream_fill(color, (right - left + 1) * (bottom - top + 1) * 2)
+
+    def _blit_spans(self, buffer, x, y, width, height):
+        """
+        Copy the rows of buffer that are inside the visible circle to the
+        display, one window per row.
+        """
+        view = memoryview(buffer)
+        spans = self._row_spans
+        with self.batch():
+            for row in range(max(y, 0), min(y + height, self.height)):
+                left = max(spans[row * 2], x)
+                right = min(spans[row * 2 + 1], x + width - 1)
+                if left > right:
+                    continue
+
+                start = ((row - y) * width + left - x) * 2
+                self._set_window(left, row, right, row)
+                self._write(None, view[start:start + (right - left + 1) * 2])
 
     def fill(self, color):
         """
@@ -479,16 +1532,17 @@ class GC9A01():
             ystep = 1
         else:
             ystep = -1
-        while x0 <= x1:
-            if steep:
-                self.pixel(y0, x0, color)
-            else:
-                self.pixel(x0, y0, color)
-            err -= dy
-            if err < 0:
-                y0 += ystep
-                err += dx
-            x0 += 1
+        with self.batch():
+            while x0 <= x1:
+                if steep:
+                    self.pixel(y0, x0, color)
+                else:
+                    self.pixel(x0, y0, color)
+                err -= dy
+                if err < 0:
+                    y0 += ystep
+                    err += dx
+                x0 += 1
 
     def vscrdef(self, tfa, vsa, bfa):
         """
@@ -811,10 +1865,11 @@ class GC9A01():
             color (int): 565 encoded color to use for characters
             background (int): 565 encoded color to use for background
         """
-        if font.WIDTH == 8:
-            self._text8(font, text, x0, y0, color, background)
-        else:
-            self._text16(font, text, x0, y0, color, background)
+        with self.batch():
+            if font.WIDTH == 8:
+                self._text8(font, text, x0, y0, color, background)
+            else:
+                self._text16(font, text, x0, y0, color, background)
 
     def bitmap(self, bitmap, x, y, index=0):
         """
@@ -829,30 +1884,110 @@ class GC9A01():
 
         """
         bitmap_size = bitmap.HEIGHT * bitmap.WIDTH
-        buffer_len = bitmap_size * 2
-        buffer = bytearray(buffer_len)
+        buffer = self._band(bitmap_size * 2)
         bs_bit = bitmap.BPP * bitmap_size * index if index > 0 else 0
 
-        for i in range(0, buffer_len, 2):
-            color_index = 0
-            for bit in range(bitmap.BPP):
-                color_index <<= 1
-                color_index |= (bitmap.BITMAP[bs_bit // 8]
-                                & 1 << (7 - (bs_bit % 8))) > 0
-                bs_bit += 1
+        # PALETTE holds byte swapped 565 colors, see res/imgtobitmap.py
+        palette = bytearray(len(bitmap.PALETTE) * 2)
+        for i, color in enumerate(bitmap.PALETTE):
+            palette[i * 2] = color & 0xff
+            palette[i * 2 + 1] = color >> 8
 
-            color = bitmap.PALETTE[color_index]
-            buffer[i] = color & 0xff00 >> 8
-            buffer[i + 1] = color_index & 0xff
+        _expand_indexed(
+            bitmap.BITMAP, bs_bit, bitmap_size, bitmap.BPP, palette, buffer, 0)
 
         self.blit_buffer(buffer, x, y, bitmap.WIDTH, bitmap.HEIGHT)
 
+    def _glyph_offset(self, font, char_index):
+        """
+        Return the bit offset of a glyph in font.BITMAPS.
+
+        Args:
+            font (font): The module containing the converted true-type font
+            char_index (int): index of the character in font.MAP
+        """
+        offset = char_index * font.OFFSET_WIDTH
+        bs_bit = font.OFFSETS[offset]
+        if font.OFFSET_WIDTH > 1:
+            bs_bit = (bs_bit << 8) + font.OFFSETS[offset + 1]
+
+        if font.OFFSET_WIDTH > 2:
+            bs_bit = (bs_bit << 8) + font.OFFSETS[offset + 2]
+
+        return bs_bit
+
+    def _render_glyph(
+            self, font, char_index, fg, bg, buffer,
+            index=0, stride=0, row=0, rows=0):
+        """
+        Expand rows of a glyph of a converted true-type font into RGB565
+        pixels. By default the whole glyph is expanded into the start of
+        buffer.
+
+        Args:
+            font (font): The module containing the converted true-type font
+            char_index (int): index of the character in font.MAP
+            fg (int): foreground color
+            bg (int): background color
+            buffer (bytearray): buffer to receive the pixels
+            index (int): byte index in buffer of the first pixel
+            stride (int): bytes between rows in buffer, defaults to the
+                glyph width
+            row (int): first glyph row to expand
+            rows (int): number of rows to expand, defaults to the rest of
+                the glyph
+        """
+        char_width = font.WIDTHS[char_index]
+        stride = stride or char_width * 2
+        rows = rows or font.HEIGHT - row
+        bs_bit = self._glyph_offset(font, char_index) + row * char_width
+
+        # fonts that keep their bitmaps in flash load just the needed bits
+        bitmaps = font.BITMAPS
+        if hasattr(font, "load_bits"):
+            bitmaps, bs_bit = font.load_bits(bs_bit, char_width * rows)
+
+        if stride == char_width * 2:
+            _expand_bits(
+                bitmaps, bs_bit, char_width * rows, buffer, index, fg, bg)
+            return
+
+        for _ in range(rows):
+            _expand_bits(
+                bitmaps, bs_bit, char_width, buffer, index, fg, bg)
+            bs_bit += char_width
+            index += stride
+
+    def _cached_glyph(self, font, character, char_index, fg, bg):
+        """
+        Return the rendered glyph for a character from the glyph cache,
+        rendering and adding it if it is not cached yet.
+
+        Args:
+            font (font): The module containing the converted true-type font
+            character (str): the character
+            char_index (int): index of the character in font.MAP
+            fg (int): foreground color
+            bg (int): background color
+        """
+        key = (font, character, fg, bg)
+        glyph = self.glyph_cache.get(key)
+        if glyph is None:
+            glyph = bytearray(font.WIDTHS[char_index] * font.HEIGHT * 2)
+            self._render_glyph(font, char_index, fg, bg, glyph)
+            self.glyph_cache.put(key, glyph)
+
+        return glyph
+
     # @micropython.native
     def write(self, font, string, x, y, fg=WHITE, bg=BLACK):
         """
         Write a string using a converted true-type font on the display starting
         at the specified column and row
 
+        When the display has a glyph_cache, rendered glyphs are taken from and
+        added to the cache instead of being expanded on every call.
+
         Args:
             font (font): The module containing the converted true-type font
             s (string): The string to write
@@ -860,49 +1995,113 @@ class GC9A01():
             y (int): row to start writing
             fg (int): foreground color, optional, defaults to WHITE
             bg (int): background color, optional, defaults to BLACK
+
+        Returns:
+            int: number of display commands sent
         """
-        buffer_len = font.HEIGHT * font.MAX_WIDTH * 2
-        buffer = bytearray(buffer_len)
-        fg_hi = (fg & 0xff00) >> 8
-        fg_lo = fg & 0xff
+        commands = self.commands
+
+        with self.batch():
+            for character in string:
+                try:
+                    char_index = _char_index(font, character)
+                    char_width = font.WIDTHS[char_index]
+                    buffer_needed = char_width * font.HEIGHT * 2
+
+                    if self.glyph_cache is None:
+                        glyph = self._band(buffer_needed)
+                        self._render_glyph(font, char_index, fg, bg, glyph)
+                    else:
+                        glyph = self._cached_glyph(
+                            font, character, char_index, fg, bg)
+
+                    to_col = x + char_width - 1
+                    to_row = y + font.HEIGHT - 1
+                    if self.width > to_col and self.height > to_row:
+                        self._set_window(x, y, to_col, to_row)
+                        self._write(None, glyph)
+
+                    x += char_width
+
+                except ValueError:
+                    pass
+
+        return self.commands - commands
+
+    def write_line(self, font, string, x, y, fg=WHITE, bg=BLACK, band_rows=16):
+        """
+        Write a string using a converted true-type font as a single window
+        transfer. The glyphs are composed side by side into bands of
+        `band_rows` rows that are streamed into one window, so the address
+        commands are sent once per string instead of once per character.
+        Characters that do not fit on the display are dropped.
+
+        Args:
+            font (font): The module containing the converted true-type font
+            string (string): The string to write
+            x (int): column to start writing
+            y (int): row to start writing
+            fg (int): foreground color, optional, defaults to WHITE
+            bg (int): background color, optional, defaults to BLACK
+            band_rows (int): number of rows composed per SPI write
 
-        bg_hi = (bg & 0xff00) >> 8
-        bg_lo = bg & 0xff
+        Returns:
+            int: number of display commands sent
+        """
+        commands = self.commands
+        if y + font.HEIGHT > self.height:
+            return 0
 
+        glyphs = []
+        width = 0
         for character in string:
             try:
-                char_index = font.MAP.index(character)
-                offset = char_index * font.OFFSET_WIDTH
-                bs_bit = font.OFFSETS[offset]
-                if font.OFFSET_WIDTH > 1:
-                    bs_bit = (bs_bit << 8) + font.OFFSETS[offset + 1]
-
-                if font.OFFSET_WIDTH > 2:
-                    bs_bit = (bs_bit << 8) + font.OFFSETS[offset + 2]
-
-                char_width = font.WIDTHS[char_index]
-                buffer_needed = char_width * font.HEIGHT * 2
-
-                for i in range(0, buffer_needed, 2):
-                    if font.BITMAPS[bs_bit // 8] & 1 << (7 - (bs_bit % 8)) > 0:
-                        buffer[i] = fg_hi
-                        buffer[i + 1] = fg_lo
-                    else:
-                        buffer[i] = bg_hi
-                        buffer[i + 1] = bg_lo
+                char_index = _char_index(font, character)
+            except ValueError:
+                continue
 
-                    bs_bit += 1
+            char_width = font.WIDTHS[char_index]
+            if x + width + char_width > self.width:
+                break
 
-                to_col = x + char_width - 1
-                to_row = y + font.HEIGHT - 1
-                if self.width > to_col and self.height > to_row:
-                    self._set_window(x, y, to_col, to_row)
-                    self._write(None, buffer[0:buffer_needed])
+            if self.glyph_cache is None:
+                glyphs.append((char_index, char_width, None))
+            else:
+                glyphs.append((char_index, char_width, memoryview(
+                    self._cached_glyph(font, character, char_index, fg, bg))))
+            width += char_width
 
-                x += char_width
+        if not width:
+            return 0
 
-            except ValueError:
-                pass
+        stride = width * 2
+        band_rows = min(band_rows, font.HEIGHT)
+        band = self._band(stride * band_rows)
+
+        with self.batch():
+            self._set_window(x, y, x + width - 1, y + font.HEIGHT - 1)
+            self.dc.on()
+            for row in range(0, font.HEIGHT, band_rows):
+                rows = min(band_rows, font.HEIGHT - row)
+                column = 0
+                for char_index, char_width, glyph in glyphs:
+                    row_bytes = char_width * 2
+                    if glyph is None:
+                        self._render_glyph(
+                            font, char_index, fg, bg, band,
+                            column, stride, row, rows)
+                    else:
+                        src = row * row_bytes
+                        dst = column
+                        for _ in range(rows):
+                            band[dst:dst + row_bytes] = glyph[src:src + row_bytes]
+                            src += row_bytes
+                            dst += stride
+                    column += row_bytes
+
+                self.spi.write(band[:rows * stride])
+
+        return self.commands - commands
 
     def write_width(self, font, string):
         """
@@ -916,7 +2115,7 @@ class GC9A01():
         width = 0
         for character in string:
             try:
-                char_index = font.MAP.index(character)
+                char_index = _char_index(font, character)
                 width += font.WIDTHS[char_index]
 
             except ValueError:
@@ -1,13 +1,14 @@
 from machine import Pin, SPI, PWM, UART, I2C
 import gc9a01py as gc9a01
-from fonts import NotoSans_32 as font
-from fonts import NotoSans_64 as pmfont
-from fram import init_fram
+import assets
+from fram import init_fram, filter_life, pm_log, state as persistent
 import gc
 import utime as time
 
 # Force garbage collection at start
 gc.collect()
+# Display buffers are reserved once while the heap is still unfragmented
+arena = gc9a01.BufferArena(12 * 1024)
 
 print("=== Initializing Atomu Air Purifier Components ===")
 
@@ -19,6 +20,8 @@ else:
     raise Exception("init_fram is not callable. Check import.")
 if fram_success:
     print("✓ FRAM initialized successfully")
+    filter_life.read()  # Loads the whole state record in one I2C read
+    pm_log.load()
 else:
     print("✗ FRAM initialization failed")
     raise Exception("FRAM is required for operation")
@@ -32,12 +35,25 @@ tft = gc9a01.GC9A01(
     cs=Pin(14, Pin.OUT),
     reset=Pin(12, Pin.OUT),
     backlight=Pin(15, Pin.OUT),
-    rotation=0
+    rotation=0,
+    glyph_cache=gc9a01.GlyphCache(16 * 1024),
+    arena=arena,
+    circular=True
 )
 tft.backlight(True)
 tft.fill(gc9a01.BLACK)
 print("✓ Display initialized")
 
+# Fonts keep their glyph bitmaps in flash and read them when drawn
+font = gc9a01.BinaryFont("fonts/NotoSans_32.fnt")
+pmfont = gc9a01.BinaryFont("fonts/NotoSans_64.fnt")
+# PM2.5 digits pre-rendered in the PM2.5 colors on black
+pmsprites = gc9a01.SpriteFont("fonts/NotoSans_64.spr", pmfont)
+# Images built by res/build_assets.py, kept open for the whole run
+pack = assets.AssetPack("assets.pak")
+# Recently drawn images stay in RAM, so mode_select redraws without reads
+icons = assets.IconCache(pack, 24 * 1024, min_free=16 * 1024)
+
 # 3. Motor/Fan (PWM on GP4, control pins on GP5/GP6/GP7)
 print("Initializing Motor...")
 PWM_PIN = 4
@@ -111,6 +127,17 @@ def beep():
     time.sleep(0.05)
     buzzer.value(0)
 
+# Cache, buffer and persistence counters, call from the serial console
+def print_stats():
+    gc.collect()
+    print(f"[STATS] Glyph cache: {tft.glyph_cache.stats()}")
+    print(f"[STATS] Icon cache: {icons.stats()}")
+    print(f"[STATS] Buffer arena: {arena.stats()}")
+    print(f"[STATS] Filter life: {filter_life.stats()}")
+    print(f"[STATS] State record: {persistent.stats()}")
+    print(f"[STATS] PM log: {pm_log.stats()}")
+    print(f"[STATS] Free memory: {gc.mem_free()} bytes")
+
 # === Placeholder functions ===
 def sleep():
     beep()
@@ -160,21 +187,14 @@ def awake():
     tft.fill(gc9a01.BLACK)
     gc.collect()  # Clear Pico memory
     try:
-        gc.collect()
-        with open("Atomu.raw", "rb") as f:
-            logo_data = f.read()
-        x = (tft.width - 200) // 2
-        y = (tft.height - 200) // 2
-        tft.blit_buffer(logo_data, x, y, 200, 200)
-        del logo_data
-        gc.collect()
+        icons.blit_centered(tft, "Atomu")
         print("[INFO] Atomu logo displayed")
     except Exception as e:
         print(f"[WARN] Error loading Atomu logo: {e}")
         w = tft.write_width(font, "ATOMU")
         x = (tft.width - w) // 2
         y = (tft.height - 32) // 2
-        tft.write(font, "ATOMU", x, y, gc9a01.WHITE)
+        tft.write_line(font, "ATOMU", x, y, gc9a01.WHITE)
         print("[INFO] Atomu text displayed (fallback)")
     print("[INFO] Listening for touch (tap/hold) and filter reset button...")
     last_touch = touch_pin.value()
@@ -243,44 +263,35 @@ def filter_check():
         return no_filter
     beep()
     try:
-        from fram import read_filter_percent_fram
-        filter_percent = read_filter_percent_fram()
-        print(f"[DEBUG] Filter percent read from FRAM: {filter_percent:.2f}%")
+        filter_percent = filter_life.read()
+        print(f"[DEBUG] Filter percent: {filter_percent:.2f}%")
     except Exception as e:
         print(f"[WARN] Could not read filter percent from FRAM: {e}")
         filter_percent = 0.0
     if filter_percent < 85:
-        image_file = "filter.raw"
+        image = "filter"
     elif filter_percent < 100:
-        image_file = "filter_warning.raw"
+        image = "filter_warning"
     else:
-        image_file = "filter_full.raw"
+        image = "filter_full"
     tft.fill(gc9a01.BLACK)
     try:
-        gc.collect()
-        with open(image_file, "rb") as f:
-            img_data = f.read()
-        img_w, img_h = 128, 128
-        x = (tft.width - img_w) // 2
-        y = (tft.height - img_h) // 2 - 30  # 30px above center
-        tft.blit_buffer(img_data, x, y, img_w, img_h)
-        del img_data
-        gc.collect()
-        print(f"[INFO] {image_file} displayed at ({x},{y})")
+        x, y, _, _ = icons.blit_centered(tft, image, -30)  # 30px above center
+        print(f"[INFO] {image} displayed at ({x},{y})")
     except Exception as e:
-        print(f"[WARN] Could not display {image_file}: {e}")
+        print(f"[WARN] Could not display {image}: {e}")
     percent_str = f"{int(filter_percent)}%"
     w = tft.write_width(font, percent_str)
     x = (tft.width - w) // 2
     y = tft.height - 70  # 70px from bottom (higher than before)
-    tft.write(font, percent_str, x, y, gc9a01.WHITE)
-    print(f"[INFO] Filter percent {percent_str} displayed at y={y}")
+    commands = tft.write_line(font, percent_str, x, y, gc9a01.WHITE)
+    print(f"[INFO] Filter percent {percent_str} displayed at y={y} ({commands} display commands)")
     time.sleep(3)
     if filter_switch.value():
         print("[DEBUG] Filter microswitch not active after wait: returning no_filter")
         return no_filter
-    print("[INFO] Proceeding to mode_select()")
-    return (mode_select, ("low",))
+    print(f"[INFO] Proceeding to mode_select() with last mode '{persistent.mode}'")
+    return (mode_select, (persistent.mode,))
 
 def no_filter():
     beep(); time.sleep(0.2); beep()
@@ -289,18 +300,10 @@ def no_filter():
     brake.value(1)  # Set motor brake to true
     tft.fill(gc9a01.BLACK)
     try:
-        gc.collect()
-        with open("no_filter.raw", "rb") as f:
-            img_data = f.read()
-        img_w, img_h = 128, 128
-        x = (tft.width - img_w) // 2
-        y = (tft.height - img_h) // 2
-        tft.blit_buffer(img_data, x, y, img_w, img_h)
-        del img_data
-        gc.collect()
-        print(f"[INFO] no_filter.raw displayed at ({x},{y})")
+        x, y, _, _ = icons.blit_centered(tft, "no_filter")
+        print(f"[INFO] no_filter displayed at ({x},{y})")
     except Exception as e:
-        print(f"[WARN] Could not display no_filter.raw: {e}")
+        print(f"[WARN] Could not display no_filter: {e}")
     print("[INFO] Waiting for filter to be inserted or touch hold (sleep)...")
     last_touch = touch_pin.value()
     touch_press_time = None
@@ -342,25 +345,17 @@ def filter_reset():
     beep(); time.sleep(0.2); beep(); time.sleep(0.2); beep()
     print("[INFO] Filter reset state...")
     try:
-        from fram import write_filter_percent_fram
-        write_filter_percent_fram(0.0)
+        filter_life.set(0.0)
+        filter_life.flush()
         print("[INFO] Filter percent reset to 0 in FRAM")
     except Exception as e:
         print(f"[WARN] Could not reset filter percent in FRAM: {e}")
     tft.fill(gc9a01.BLACK)
     try:
-        gc.collect()
-        with open("filter_reset.raw", "rb") as f:
-            img_data = f.read()
-        img_w, img_h = 128, 128
-        x = (tft.width - img_w) // 2
-        y = (tft.height - img_h) // 2
-        tft.blit_buffer(img_data, x, y, img_w, img_h)
-        del img_data
-        gc.collect()
-        print(f"[INFO] filter_reset.raw displayed at ({x},{y})")
+        x, y, _, _ = icons.blit_centered(tft, "filter_reset")
+        print(f"[INFO] filter_reset displayed at ({x},{y})")
     except Exception as e:
-        print(f"[WARN] Could not display filter_reset.raw: {e}")
+        print(f"[WARN] Could not display filter_reset: {e}")
     print("[INFO] Waiting 3 seconds in filter_reset...")
     time.sleep(3)
     print("[INFO] Returning to awake() from filter_reset...")
@@ -378,20 +373,11 @@ def mode_select(mode):
     while True:
         selected_mode = modes[mode_idx]
         tft.fill(gc9a01.BLACK)
-        image_file = f"{selected_mode}.raw"
         try:
-            gc.collect()
-            with open(image_file, "rb") as f:
-                img_data = f.read()
-            img_w, img_h = 128, 128
-            x = (tft.width - img_w) // 2
-            y = (tft.height - img_h) // 2
-            tft.blit_buffer(img_data, x, y, img_w, img_h)
-            del img_data
-            gc.collect()
-            print(f"[INFO] {image_file} displayed at ({x},{y})")
+            x, y, _, _ = icons.blit_centered(tft, selected_mode)
+            print(f"[INFO] {selected_mode} displayed at ({x},{y})")
         except Exception as e:
-            print(f"[WARN] Could not display {image_file}: {e}")
+            print(f"[WARN] Could not display {selected_mode}: {e}")
         print(f"[INFO] Waiting for tap to change mode or timeout to lock in '{selected_mode}'...")
         last_touch = touch_pin.value()
         touch_press_time = None
@@ -435,41 +421,35 @@ def mode_activated(mode):
     if mode not in modes:
         print(f"[WARN] Invalid mode '{mode}', defaulting to 'low'")
         mode = "low"
+    persistent.mode = mode  # Saved with the next filter_life flush
     tft.fill(gc9a01.BLACK)
     brake.value(0)
     print("[INFO] Motor brake set to off")
-    image_file = f"{mode}.raw"
-    img_w, img_h = 128, 128
-    scaled_w, scaled_h = 64, 64
-    x = (tft.width - scaled_w) // 2
-    y = (tft.height - scaled_h) // 2 - 40  # Move icon 10px higher (was -30)
+    # Layout of a 64 px icon is kept when the icon cannot be drawn
+    img_w = img_h = 64
+    x = (tft.width - img_w) // 2
+    y = (tft.height - img_h) // 2 - 40  # Move icon 10px higher (was -30)
     try:
-        gc.collect()
-        with open(image_file, "rb") as f:
-            img_data = f.read()
-        scaled_data = bytearray()
-        for row in range(0, img_h, 2):
-            for col in range(0, img_w, 2):
-                orig_pos = (row * img_w + col) * 2
-                if orig_pos + 1 < len(img_data):
-                    scaled_data.append(img_data[orig_pos])
-                    scaled_data.append(img_data[orig_pos + 1])
-        tft.blit_buffer(scaled_data, x, y, scaled_w, scaled_h)
-        del img_data
-        del scaled_data
-        gc.collect()
-        print(f"[INFO] {image_file} scaled and displayed at ({x},{y})")
+        image = icons.find(mode, 64)
+        img_w, img_h = icons.size(image)
+        x = (tft.width - img_w) // 2
+        y = (tft.height - img_h) // 2 - 40
+        icons.blit(tft, image, x, y)
+        print(f"[INFO] {image} displayed at ({x},{y})")
     except Exception as e:
-        print(f"[WARN] Could not display scaled {image_file}: {e}")
+        print(f"[WARN] Could not display {mode}: {e}")
     pm25_last = None
     pm25_x_center = tft.width // 2
-    pm25_y = y + scaled_h + 30  # Move PM2.5 text 20px lower (was +10)
+    pm25_y = y + img_h + 30  # Move PM2.5 text 20px lower (was +10)
     # Define color constants
     PERSIAN_GREEN = gc9a01.color565(0, 166, 147)
     MEDIUM_ORANGE = gc9a01.color565(255, 153, 0)
     RED = gc9a01.RED
     pm25_color = PERSIAN_GREEN
     pm25_bg_color = gc9a01.BLACK
+    pm25_display = gc9a01.DigitDisplay(
+        tft, pmfont, 0, pm25_y, 3, bg=pm25_bg_color, sprites=pmsprites)
+    pm25_display.x = pm25_x_center - pm25_display.width // 2
     def set_motor_speed(percent):
         percent = max(0, min(100, percent))
         duty = int(((100 - percent) / 100) * 65535)
@@ -481,6 +461,9 @@ def mode_activated(mode):
                 data = uart.read()
                 if data and len(data) >= 32:
                     pm25 = int.from_bytes(data[6:8], 'big')
+                    pm_log.add(
+                        int.from_bytes(data[4:6], 'big'), pm25,
+                        int.from_bytes(data[8:10], 'big'))
                     return pm25
             except Exception as e:
                 print(f"[WARN] Error reading PM2.5: {e}")
@@ -563,13 +546,11 @@ def mode_activated(mode):
                         pm25_color = MEDIUM_ORANGE
                     else:
                         pm25_color = RED
-                    # Increase cleared area to prevent artifacts
-                    tft.fill_rect(pm25_x_center - 70, pm25_y - 10, 140, 60, pm25_bg_color)
-                    val_str = f"{pm25:03d}"
-                    w = tft.write_width(pmfont, val_str)
-                    x_val = pm25_x_center - w // 2
-                    tft.write(pmfont, val_str, x_val, pm25_y, pm25_color)
-                    print(f"[INFO] PM2.5 value updated: {pm25}")
+                    # Only the digits that changed are redrawn. The field
+                    # has 3 cells, readings above 999 show as 999.
+                    val_str = f"{min(pm25, 999):03d}"
+                    cells = pm25_display.update(val_str, pm25_color)
+                    print(f"[INFO] PM2.5 value updated: {pm25} ({cells} digits redrawn)")
                     pm25_last = pm25
                 if mode == "auto":
                     if pm25 <= 35:
@@ -581,8 +562,6 @@ def mode_activated(mode):
             pm25_update_time = now
         if time.ticks_diff(now, filter_increment_time) > 1000:
             try:
-                from fram import read_filter_percent_fram, write_filter_percent_fram
-                filter_percent = read_filter_percent_fram()
                 current_duty = pwm.duty_u16()
                 if current_duty == int(((100 - 35) / 100) * 65535):
                     increment = 0.5  # Still use 0.5 for 40% speed, or adjust if needed
@@ -598,8 +577,10 @@ def mode_activated(mode):
                         increment = 1.0
                     else:
                         increment = 1.5
-                new_value = min(100.0, filter_percent + increment)
-                write_filter_percent_fram(new_value)
+                # Kept in RAM and written to FRAM every filter_life.interval_ms
+                new_value = filter_life.add(increment)
+                persistent.run_seconds += 1
+                filter_life.poll(now)
                 print(f"[INFO] Filter percent incremented by {increment}, now {new_value:.2f}%")
             except Exception as e:
                 print(f"[WARN] Could not increment filter percent: {e}")
@@ -613,6 +594,10 @@ def run_state_machine():
     args = ()
     while True:
         result = state(*args)
+        # Filter use and PM history kept in RAM are written to FRAM when a
+        # state exits
+        filter_life.flush()
+        pm_log.flush()
         if isinstance(result, tuple):
             state, args = result[0], result[1]
         else:
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Batch converter for the images in res/.
+
+Converts every image in ASSETS to the raw RGB565 and run-length compressed
+formats read by GC9A01.blit_file and GC9A01.blit_rle, using NumPy array
+operations and a process pool. Smaller variants of an image are scaled down
+here with an area-averaging filter, so the firmware never resizes images.
+Inputs whose content and conversion settings did not change since the last
+build are skipped, and manifest.json records every output with its
+dimensions, format and size.
+
+The compressed images are also packed into assets.pak, a single file with
+an index that assets.AssetPack reads on the device.
+
+Usage: python3 build_assets.py [--force] [-j JOBS]
+
+Needs Pillow and numpy.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from conevert import (
+    RLE_MAX_RUN, RLE_PALETTE, RLE_RGB565, RLE_VERSION, load_image)
+
+RES = os.path.dirname(os.path.abspath(__file__))
+MANIFEST = os.path.join(RES, "manifest.json")
+PACK = os.path.join(RES, "assets.pak")
+
+# Asset pack header (magic, version, image count) and index entries (name,
+# offset, size, width, height, RLE format, CRC-32), see write_pack
+PACK_MAGIC = b"APK1"
+PACK_VERSION = 1
+PACK_HEADER = ">4sBH"
+PACK_ENTRY = ">16sIIHHBI"
+
+# Output name: (source image, variant sizes). Every asset is written as
+# <name>.raw and <name>.rle, and each variant as <name>_<size>.rle scaled to
+# fit in size x size pixels, see assets.py for the loader.
+ASSETS = {
+    "Atomu": ("Atomu.png", ()),
+    "auto": ("automatic.png", (64,)),
+    "filter": ("filter.png", ()),
+    "filter_full": ("filter_full.png", ()),
+    "filter_reset": ("filter_reset.png", ()),
+    "filter_warning": ("filter_warning.png", ()),
+    "high": ("high.png", (64,)),
+    "low": ("low.png", (64,)),
+    "med": ("medium.png", (64,)),
+    "no_filter": ("no_filter.png", ()),
+}
+
+FORMATS = ("raw", "rle")
+VARIANT_FORMATS = ("rle",)
+
+# Area-averaging filter, Image.BOX on Pillow before 9.1
+BOX = getattr(Image, "Resampling", Image).BOX
+
+
+def file_hash(path):
+    """Return the SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_hash():
+    """
+    Return a hash of everything besides the source image that decides the
+    output, so changing the converters rebuilds all assets.
+    """
+    digest = hashlib.sha256(repr((FORMATS, VARIANT_FORMATS)).encode())
+    for name in ("build_assets.py", "conevert.py"):
+        with open(os.path.join(RES, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def to_rgb565(img):
+    """Convert an RGB image to a height x width array of RGB565 values"""
+    rgb = np.asarray(img, dtype=np.uint16)
+    return (((rgb[..., 0] & 0xF8) << 8) | ((rgb[..., 1] & 0xFC) << 3)
+            | (rgb[..., 2] >> 3))
+
+
+def encode_runs(values, value_size, min_run):
+    """
+    Encode an array of values into repeat and literal packets, producing
+    the same bytes as conevert.encode_runs. Runs are found with NumPy and
+    packets are built per run instead of per value.
+    """
+    values = np.asarray(values).ravel()
+    dtype = ">u2" if value_size == 2 else "u1"
+    encoded = values.astype(dtype)
+    out = bytearray()
+    if not len(values):
+        return out
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(values)) + 1))
+    ends = np.append(starts[1:], len(values))
+    literal = None
+
+    def flush_literal(end):
+        for start in range(literal, end, RLE_MAX_RUN):
+            count = min(RLE_MAX_RUN, end - start)
+            out.append(count - 1)
+            out.extend(encoded[start:start + count].tobytes())
+
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        while start < end:
+            run = min(RLE_MAX_RUN, end - start)
+            if run >= min_run:
+                if literal is not None:
+                    flush_literal(start)
+                    literal = None
+                out.append(0x80 | (run - 1))
+                out.extend(encoded[start:start + 1].tobytes())
+            elif literal is None:
+                literal = start
+            start += run
+
+    if literal is not None:
+        flush_literal(len(values))
+    return out
+
+
+def encode_rle(pixels):
+    """
+    Encode a height x width array of RGB565 pixels like conevert.encode_rle:
+    palette index runs when the image has 256 colors or less and RGB565
+    runs otherwise.
+
+    Returns:
+        tuple: (data, format)
+    """
+    height, width = pixels.shape
+    colors, indexes = np.unique(pixels, return_inverse=True)
+    if len(colors) <= 256:
+        data = bytearray(struct.pack(
+            ">2sBBHH", b"RL", RLE_VERSION, RLE_PALETTE, width, height))
+        data.append(len(colors) & 0xff)
+        data.extend(colors.astype(">u2").tobytes())
+        data.extend(encode_runs(indexes, 1, 3))
+        return data, RLE_PALETTE
+
+    data = bytearray(struct.pack(
+        ">2sBBHH", b"RL", RLE_VERSION, RLE_RGB565, width, height))
+    data.extend(encode_runs(pixels, 2, 2))
+    return data, RLE_RGB565
+
+
+def scale(img, size):
+    """
+    Scale an image down to fit in size x size pixels, keeping its aspect
+    ratio, by averaging the source pixels each output pixel covers.
+    """
+    width, height = img.size
+    factor = size / max(width, height)
+    return img.resize(
+        (max(1, round(width * factor)), max(1, round(height * factor))), BOX)
+
+
+def write_outputs(name, pixels, formats):
+    """Write an RGB565 pixel array in formats, return the outputs entry."""
+    outputs = {}
+    for fmt in formats:
+        if fmt == "rle":
+            data, kind = encode_rle(pixels)
+            detail = "palette" if kind == RLE_PALETTE else "rgb565"
+        else:
+            data = pixels.astype(">u2").tobytes()
+            detail = "rgb565"
+
+        path = name + "." + fmt
+        with open(os.path.join(RES, path), "wb") as f:
+            f.write(data)
+        outputs[fmt] = {"file": path, "encoding": detail, "size": len(data)}
+
+    return outputs
+
+
+def convert_asset(name, source, sizes):
+    """
+    Convert one source image to every format in FORMATS and its variants
+    to VARIANT_FORMATS. Runs in the process pool.
+
+    Returns:
+        dict: the manifest entry of the asset
+    """
+    img = load_image(os.path.join(RES, source))
+    pixels = to_rgb565(img)
+    height, width = pixels.shape
+    variants = {}
+    for size in sizes:
+        scaled = to_rgb565(scale(img, size))
+        variants[str(size)] = {
+            "width": scaled.shape[1], "height": scaled.shape[0],
+            "outputs": write_outputs(
+                f"{name}_{size}", scaled, VARIANT_FORMATS)}
+
+    return {
+        "source": source, "width": width, "height": height,
+        "outputs": write_outputs(name, pixels, FORMATS),
+        "variants": variants}
+
+
+def write_pack(assets):
+    """
+    Write the .rle output of every asset and variant to PACK, variants
+    named <name>_<size>: a PACK_HEADER, a PACK_ENTRY per image, then the
+    images in index order.
+
+    Returns:
+        dict: the manifest entry of the pack
+    """
+    images = []
+    for name, entry in sorted(assets.items()):
+        images.append((name, entry))
+        for size, variant in sorted(entry.get("variants", {}).items()):
+            images.append((f"{name}_{size}", variant))
+
+    offset = (struct.calcsize(PACK_HEADER)
+              + struct.calcsize(PACK_ENTRY) * len(images))
+    index = bytearray(struct.pack(
+        PACK_HEADER, PACK_MAGIC, PACK_VERSION, len(images)))
+    data = bytearray()
+    for name, entry in images:
+        if len(name.encode()) > 16:
+            raise ValueError(f"Asset name {name} is longer than 16 bytes")
+
+        with open(os.path.join(RES, entry["outputs"]["rle"]["file"]), "rb") as f:
+            image = f.read()
+        index.extend(struct.pack(
+            PACK_ENTRY, name.encode(), offset + len(data), len(image),
+            entry["width"], entry["height"], image[3],
+            zlib.crc32(image) & 0xffffffff))
+        data.extend(image)
+
+    with open(PACK, "wb") as f:
+        f.write(index)
+        f.write(data)
+
+    return {
+        "file": os.path.basename(PACK), "images": len(images),
+        "size": len(index) + len(data)}
+
+
+def load_manifest():
+    """Return the manifest of the last build, or an empty one."""
+    try:
+        with open(MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_current(entry, source_hash, settings):
+    """Return True when an asset's outputs are up to date."""
+    if (not entry or entry.get("sha256") != source_hash
+            or entry.get("settings") != settings):
+        return False
+
+    outputs = list(entry["outputs"].values())
+    for variant in entry.get("variants", {}).values():
+        outputs.extend(variant["outputs"].values())
+
+    for output in outputs:
+        path = os.path.join(RES, output["file"])
+        if not os.path.exists(path) or os.path.getsize(path) != output["size"]:
+            return False
+    return True
+
+
+def build(force=False, jobs=None):
+    """
+    Convert the stale assets and write the manifest.
+
+    Returns:
+        tuple: (number converted, number skipped)
+    """
+    previous = load_manifest().get("assets", {})
+    settings = settings_hash()
+    assets = {}
+    stale = []
+    for name, (source, sizes) in ASSETS.items():
+        source_hash = file_hash(os.path.join(RES, source))
+        if not force and is_current(previous.get(name), source_hash, settings):
+            assets[name] = previous[name]
+        else:
+            stale.append((name, source, sizes, source_hash))
+
+    if stale:
+        with ProcessPoolExecutor(jobs) as pool:
+            futures = [
+                (name, source_hash,
+                 pool.submit(convert_asset, name, source, sizes))
+                for name, source, sizes, source_hash in stale]
+            for name, source_hash, future in futures:
+                entry = future.result()
+                entry["sha256"] = source_hash
+                entry["settings"] = settings
+                assets[name] = entry
+                print(f"{name}: {entry['width']}x{entry['height']} from "
+                      f"{entry['source']}")
+
+    pack = write_pack(assets)
+    with open(MANIFEST, "w") as f:
+        json.dump({"version": 1, "pack": pack,
+                   "assets": dict(sorted(assets.items()))}, f, indent=2)
+        f.write("\n")
+
+    return len(stale), len(ASSETS) - len(stale)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert the images in res/ for the GC9A01 driver.")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="convert every asset even when it is up to date")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="number of conversion processes, defaults to the CPU count")
+    args = parser.parse_args()
+
+    start = time.monotonic()
+    converted, skipped = build(args.force, args.jobs)
+    print(f"Converted {converted}, skipped {skipped} up to date in "
+          f"{time.monotonic() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,86 @@
 from PIL import Image
+import struct
 import sys
 import os
 
+# Compressed image format read by GC9A01.blit_rle:
+#
+#   header:  b"RL", version (1), format, width (>H), height (>H)
+#   format 2 only: palette size (0 means 256), then palette size RGB565
+#                  big-endian colors
+#   body:    packets of a control byte followed by values
+#            control & 0x80: repeat the next value (control & 0x7f) + 1 times
+#            otherwise:      copy the next control + 1 values
+#
+# A value is a big-endian RGB565 color for format 1 and a palette index byte
+# for format 2.
+RLE_VERSION = 1
+RLE_RGB565 = 1
+RLE_PALETTE = 2
+RLE_MAX_RUN = 128
+
+
 def rgb888_to_rgb565(r, g, b):
     """Convert 8-bit R, G, B to 16-bit RGB565"""
     return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
 
-def convert_image(input_path):
-    if not os.path.exists(input_path):
-        print(f"File not found: {input_path}")
-        return
 
-    # Load image
+def encode_runs(values, value_size, min_run):
+    """Encode a list of values into repeat and literal packets"""
+    out = bytearray()
+    literal = []
+
+    def flush_literal():
+        while literal:
+            chunk = literal[:RLE_MAX_RUN]
+            del literal[:RLE_MAX_RUN]
+            out.append(len(chunk) - 1)
+            for value in chunk:
+                out.extend(value.to_bytes(value_size, 'big'))
+
+    i = 0
+    count = len(values)
+    while i < count:
+        value = values[i]
+        run = 1
+        while i + run < count and run < RLE_MAX_RUN and values[i + run] == value:
+            run += 1
+        if run >= min_run:
+            flush_literal()
+            out.append(0x80 | (run - 1))
+            out.extend(value.to_bytes(value_size, 'big'))
+        else:
+            literal.extend(values[i:i + run])
+        i += run
+
+    flush_literal()
+    return out
+
+
+def encode_rle(width, height, pixels):
+    """
+    Encode a list of RGB565 pixels, using palette index runs when the image
+    has 256 colors or less and RGB565 runs otherwise.
+    """
+    colors = sorted(set(pixels))
+    header = struct.pack(">2sBBHH", b"RL", RLE_VERSION, 0, width, height)
+    if len(colors) <= 256:
+        index = {color: i for i, color in enumerate(colors)}
+        data = bytearray(header)
+        data[3] = RLE_PALETTE
+        data.append(len(colors) & 0xff)
+        for color in colors:
+            data.extend(color.to_bytes(2, 'big'))
+        data.extend(encode_runs([index[p] for p in pixels], 1, 3))
+    else:
+        data = bytearray(header)
+        data[3] = RLE_RGB565
+        data.extend(encode_runs(pixels, 2, 2))
+    return data
+
+
+def load_image(input_path):
+    """Load an image as opaque RGB, flattening transparency onto black"""
     img = Image.open(input_path)
 
     # Handle transparency
@@ -23,24 +92,35 @@ def convert_image(input_path):
         img = img.convert("RGB")
     else:
         img = img.convert("RGB")
-    
+    return img
+
+
+def convert_image(input_path, fmt="raw"):
+    if not os.path.exists(input_path):
+        print(f"File not found: {input_path}")
+        return
+
+    img = load_image(input_path)
     width, height = img.size
     print(f"Converting {input_path} ({width}x{height})...")
 
+    pixels = [rgb888_to_rgb565(r, g, b) for r, g, b in img.getdata()]
     base = os.path.splitext(input_path)[0]
-    output_path = base + ".raw"
+    output_path = base + "." + fmt
 
     with open(output_path, "wb") as f:
-        for y in range(height):
-            for x in range(width):
-                r, g, b = img.getpixel((x, y))
-                rgb565 = rgb888_to_rgb565(r, g, b)
+        if fmt == "rle":
+            data = encode_rle(width, height, pixels)
+            f.write(data)
+            print(f"Compressed {width * height * 2} bytes to {len(data)} bytes")
+        else:
+            for rgb565 in pixels:
                 f.write(rgb565.to_bytes(2, 'big'))
 
     print(f"Done. Output saved as: {output_path}")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python convert_to_rgb565.py <image_file>")
+    if len(sys.argv) not in (2, 3) or sys.argv[2:] not in ([], ["raw"], ["rle"]):
+        print("Usage: python conevert.py <image_file> [raw|rle]")
     else:
-        convert_image(sys.argv[1])
+        convert_image(*sys.argv[1:])
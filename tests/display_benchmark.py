@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Display driver benchmark for the host.
+Runs gc9a01py against the GC9A01 emulator in tools/ and prints the SPI
+traffic of the operations main.py uses, then checks the emulated
+framebuffer against the source images.
+
+Usage: python3 tests/display_benchmark.py [screen.png]
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path so we can import our modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from tools import gc9a01_emulator as emu
+
+emu.install()
+
+import gc9a01py as gc9a01
+import assets
+from fonts import NotoSans_32 as font
+from fonts import NotoSans_64 as pmfont
+
+
+def res(name):
+    return os.path.join(ROOT, "res", name)
+
+
+def check_image(panel, name, x, y, width, height):
+    """Compare a region of the framebuffer with a raw RGB565 file"""
+    with open(res(name), "rb") as f:
+        data = f.read()
+    for row in range(height):
+        start = ((y + row) * panel.width + x) * 2
+        if panel.framebuffer[start:start + width * 2] != data[row * width * 2:(row + 1) * width * 2]:
+            print(f"✗ {name} differs at row {row}")
+            return False
+    print(f"✓ {name} matches the framebuffer")
+    return True
+
+
+def main():
+    print("=== Display Benchmark (emulated GC9A01) ===")
+    print(f"Kernels: {gc9a01.KERNELS}")
+    panel = emu.Panel()
+    arena = gc9a01.BufferArena(12 * 1024)
+    tft = gc9a01.GC9A01(
+        panel.spi, dc=panel.dc, cs=panel.cs, reset=panel.reset,
+        backlight=panel.backlight, glyph_cache=gc9a01.GlyphCache(16 * 1024),
+        arena=arena)
+    panel.reset_stats()
+    ok = True
+
+    with panel.measure("fill"):
+        tft.fill(gc9a01.BLACK)
+    tft.set_circular(True)
+    with panel.measure("fill (circular)"):
+        tft.fill(gc9a01.BLACK)
+    tft.set_circular(False)
+
+    with panel.measure("rect"):
+        tft.rect(20, 20, 200, 200, gc9a01.WHITE)
+    with panel.measure("fill_rect 140x60"):
+        tft.fill_rect(50, 150, 140, 60, gc9a01.BLACK)
+
+    with panel.measure("blit_file Atomu.raw"):
+        tft.blit_file(res("Atomu.raw"), 20, 20, 200, 200)
+    ok &= check_image(panel, "Atomu.raw", 20, 20, 200, 200)
+    with panel.measure("blit_rle Atomu.rle"):
+        tft.blit_rle(res("Atomu.rle"), 20, 20)
+    ok &= check_image(panel, "Atomu.raw", 20, 20, 200, 200)
+    with panel.measure("blit_rle low.rle"):
+        tft.blit_rle(res("low.rle"), 56, 26)
+    ok &= check_image(panel, "low.raw", 56, 26, 128, 128)
+    pack = assets.AssetPack(res("assets.pak"), verify=True)
+    with panel.measure("AssetPack low"):
+        pack.blit(tft, "low", 56, 26)
+    ok &= check_image(panel, "low.raw", 56, 26, 128, 128)
+    icons = assets.IconCache(pack, 24 * 1024)
+    for mode in ("low", "med", "high", "auto", "low"):
+        with panel.measure(f"IconCache {mode}"):
+            icons.blit_centered(tft, mode)
+    ok &= check_image(panel, "low.raw", 56, 56, 128, 128)
+    if icons.hits != 1 or icons.misses != 4:
+        print(f"✗ IconCache did not serve the repeated icon from RAM: {icons.stats()}")
+        ok = False
+
+    tft.fill(gc9a01.BLACK)
+    with panel.measure("write 85%"):
+        tft.write(font, "85%", 80, 170, gc9a01.WHITE)
+    with panel.measure("write_line 85%"):
+        tft.write_line(font, "85%", 80, 170, gc9a01.WHITE)
+    with panel.measure("write PM2.5 123"):
+        tft.write(pmfont, "123", 65, 120, gc9a01.RED)
+    with panel.measure("write_line PM2.5 123"):
+        tft.write_line(pmfont, "123", 65, 120, gc9a01.RED)
+
+    digits = gc9a01.DigitDisplay(tft, pmfont, 65, 120, 3)
+    with panel.measure("DigitDisplay 123"):
+        digits.update("123", gc9a01.RED)
+    rendered = bytes(panel.framebuffer)
+    digits = gc9a01.DigitDisplay(
+        tft, pmfont, 65, 120, 3,
+        sprites=gc9a01.SpriteFont(os.path.join(ROOT, "fonts", "NotoSans_64.spr")))
+    with panel.measure("DigitDisplay 123 (sprites)"):
+        digits.update("123", gc9a01.RED)
+    if panel.framebuffer == rendered:
+        print("✓ PM2.5 sprites match the rendered digits")
+    else:
+        print("✗ PM2.5 sprites differ from the rendered digits")
+        ok = False
+
+    print()
+    panel.report()
+    print()
+    print(f"Glyph cache: {tft.glyph_cache.stats()}")
+    print(f"Icon cache: {icons.stats()}")
+    print(f"Arena: {arena.stats()}")
+    if tft._band_buffer is not None:
+        print("✗ Drawing allocated a band buffer outside the arena")
+        ok = False
+
+    if len(sys.argv) > 1:
+        panel.save_png(sys.argv[1])
+        print(f"Screen saved as {sys.argv[1]}")
+
+    print("\n=== Benchmark PASSED ===" if ok else "\n=== Benchmark FAILED ===")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+FRAM persistence benchmark for the host.
+Runs fram.py against the I2C bus and MB85RC04 emulator in tools/ and prints
+the I2C transactions and simulated bus time of the persistence main.py
+does, then checks addressing, torn writes and bus faults.
+
+Usage: python3 tests/fram_benchmark.py [latency_us]
+"""
+
+import sys
+import os
+
+# Add the parent directory to the path so we can import our modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from tools import fram_emulator as emu
+
+bus = emu.install(emu.Bus(float(sys.argv[1]) if len(sys.argv) > 1 else 50))
+chip = bus.attach(emu.MB85RC04())
+
+import importlib
+import struct
+import time
+import fram
+
+
+def check(ok, message):
+    print(("✓ " if ok else "✗ ") + message)
+    return ok
+
+
+def main():
+    print("=== FRAM Benchmark (emulated MB85RC04) ===")
+    print(f"Latency per transaction: {bus.latency_us:.0f} us")
+    ok = True
+
+    with bus.measure("init_fram"):
+        ok &= check(fram.init_fram(), "init_fram finds the FRAM")
+    chip.memory[0:4] = struct.pack("<f", 42.5)
+
+    # What mode_activated did every second before the write-back cache
+    with bus.measure("legacy loop, 60 s"):
+        for _ in range(60):
+            value = fram.fram.read_float(0)
+            fram.fram.write_float(0, value + 0.5)
+            fram.fram.read_float(0)
+    chip.memory[0:4] = struct.pack("<f", 42.5)
+
+    # A load that fails on the bus must not let defaults be saved over FRAM
+    bus.fail(1)
+    fram.filter_life.add(0.5)
+    with bus.measure("flush after a failed load") as stats:
+        flushed = fram.filter_life.flush()
+    ok &= check(not fram.filter_life.loaded and not flushed and not stats.writes,
+                "flush saves nothing after a failed load")
+
+    with bus.measure("load state at boot"):
+        fram.filter_life.read()
+    ok &= check(fram.state.filter_life == 42.5,
+                "filter percent migrated from address 0")
+
+    start = time.ticks_ms()
+    with bus.measure("FilterLife loop, 60 s"):
+        for second in range(1, 61):
+            fram.filter_life.add(0.5)
+            fram.filter_life.poll(start + second * 1000)
+    with bus.measure("FilterLife flush on state exit"):
+        fram.filter_life.flush()
+    with bus.measure("FilterLife flush, unchanged"):
+        fram.filter_life.flush()
+
+    with bus.measure("read_filter_percent_fram"):
+        value = fram.read_filter_percent_fram()
+    ok &= check(value == 72.5, f"filter percent {value} after 60 s at 0.5 %/s")
+    with bus.measure("write_filter_percent_fram"):
+        ok &= check(fram.write_filter_percent_fram(10.0),
+                    "write_filter_percent_fram verifies")
+    fram.filter_life.add(1.0)
+    with bus.measure("read_filter_percent_fram, unflushed") as stats:
+        value = fram.read_filter_percent_fram()
+    ok &= check(value == 11.0 and not stats.transactions,
+                "read_filter_percent_fram keeps unflushed changes")
+
+    # A save torn by a power loss falls back to the previous slot
+    fram.state.filter_life = 20.0
+    bus.tear(5)
+    try:
+        fram.state.save()
+    except OSError:
+        pass
+    record = fram.StateRecord()
+    ok &= check(record.load() and record.filter_life == 10.0
+                and record.bad_slots == 1,
+                "torn save falls back to the previous slot")
+
+    with bus.measure("PMLog, 1 h of samples every 2 s"):
+        for sample in range(1800):
+            fram.pm_log.add(3, 10 + sample % 40, 20, start + sample * 2000)
+        fram.pm_log.flush()
+    with bus.measure("PMLog history, all minutes"):
+        minutes = list(fram.pm_log.history("minute"))
+    with bus.measure("PMLog history, all hours"):
+        hours = list(fram.pm_log.history("hour"))
+    ok &= check(len(minutes) == 10 and len(hours) == 0,
+                f"{len(minutes)} minutes and {len(hours)} hours logged")
+    log = fram.PMLog()
+    ok &= check(log.load() and list(log.history("minute")) == minutes,
+                "PM log reloads from FRAM")
+    ok &= check(chip.memory[fram.LOG_START:fram.LOG_START + 2] == fram.LOG_MAGIC,
+                f"PM log header at byte {fram.LOG_START}, after the state record")
+
+    # A reboot 59 minutes into the hour keeps them, two more minutes close it
+    fram.pm_log = fram.PMLog()
+    with bus.measure("PMLog load after reboot"):
+        fram.pm_log.load()
+    for sample in range(1800, 1860):
+        fram.pm_log.add(3, 10 + sample % 40, 20, start + sample * 2000)
+    fram.pm_log.flush()
+    hours = list(fram.pm_log.history("hour"))
+    ok &= check(len(hours) == 1, "open hour survives a reboot")
+
+    # Hour entries from the sixth on are past byte 255, in the page the
+    # chip answers on 0x51
+    bus.trace = True
+    with bus.measure("PMLog, 9 h more of samples every 2 s"):
+        for sample in range(1860, 1800 * 10):
+            fram.pm_log.add(3, 10 + sample % 40, 20, start + sample * 2000)
+        fram.pm_log.flush()
+    bus.trace = False
+    upper = [entry for entry in bus.log
+             if entry[0] == "write" and entry[1] == fram.fram.address | 1]
+    hours = list(fram.pm_log.history("hour"))
+    log = fram.PMLog()
+    ok &= check(bool(upper) and len(hours) >= 9
+                and log.load() and list(log.history("hour")) == hours,
+                f"{len(hours)} hours logged, {len(upper)} writes to the upper page")
+
+    # The ninth address bit goes to the device address
+    with bus.measure("write_bytes across the page boundary"):
+        fram.fram.write_bytes(250, bytes(range(12)))
+    ok &= check(chip.memory[250:262] == bytes(range(12)),
+                "bytes 250-261 land at their addresses")
+
+    fram.state.filter_life = 30.0
+    bus.fail(1)
+    ok &= check(not fram.filter_life.flush(), "flush reports a bus error")
+    ok &= check(fram.filter_life.flush(), "flush retries after a bus error")
+    stats = (fram.filter_life.stats(), fram.state.stats(), fram.pm_log.stats())
+
+    # write_filter_percent_fram right after boot, as the tests/ scripts do
+    fram.state.mode = "auto"
+    for value in (10.0, 20.0, 30.0):
+        fram.filter_life.set(value)
+        fram.filter_life.flush()
+    importlib.reload(fram)
+    fram.init_fram()
+    written = fram.write_filter_percent_fram(55.0)
+    record = fram.StateRecord()
+    ok &= check(written and record.load() and record.filter_life == 55.0
+                and record.mode == "auto",
+                "write_filter_percent_fram after boot keeps the other fields")
+
+    bus.detach(chip)
+    ok &= check(not fram.init_fram(), "init_fram fails without the FRAM")
+
+    print()
+    bus.report()
+    print()
+    print(f"Filter life: {stats[0]}")
+    print(f"State: {stats[1]}")
+    print(f"PM log: {stats[2]}")
+
+    print("\n=== Benchmark PASSED ===" if ok else "\n=== Benchmark FAILED ===")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
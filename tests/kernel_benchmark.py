@@ -0,0 +1,65 @@
+"""
+Benchmark the pixel expansion kernels used by GC9A01.write and
+GC9A01.bitmap. Compares the pure Python kernels with the kernels the driver
+selected on this port (viper when available) in pixels per second.
+Run this directly on the Pico, no display is needed.
+"""
+
+import utime as time
+import gc9a01py as gc9a01
+from fonts import NotoSans_64 as font
+
+ROUNDS = 20
+
+
+def bench_bits(expand, pixels, buffer):
+    """Expand the whole NotoSans_64 bitmap ROUNDS times"""
+    start = time.ticks_us()
+    for _ in range(ROUNDS):
+        bit = 0
+        while bit < pixels:
+            count = min(len(buffer) // 2, pixels - bit)
+            expand(font.BITMAPS, bit, count, buffer, 0, gc9a01.WHITE, gc9a01.BLACK)
+            bit += count
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    return pixels * ROUNDS * 1000000 // max(elapsed, 1)
+
+
+def bench_indexed(expand, bpp, pixels, buffer):
+    """Expand the NotoSans_64 bitmap as a bpp bits per pixel image"""
+    palette = bytearray(2 << bpp)
+    start = time.ticks_us()
+    for _ in range(ROUNDS):
+        done = 0
+        while done < pixels:
+            count = min(len(buffer) // 2, pixels - done)
+            expand(font.BITMAPS, done * bpp, count, bpp, palette, buffer, 0)
+            done += count
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    return pixels * ROUNDS * 1000000 // max(elapsed, 1)
+
+
+def main():
+    print("=== Kernel Benchmark ===")
+    print(f"Driver kernels: {gc9a01.KERNELS}")
+    buffer = bytearray(font.HEIGHT * font.MAX_WIDTH * 2)
+    pixels = len(font.BITMAPS) * 8
+
+    python_rate = bench_bits(gc9a01._py_expand_bits, pixels, buffer)
+    fast_rate = bench_bits(gc9a01._expand_bits, pixels, buffer)
+    print(f"1 bpp text:   python {python_rate} px/s, "
+          f"{gc9a01.KERNELS} {fast_rate} px/s "
+          f"({fast_rate / python_rate:.1f}x)")
+
+    for bpp in (1, 2, 4, 8):
+        count = pixels // bpp
+        python_rate = bench_indexed(gc9a01._py_expand_indexed, bpp, count, buffer)
+        fast_rate = bench_indexed(gc9a01._expand_indexed, bpp, count, buffer)
+        print(f"{bpp} bpp bitmap: python {python_rate} px/s, "
+              f"{gc9a01.KERNELS} {fast_rate} px/s "
+              f"({fast_rate / python_rate:.1f}x)")
+
+    print("=== Benchmark Complete ===")
+
+
+main()
@@ -0,0 +1,361 @@
+"""
+Host-side I2C bus and MB85RC04 FRAM emulator for running fram.py on a
+Linux box.
+
+Provides a stand-in machine module whose I2C class talks to emulated
+devices on a Bus. The MB85RC04 model keeps 512 bytes of memory, takes the
+ninth address bit from bit 0 of the device address like the chip, and
+answers scan() on both of its addresses. The bus counts transactions and
+bytes, adds up the simulated bus time at the I2C clock plus a configurable
+latency per transaction, and can inject faults, so persistence changes can
+be measured and torn writes tested without a Pico.
+
+Example:
+
+    from tools import fram_emulator as emu
+    bus = emu.install()
+
+    import fram
+    fram.init_fram()
+    with bus.measure("read filter percent") as stats:
+        fram.read_filter_percent_fram()
+    print(stats)
+    bus.report()
+"""
+
+import errno
+import sys
+import time
+import types
+
+# Clock cycles of a start or stop condition, and of a byte with its ACK
+_START_STOP_CLOCKS = 1
+_BYTE_CLOCKS = 9
+
+
+def install(bus=None):
+    """
+    Make fram.py importable on CPython by providing a machine module with
+    I2C and Pin, a utime module and the time.ticks_* functions it uses.
+
+    Args:
+        bus (Bus): bus that machine.I2C objects use, defaults to a new Bus
+            with an MB85RC04 at 0x50
+
+    Returns:
+        Bus: the bus machine.I2C objects use
+    """
+    if bus is None:
+        bus = Bus()
+        bus.attach(MB85RC04())
+
+    machine = sys.modules.get("machine")
+    if machine is None:
+        machine = types.ModuleType("machine")
+        sys.modules["machine"] = machine
+    machine.I2C = lambda *args, **kwargs: I2C(bus, *args, **kwargs)
+    if not hasattr(machine, "Pin"):
+        machine.Pin = Pin
+
+    sys.modules.setdefault("utime", time)
+    if not hasattr(time, "ticks_ms"):
+        time.sleep_ms = lambda ms: None
+        time.sleep_us = lambda us: None
+        time.ticks_ms = lambda: int(time.monotonic() * 1000)
+        time.ticks_us = lambda: int(time.monotonic() * 1000000)
+        time.ticks_diff = lambda end, start: end - start
+
+    return bus
+
+
+class Stats():
+    """Counters for the traffic seen by a Bus."""
+
+    FIELDS = ("transactions", "reads", "writes", "bytes", "bus_us", "faults")
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def copy(self):
+        """Return a copy of the counters."""
+        stats = Stats()
+        for field in self.FIELDS:
+            setattr(stats, field, getattr(self, field))
+        return stats
+
+    def __sub__(self, other):
+        stats = Stats()
+        for field in self.FIELDS:
+            setattr(stats, field, getattr(self, field) - getattr(other, field))
+        return stats
+
+    def as_dict(self):
+        """Return the counters as a dict."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return ", ".join(
+            f"{field}={getattr(self, field):.0f}" for field in self.FIELDS)
+
+
+class _Measure():
+    """Context manager returned by Bus.measure."""
+
+    def __init__(self, bus, label):
+        self._bus = bus
+        self._label = label
+        self._start = None
+        self.stats = Stats()
+
+    def __enter__(self):
+        self._start = self._bus.stats.copy()
+        return self.stats
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        delta = self._bus.stats - self._start
+        for field in Stats.FIELDS:
+            setattr(self.stats, field, getattr(delta, field))
+        self._bus.operations.append((self._label, self.stats))
+
+
+class Pin():
+    """Stand-in for machine.Pin, only holds a level."""
+
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, id=None, mode=None, pull=None, value=1):
+        self.id = id
+        self._value = value
+
+    def value(self, value=None):
+        """Return the pin level, or set it when value is given."""
+        if value is None:
+            return self._value
+        self._value = 1 if value else 0
+        return None
+
+    __call__ = value
+
+
+class MB85RC04():
+    """
+    Emulated MB85RC04 4 Kbit FRAM.
+
+    The device address selects the upper 256 byte page with bit 0 and the
+    memory address is one byte. Sequential reads and writes continue
+    across the page boundary and roll over from the last byte to the first.
+
+    Attributes:
+        memory (bytearray): the 512 bytes of the chip
+    """
+
+    SIZE = 512
+
+    def __init__(self, address=0x50):
+        self.address = address & ~1
+        self.memory = bytearray(self.SIZE)
+
+    def addresses(self):
+        """Return the device addresses the chip answers on."""
+        return (self.address, self.address | 1)
+
+    def _start(self, device, mem_addr):
+        return ((device & 1) << 8 | mem_addr) % self.SIZE
+
+    def read(self, device, mem_addr, count):
+        """Return count bytes starting at mem_addr of the page of device."""
+        start = self._start(device, mem_addr)
+        return bytes(
+            self.memory[(start + n) % self.SIZE] for n in range(count))
+
+    def write(self, device, mem_addr, data):
+        """Write data starting at mem_addr of the page of device."""
+        start = self._start(device, mem_addr)
+        for n, value in enumerate(data):
+            self.memory[(start + n) % self.SIZE] = value
+
+
+class Bus():
+    """
+    Emulated I2C bus shared by the I2C objects created after install.
+
+    Attributes:
+        devices (dict): device address to emulated device
+        latency_us (float): added bus time per transaction, for driver and
+            interrupt overhead
+        stats (Stats): counters since creation or the last reset_stats
+        operations (list): (label, Stats) tuples recorded by measure
+        log (list): (kind, device, memory address, length) of every
+            transaction when trace is True
+        trace (bool): record transactions in log
+    """
+
+    def __init__(self, latency_us=0):
+        self.devices = {}
+        self.latency_us = latency_us
+        self.stats = Stats()
+        self.operations = []
+        self.log = []
+        self.trace = False
+        self._failures = []
+        self._torn = None
+
+    def attach(self, device):
+        """Put device on the bus at every address it answers on."""
+        for address in device.addresses():
+            self.devices[address] = device
+        return device
+
+    def detach(self, device):
+        """Take device off the bus, so it stops acknowledging."""
+        for address in device.addresses():
+            self.devices.pop(address, None)
+
+    def reset_stats(self):
+        """Clear the counters, recorded operations and transaction log."""
+        self.stats = Stats()
+        self.operations = []
+        self.log = []
+
+    def measure(self, label):
+        """
+        Return a context manager that yields a Stats object holding the
+        traffic sent inside it, and records it in operations.
+
+        Args:
+            label (str): name of the measured operation
+        """
+        return _Measure(self, label)
+
+    def fail(self, count=1, error=errno.EIO, after=0):
+        """
+        Make transactions fail with OSError(error) like a NACK or a bus
+        error.
+
+        Args:
+            count (int): number of transactions that fail
+            error (int): errno of the OSError
+            after (int): number of transactions that succeed first
+        """
+        self._failures.append([after, count, error])
+
+    def tear(self, length, after=0):
+        """
+        Cut the power during a write: only the first length data bytes of
+        the write after `after` other writes reach the memory, and the write
+        raises OSError(EIO).
+        """
+        self._torn = [after, length]
+
+    def _fault(self):
+        """Return the errno of an injected failure for this transaction."""
+        for failure in self._failures:
+            if failure[0]:
+                failure[0] -= 1
+                continue
+            failure[1] -= 1
+            if not failure[1]:
+                self._failures.remove(failure)
+            return failure[2]
+        return None
+
+    def _device(self, address):
+        error = self._fault()
+        if error is None and address not in self.devices:
+            error = errno.ENODEV
+        if error is not None:
+            self.stats.faults += 1
+            raise OSError(error)
+        return self.devices[address]
+
+    def _count(self, kind, device, mem_addr, wire_bytes, data_bytes, freq):
+        self.stats.transactions += 1
+        self.stats.bytes += data_bytes
+        if kind == "read":
+            self.stats.reads += 1
+            clocks = 3 * _START_STOP_CLOCKS
+        else:
+            self.stats.writes += 1
+            clocks = 2 * _START_STOP_CLOCKS
+        clocks += (wire_bytes + data_bytes) * _BYTE_CLOCKS
+        self.stats.bus_us += clocks * 1000000 / freq + self.latency_us
+        if self.trace:
+            self.log.append((kind, device, mem_addr, data_bytes))
+
+    def read(self, address, mem_addr, count, freq):
+        """Run a memory read: address, memory address, restart, data."""
+        device = self._device(address)
+        self._count("read", address, mem_addr, 3, count, freq)
+        return device.read(address, mem_addr, count)
+
+    def write(self, address, mem_addr, data, freq):
+        """Run a memory write: address, memory address, data."""
+        device = self._device(address)
+        data = bytes(data)
+        self._count("write", address, mem_addr, 2, len(data), freq)
+        if self._torn is not None:
+            if self._torn[0]:
+                self._torn[0] -= 1
+            else:
+                length = self._torn[1]
+                self._torn = None
+                device.write(address, mem_addr, data[:length])
+                self.stats.faults += 1
+                raise OSError(errno.EIO)
+        device.write(address, mem_addr, data)
+
+    def report(self):
+        """Print a table of the operations recorded by measure."""
+        fields = ("transactions", "reads", "writes", "bytes", "bus_us")
+        print(f"{'operation':<36}" + "".join(f"{f:>14}" for f in fields))
+        for label, stats in self.operations:
+            print(f"{label:<36}" + "".join(
+                f"{getattr(stats, f):>14.0f}" for f in fields))
+
+
+class I2C():
+    """
+    Stand-in for machine.I2C on an emulated Bus. Memory addresses are one
+    byte, as sent with the default addrsize=8.
+    """
+
+    def __init__(self, bus, id=0, *, scl=None, sda=None, freq=400000):
+        self.bus = bus
+        self.id = id
+        self.freq = freq
+
+    def scan(self):
+        """Return the addresses of the devices on the bus."""
+        found = []
+        for address in range(0x08, 0x78):
+            if address in self.bus.devices:
+                found.append(address)
+        return found
+
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        """Read nbytes from memory address memaddr of device addr."""
+        self._check(memaddr, addrsize)
+        return self.bus.read(addr, memaddr, nbytes, self.freq)
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        """Read len(buf) bytes from memory address memaddr into buf."""
+        self._check(memaddr, addrsize)
+        buf[:] = self.bus.read(addr, memaddr, len(buf), self.freq)
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        """Write buf to memory address memaddr of device addr."""
+        self._check(memaddr, addrsize)
+        self.bus.write(addr, memaddr, buf, self.freq)
+
+    @staticmethod
+    def _check(memaddr, addrsize):
+        # machine.I2C sends only the low addrsize bits of memaddr, which
+        # the MB85RC04 with its one byte memory address needs to be 8
+        if addrsize != 8:
+            raise ValueError("MB85RC04 takes an 8 bit memory address")
+        if not 0 <= memaddr <= 0xFF:
+            raise ValueError(f"Memory address {memaddr:#x} is not one byte")
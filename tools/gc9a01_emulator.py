@@ -0,0 +1,375 @@
+"""
+Host-side GC9A01 emulator for running gc9a01py on a Linux box.
+
+Provides stand-in SPI and Pin objects that decode the command stream the
+driver sends into an in-memory 240x240 RGB565 framebuffer, and counts
+commands, bytes, CS toggles and window changes so driver changes can be
+measured without a panel.
+
+Example:
+
+    from tools import gc9a01_emulator as emu
+    emu.install()
+
+    import gc9a01py as gc9a01
+    panel = emu.Panel()
+    tft = gc9a01.GC9A01(panel.spi, dc=panel.dc, cs=panel.cs)
+
+    with panel.measure("fill") as stats:
+        tft.fill(gc9a01.RED)
+    print(stats)
+    panel.save_png("screen.png")
+"""
+
+import struct
+import sys
+import time
+import types
+import zlib
+
+GC9A01_CASET = 0x2A
+GC9A01_RASET = 0x2B
+GC9A01_RAMWR = 0x2C
+GC9A01_RAMWRC = 0x3C
+GC9A01_VSCRDEF = 0x33
+GC9A01_MADCTL = 0x36
+GC9A01_VSCSAD = 0x37
+
+# MADCTL bits
+_MY = 0x80
+_MX = 0x40
+_MV = 0x20
+
+# gc9a01py's portrait rotation (0x48) shows the framebuffer unmirrored
+_PORTRAIT = 0x48
+
+_ARGUMENTS = {
+    GC9A01_CASET: 4,
+    GC9A01_RASET: 4,
+    GC9A01_VSCRDEF: 6,
+    GC9A01_MADCTL: 1,
+    GC9A01_VSCSAD: 2,
+}
+
+
+def install():
+    """
+    Make gc9a01py importable on CPython by providing the micropython and
+    ustruct modules and the time.sleep_ms/ticks_* functions it uses.
+    """
+    if "micropython" not in sys.modules:
+        micropython = types.ModuleType("micropython")
+        micropython.const = lambda value: value
+        micropython.native = lambda function: function
+        micropython.viper = lambda function: function
+        sys.modules["micropython"] = micropython
+
+    sys.modules.setdefault("ustruct", struct)
+
+    if not hasattr(time, "sleep_ms"):
+        time.sleep_ms = lambda ms: None
+        time.sleep_us = lambda us: None
+        time.ticks_ms = lambda: int(time.monotonic() * 1000)
+        time.ticks_us = lambda: int(time.monotonic() * 1000000)
+        time.ticks_diff = lambda end, start: end - start
+
+
+class Stats():
+    """Counters for the traffic seen by a Panel."""
+
+    FIELDS = (
+        "commands", "data_bytes", "bytes", "spi_writes", "cs_toggles",
+        "window_changes", "redundant_windows", "pixels")
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def copy(self):
+        """Return a copy of the counters."""
+        stats = Stats()
+        for field in self.FIELDS:
+            setattr(stats, field, getattr(self, field))
+        return stats
+
+    def __sub__(self, other):
+        stats = Stats()
+        for field in self.FIELDS:
+            setattr(stats, field, getattr(self, field) - getattr(other, field))
+        return stats
+
+    def as_dict(self):
+        """Return the counters as a dict."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return ", ".join(
+            f"{field}={getattr(self, field)}" for field in self.FIELDS)
+
+
+class _Measure():
+    """Context manager returned by Panel.measure."""
+
+    def __init__(self, panel, label):
+        self._panel = panel
+        self._label = label
+        self._start = None
+        self.stats = Stats()
+
+    def __enter__(self):
+        self._start = self._panel.stats.copy()
+        return self.stats
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        delta = self._panel.stats - self._start
+        for field in Stats.FIELDS:
+            setattr(self.stats, field, getattr(delta, field))
+        self._panel.operations.append((self._label, self.stats))
+
+
+class Pin():
+    """
+    Stand-in for machine.Pin. Pins created by a Panel report their level
+    changes to it.
+    """
+
+    def __init__(self, panel=None, role=None, value=1):
+        self._panel = panel
+        self._role = role
+        self._value = value
+
+    def value(self, value=None):
+        """Return the pin level, or set it when value is given."""
+        if value is None:
+            return self._value
+
+        value = 1 if value else 0
+        if self._panel is not None and value != self._value:
+            self._panel.pin_changed(self._role, value)
+        self._value = value
+        return None
+
+    __call__ = value
+
+    def on(self):
+        """Set the pin high."""
+        self.value(1)
+
+    def off(self):
+        """Set the pin low."""
+        self.value(0)
+
+
+class SPI():
+    """Stand-in for machine.SPI that feeds every write to its Panel."""
+
+    def __init__(self, panel):
+        self._panel = panel
+
+    def write(self, data):
+        """Send data to the panel."""
+        self._panel.receive(bytes(data))
+
+
+class Panel():
+    """
+    Emulated GC9A01 panel with a width x height RGB565 framebuffer.
+
+    Attributes:
+        spi (SPI): SPI stand-in to pass to GC9A01
+        dc (Pin): data/command pin to pass to GC9A01
+        cs (Pin): chip select pin to pass to GC9A01
+        reset (Pin): reset pin, optional for GC9A01
+        backlight (Pin): backlight pin, optional for GC9A01
+        stats (Stats): counters since creation or the last reset_stats
+        operations (list): (label, Stats) tuples recorded by measure
+        command_counts (dict): number of times each command was received
+    """
+
+    def __init__(self, width=240, height=240):
+        self.width = width
+        self.height = height
+        self.framebuffer = bytearray(width * height * 2)
+        self.spi = SPI(self)
+        self.dc = Pin(self, "dc")
+        self.cs = Pin(self, "cs")
+        self.reset = Pin(self, "reset")
+        self.backlight = Pin(self, "backlight", 0)
+        self.stats = Stats()
+        self.operations = []
+        self.command_counts = {}
+        self.madctl = _PORTRAIT
+        self.scroll = (0, height, 0)
+        self.scroll_start = 0
+        self._columns = (0, width - 1)
+        self._rows = (0, height - 1)
+        self._command = None
+        self._arguments = bytearray()
+        self._column = 0
+        self._row = 0
+        self._partial = None
+
+    def reset_stats(self):
+        """Clear the counters, recorded operations and command counts."""
+        self.stats = Stats()
+        self.operations = []
+        self.command_counts = {}
+
+    def measure(self, label):
+        """
+        Return a context manager that yields a Stats object holding the
+        traffic sent inside it, and records it in operations.
+
+        Args:
+            label (str): name of the measured operation
+        """
+        return _Measure(self, label)
+
+    def pin_changed(self, role, value):
+        """Handle a level change on one of the panel's pins."""
+        if role == "cs" and value == 0:
+            self.stats.cs_toggles += 1
+        elif role == "reset" and value == 0:
+            self.madctl = _PORTRAIT
+
+    def receive(self, data):
+        """Handle bytes written to the SPI bus."""
+        if self.cs.value():
+            return
+
+        self.stats.spi_writes += 1
+        self.stats.bytes += len(data)
+        if not self.dc.value():
+            for command in data:
+                self._start_command(command)
+            return
+
+        self.stats.data_bytes += len(data)
+        if self._command in (GC9A01_RAMWR, GC9A01_RAMWRC):
+            self._write_pixels(data)
+        elif self._command in _ARGUMENTS:
+            self._arguments.extend(data)
+            if len(self._arguments) >= _ARGUMENTS[self._command]:
+                self._apply_arguments()
+
+    def _start_command(self, command):
+        self.stats.commands += 1
+        self.command_counts[command] = self.command_counts.get(command, 0) + 1
+        self._command = command
+        self._arguments = bytearray()
+        if command == GC9A01_RAMWR:
+            self._column = self._columns[0]
+            self._row = self._rows[0]
+            self._partial = None
+
+    def _apply_arguments(self):
+        command = self._command
+        args = self._arguments
+        if command in (GC9A01_CASET, GC9A01_RASET):
+            window = struct.unpack(">HH", args[:4])
+            current = self._columns if command == GC9A01_CASET else self._rows
+            if window == current:
+                self.stats.redundant_windows += 1
+            else:
+                self.stats.window_changes += 1
+            if command == GC9A01_CASET:
+                self._columns = window
+            else:
+                self._rows = window
+        elif command == GC9A01_MADCTL:
+            self.madctl = args[0]
+        elif command == GC9A01_VSCRDEF:
+            self.scroll = struct.unpack(">HHH", args[:6])
+        elif command == GC9A01_VSCSAD:
+            self.scroll_start = struct.unpack(">H", args[:2])[0]
+        self._command = None
+
+    def _write_pixels(self, data):
+        if self._partial is not None:
+            data = bytes([self._partial]) + data
+            self._partial = None
+        if len(data) & 1:
+            self._partial = data[-1]
+            data = data[:-1]
+
+        first_column, last_column = self._columns
+        last_row = self._rows[1]
+        framebuffer = self.framebuffer
+        for i in range(0, len(data), 2):
+            if self._row > last_row:
+                break
+            index = self._address(self._column, self._row)
+            if index is not None:
+                framebuffer[index] = data[i]
+                framebuffer[index + 1] = data[i + 1]
+            self.stats.pixels += 1
+            self._column += 1
+            if self._column > last_column:
+                self._column = first_column
+                self._row += 1
+
+    def _address(self, column, row):
+        """Map a column/row address to a framebuffer index using MADCTL."""
+        madctl = self.madctl ^ (_PORTRAIT & _MX)
+        if madctl & _MV:
+            column, row = row, column
+        if madctl & _MX:
+            column = self.width - 1 - column
+        if madctl & _MY:
+            row = self.height - 1 - row
+        if 0 <= column < self.width and 0 <= row < self.height:
+            return (row * self.width + column) * 2
+        return None
+
+    def pixel(self, x, y):
+        """Return the RGB565 color stored at x, y of the framebuffer."""
+        index = (y * self.width + x) * 2
+        return self.framebuffer[index] << 8 | self.framebuffer[index + 1]
+
+    def _display_row(self, row):
+        """Return the framebuffer row shown on a display row."""
+        top, area, _ = self.scroll
+        if top <= row < top + area and area:
+            return top + (self.scroll_start - top + row - top) % area
+        return row
+
+    def save_png(self, path):
+        """
+        Save what the panel shows, including vertical scrolling, as an RGB
+        PNG file.
+
+        Args:
+            path (str): name of the file to write
+        """
+        raw = bytearray()
+        for row in range(self.height):
+            raw.append(0)
+            start = self._display_row(row) * self.width * 2
+            for i in range(start, start + self.width * 2, 2):
+                color = self.framebuffer[i] << 8 | self.framebuffer[i + 1]
+                red = (color >> 11) & 0x1f
+                green = (color >> 5) & 0x3f
+                blue = color & 0x1f
+                raw.append(red << 3 | red >> 2)
+                raw.append(green << 2 | green >> 4)
+                raw.append(blue << 3 | blue >> 2)
+
+        def chunk(kind, data):
+            return (struct.pack(">I", len(data)) + kind + data
+                    + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", struct.pack(
+                ">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)))
+            f.write(chunk(b"IDAT", zlib.compress(bytes(raw), 9)))
+            f.write(chunk(b"IEND", b""))
+
+    def report(self):
+        """Print a table of the operations recorded by measure."""
+        fields = ("commands", "bytes", "cs_toggles", "window_changes",
+                  "redundant_windows")
+        print(f"{'operation':<28}" + "".join(f"{f:>18}" for f in fields))
+        for label, stats in self.operations:
+            print(f"{label:<28}" + "".join(
+                f"{getattr(stats, f):>18}" for f in fields))